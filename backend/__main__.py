@@ -1,9 +1,13 @@
 import uvicorn
 
+from backend.metrics import enable_multiprocess
 from backend.settings import settings
 
 
 def main() -> None:
+    if settings.workers_count > 1:
+        # /metrics가 요청을 받은 워커가 아니라 모든 워커의 합계를 응답
+        enable_multiprocess(settings.metrics_dir)
     uvicorn.run(
         "backend.web.application:get_app",
         workers=settings.workers_count,
@@ -11,6 +15,8 @@ def main() -> None:
         port=settings.port,
         reload=settings.reload,
         log_level=settings.log_level.value.lower(),
+        # 접근 로그는 AccessLogMiddleware에서 기록
+        access_log=False,
         reload_dirs=["backend"],
         factory=True,
     )
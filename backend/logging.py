@@ -1,10 +1,34 @@
 import logging
+import queue
 import sys
-from typing import Any, Union
+import threading
+from typing import Any, Callable, Dict, TextIO, Union
 
+import ujson
 from loguru import logger
 
-from backend.settings import settings
+from backend.settings import LogFormat, settings
+
+# InterceptHandler가 전달 중인 표준 logging 레코드 (스레드별, ``_patch_caller``에서 사용)
+_intercepted = threading.local()
+
+
+def _patch_caller(entry: Any) -> None:
+    """loguru 레코드의 호출 위치를 전달 중인 LogRecord 값으로 교체.
+
+    :param entry: loguru 레코드
+    """
+    record = getattr(_intercepted, "record", None)
+    if record is not None:
+        entry.update(
+            name=record.name,
+            function=record.funcName,
+            line=record.lineno,
+        )
+
+
+# 레코드마다 patch 하지 않도록 patcher를 한 번만 연결
+_intercept_logger = logger.patch(_patch_caller)
 
 
 class InterceptHandler(logging.Handler):
@@ -22,6 +46,9 @@ class InterceptHandler(logging.Handler):
         """
         Propagates logs to loguru.
 
+        호출 위치(name/function/line)는 스택 프레임을 거슬러 찾는 대신
+        LogRecord에 이미 기록된 값을 사용한다.
+
         :param record: record to log.
         """
         try:
@@ -29,47 +56,131 @@ class InterceptHandler(logging.Handler):
         except ValueError:
             level = record.levelno
 
-        # Find caller from where originated the logged message
-        frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:  # type: ignore
-            frame = frame.f_back  # type: ignore
-            depth += 1
+        _intercepted.record = record
+        try:
+            _intercept_logger.opt(exception=record.exc_info).log(
+                level,
+                record.getMessage(),
+            )
+        finally:
+            _intercepted.record = None
 
-        logger.opt(depth=depth, exception=record.exc_info).log(
-            level,
-            record.getMessage(),
-        )
 
+def render_json(message: Any) -> str:
+    """로그 레코드를 한 줄 JSON으로 변환.
 
-def exclude_health_logs(
-    record: Any,
-) -> bool:
-    """exclude health logs from logs output.
+    bind/키워드 인자로 전달한 값은 최상위 필드가 된다.
+    예외 traceback은 로그 호출 시점에 포맷된 메시지(``format=""``)에서 가져온다.
 
-    :param record: log record.
-    :return: True if record should be logged, False otherwise.
+    :param message: loguru 메시지 (``message.record``에 레코드 포함)
+    :return: 개행으로 끝나는 JSON 문자열
     """
-    return "GET /api/health" not in record["message"]
+    record = message.record
+    payload: Dict[str, Any] = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "message": record["message"],
+        **record["extra"],
+    }
+    if record["exception"] is not None:
+        payload["exception"] = str(message).strip()
+    return ujson.dumps(payload, ensure_ascii=False) + "\n"
+
+
+class QueueSink:
+    """출력(및 JSON 변환)을 백그라운드 스레드에서 처리하는 loguru 싱크.
+
+    이벤트 루프에서는 메시지를 큐에 넣기만 한다. loguru의 ``enqueue=True``와 달리
+    프로세스 간 큐(pickle)를 거치지 않으며, 쌓인 메시지는 한 번에 쓰고 flush한다.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        render: Callable[[Any], str] = str,
+    ) -> None:
+        """
+        :param stream: 출력 스트림
+        :param render: 메시지 → 출력 문자열 변환 함수
+        """
+        self.stream = stream
+        self.render = render
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="log-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def write(self, message: Any) -> None:
+        """메시지를 큐에 추가 (loguru 스트림 싱크 인터페이스).
+
+        :param message: loguru 메시지
+        """
+        self._queue.put(message)
+
+    def stop(self) -> None:
+        """남은 메시지를 모두 출력하고 스레드 종료 (``logger.remove`` 시 호출)."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            stop = batch[-1] is None
+            self.stream.write(
+                "".join(self.render(m) for m in batch if m is not None),
+            )
+            self.stream.flush()
+            if stop:
+                return
+
+
+def json_sink(message: Any) -> None:
+    """로그 레코드를 한 줄 JSON으로 stdout에 출력.
+
+    :param message: loguru 메시지
+    """
+    sys.stdout.write(render_json(message))
+    sys.stdout.flush()
 
 
 def configure_logging() -> None:  # pragma: no cover
     """Configures logging."""
     intercept_handler = InterceptHandler()
 
-    logging.basicConfig(handlers=[intercept_handler], level=logging.NOTSET)
+    # 로그 레벨 미만의 표준 logging 레코드는 LogRecord 생성 전에 버린다
+    logging.basicConfig(handlers=[intercept_handler], level=settings.log_level.value)
 
     for logger_name in logging.root.manager.loggerDict:
         if logger_name.startswith("uvicorn."):
             logging.getLogger(logger_name).handlers = []
 
     # change handler for default uvicorn logger
+    # (접근 로그는 AccessLogMiddleware에서 라우트 기준으로 기록)
     logging.getLogger("uvicorn").handlers = [intercept_handler]
     logging.getLogger("uvicorn.access").handlers = [intercept_handler]
 
     # set logs output, level and format
     logger.remove()
-    logger.add(
-        sys.stdout,
-        level=settings.log_level.value,
-        filter=exclude_health_logs,  # 필터 추가
-    )
+    json_format = settings.log_format == LogFormat.JSON
+    sink: Any = sys.stdout
+    if settings.log_enqueue:
+        sink = QueueSink(sys.stdout, render_json if json_format else str)
+    elif json_format:
+        sink = json_sink
+
+    if json_format:
+        logger.add(
+            sink,
+            level=settings.log_level.value,
+            format="",
+            backtrace=False,
+            diagnose=False,
+        )
+    else:
+        logger.add(sink, level=settings.log_level.value)
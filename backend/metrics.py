@@ -0,0 +1,58 @@
+import os
+import shutil
+from pathlib import Path
+
+from prometheus_client import REGISTRY, CollectorRegistry, generate_latest
+from prometheus_client.multiprocess import MultiProcessCollector
+
+# 기본 히스토그램 버킷 (초, 전체 조회/Credential Report 생성까지 포함하도록 2분까지)
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+# ``generate_latest``가 출력하는 Prometheus text exposition 형식
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# prometheus_client multiprocess 모드 디렉토리 (prometheus_client import 전에 설정)
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def enable_multiprocess(directory: Path) -> None:
+    """워커 프로세스의 메트릭을 합산하도록 multiprocess 모드 설정.
+
+    워커를 띄우기 전에 부모 프로세스에서 호출한다. 이전 실행이 남긴 파일을 지우고
+    환경 변수로 디렉토리를 넘기면, 워커마다 값을 이 디렉토리의 파일에 기록하고
+    ``render``가 모든 워커의 파일을 합산한다.
+
+    :param directory: 워커별 메트릭 파일 디렉토리
+    """
+    shutil.rmtree(directory, ignore_errors=True)
+    directory.mkdir(parents=True)
+    os.environ[MULTIPROC_DIR_ENV] = str(directory)
+
+
+def render() -> bytes:
+    """등록된 모든 메트릭을 Prometheus text 형식으로 출력.
+
+    multiprocess 모드에서는 이 워커가 아니라 모든 워커의 합계를 출력한다.
+
+    :return: text exposition
+    """
+    if MULTIPROC_DIR_ENV not in os.environ:
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry)
+    return generate_latest(registry)
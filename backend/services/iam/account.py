@@ -0,0 +1,1170 @@
+import asyncio
+import sys
+import time
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+import ujson
+from botocore import xform_name
+from botocore.exceptions import ClientError
+from loguru import logger
+
+from backend.services.iam.deadline import Deadline
+from backend.services.iam.inventory import (
+    InventorySnapshot,
+    InventorySweep,
+    KeyRecord,
+    OldAccessKeyResult,
+    OldKey,
+    ResultVersion,
+)
+from backend.services.iam.key_cache import KeyIdCache
+from backend.services.iam.metrics import (
+    AWS_CALL_SECONDS,
+    CONNECTION_ERRORS,
+    LIMITER_WAIT_SECONDS,
+    REPORT_PARSE_SECONDS,
+    RETRIES,
+    SDK_RETRIES,
+    SWEEPS_CANCELLED,
+    THROTTLES,
+)
+from backend.services.iam.pipeline import bounded_map, from_iterable
+from backend.services.iam.progress import ScanProgress, record_call
+from backend.services.iam.rate_limiter import (
+    THROTTLING_ERROR_CODES,
+    TokenBucket,
+    is_throttling_error,
+    max_concurrency,
+    worker_share,
+)
+from backend.services.iam.report_parser import ReportKeys, parse_credential_report
+from backend.services.iam.sdk import LazySession, client_config
+from backend.services.iam.single_flight import SingleFlight
+from backend.services.iam.snapshot_store import (
+    RefreshLock,
+    SharedSnapshot,
+    SnapshotStore,
+)
+from backend.settings import settings
+
+if TYPE_CHECKING:
+    # botocore.client는 import 비용이 커서 타입 검사에만 사용 (SDK는 LazySession이 로드)
+    from botocore.client import BaseClient
+
+S = TypeVar("S", bound=SharedSnapshot)
+
+# 공유 저장소의 스냅샷 종류
+INVENTORY = "inventory"
+CREDENTIAL_REPORT = "credential_report"
+GENERATE_CREDENTIAL_REPORT = "generate_credential_report"
+KEY_IDS = "key_ids"
+
+
+@dataclass(frozen=True)
+class CredentialReport:
+    """파싱된 Credential Report 캐시 항목."""
+
+    # AWS가 보고서를 생성한 시각 (GeneratedTime)
+    generated_at: datetime
+    # 활성화된 키의 (유저 이름, last_rotated epoch 초) 병렬 배열 (루트 계정 제외)
+    keys: ReportKeys
+    # AWS에서 보고서를 받아온 시각 (epoch 초, 캐시 경과 시간 및 공유 저장소 기준 시각)
+    fetched_at: float = field(default_factory=time.time)
+
+    def expired(self, ttl: float) -> bool:
+        """AWS에서 받아온 시각 기준으로 TTL이 지났는지 확인.
+
+        GeneratedTime 기준으로 판단하면 보고서가 TTL보다 오래된 경우
+        (AWS는 4시간 이내 보고서를 재사용) 요청마다 같은 보고서를 다시 받게 된다.
+
+        :param ttl: 유효 시간 (초)
+        :return: 만료 여부
+        """
+        return time.time() - self.fetched_at >= ttl
+
+    def dumps(self) -> bytes:
+        """공유 저장소용 직렬화 (GeneratedTime + [유저 이름, last_rotated epoch] 배열).
+
+        :return: 직렬화된 보고서
+        """
+        return ujson.dumps(
+            {
+                "generated_at": self.generated_at.timestamp(),
+                "keys": [[u, t] for u, t in self.keys],
+            }
+        ).encode()
+
+    @classmethod
+    def loads(cls, fetched_at: float, payload: bytes) -> "CredentialReport":
+        """공유 저장소의 보고서 복원.
+
+        :param fetched_at: 보고서를 받아온 시각 (epoch 초)
+        :param payload: ``dumps``로 직렬화된 보고서
+        :return: 파싱된 Credential Report
+        """
+        data = ujson.loads(payload)
+        if isinstance(data, dict):
+            generated_at, rows = data["generated_at"], data["keys"]
+        else:
+            # 이전 버전 형식: 키 목록만 저장하고 기준 시각이 GeneratedTime
+            generated_at, rows = fetched_at, data
+        keys = ReportKeys()
+        for u, t in rows:
+            # 이전 버전은 last_rotated를 float로 저장
+            keys.append(sys.intern(u), int(t))
+        return cls(
+            generated_at=datetime.fromtimestamp(generated_at, timezone.utc),
+            keys=keys,
+            fetched_at=fetched_at,
+        )
+
+
+# ---------------------------------------------------------------------------
+# IAMAccount
+# ---------------------------------------------------------------------------
+
+
+class IAMAccount:
+    """단일 AWS 계정에 대한 재사용 가능한, 비동기 친화적인 IAM 액세스 키 조회 도우미.
+
+    - 계정별 싱글톤 aioboto3 클라이언트 (비동기 락)
+    - 계정의 모든 IAM 호출이 공유하는 AIMD 토큰 버킷 + 세마포어로 처리율/동시성 제한
+      (AWS IAM API rate limit은 계정 단위로 적용)
+    - 계정별 Credential Report 캐시 및 액세스 키 인벤토리
+    """
+
+    # ---------------------------- life‑cycle ----------------------------
+    def __init__(
+        self,
+        session: LazySession,
+        *,
+        account_id: Optional[str] = None,
+        store: Optional[SnapshotStore] = None,
+    ) -> None:
+        """싱글톤 클라이언트, 락/세마포어/토큰 버킷 초기화.
+
+        :param session: 계정 자격 증명을 가진 aioboto3 세션 (처음 사용할 때 생성)
+        :param account_id: AWS 계정 ID (응답의 account_id로 표시)
+        :param store: 워커 간 공유 스냅샷 저장소 (None이면 워커별로 조회)
+        """
+
+        self.account_id = account_id
+        self._store = store
+        self._session = session
+        self._client: Optional["BaseClient"] = None
+        self._lock = asyncio.Lock()  # double‑check locking
+        # 계정 단위 예산을 워커 수로 나눠 워커 전체 합이 예산을 넘지 않도록 함
+        self._sem = asyncio.Semaphore(max_concurrency())
+        self._limiter = TokenBucket(
+            worker_share(settings.iam_rate_limit),
+            max(int(worker_share(settings.iam_rate_burst)), 1),
+            min_rate=worker_share(settings.iam_rate_min),
+            increase=worker_share(settings.iam_rate_increase),
+            decrease=settings.iam_rate_decrease,
+        )
+        # Credential Report 캐시 및 동시 생성/다운로드 합치기 (single-flight)
+        self._report: Optional[CredentialReport] = None
+        # warm start로 복원한 보고서 여부 (만료되어도 응답하고 백그라운드에서 갱신)
+        self._report_restored = False
+        self._flight: SingleFlight[Any] = SingleFlight()
+        # Credential Report 후보의 (유저, 생성일) → 액세스 키 ID 캐시
+        self._key_ids = KeyIdCache()
+        # 생성일 순 액세스 키 인벤토리 및 진행 중인 전체 조회
+        self._inventory: Optional[InventorySnapshot] = None
+        self._sweep: Optional[InventorySweep] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def close(self) -> None:
+        """백그라운드 작업 취소 및 싱글톤 클라이언트 종료 (자원 해제).
+
+        서비스 종료 시 반드시 호출 필요
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        if self._client is not None:
+            await self._client.__aexit__(None, None, None)
+            self._client = None
+
+    async def restore(self) -> None:
+        """공유 저장소에 남아 있는 마지막 스냅샷으로 캐시 복원 (warm start).
+
+        복원한 인벤토리/Credential Report는 TTL과 관계없이 바로 응답에 사용하고
+        (응답의 snapshot_age로 경과 시간 표시), 만료된 경우 백그라운드에서 갱신한다.
+        """
+        store = self._store
+        if store is None:
+            return
+
+        inventory = await asyncio.to_thread(store.load, INVENTORY, self._store_key)
+        if inventory is not None and self._inventory is None:
+            self._inventory = await asyncio.to_thread(
+                InventorySnapshot.loads, *inventory
+            )
+
+        report = await asyncio.to_thread(store.load, CREDENTIAL_REPORT, self._store_key)
+        if report is not None and self._report is None:
+            self._report = await asyncio.to_thread(CredentialReport.loads, *report)
+            self._report_restored = True
+
+        await self._load_key_ids()
+
+    async def warm_up_pool(self, connections: int) -> None:
+        """클라이언트를 만들고 연결 ``connections``개를 미리 열어 둠.
+
+        가벼운 ``GetAccountSummary``를 동시에 호출하여 자격 증명(AssumeRole)과
+        TCP/TLS 연결을 준비한다. 권한이 없어 AccessDenied가 돌아와도 연결은 풀에 남는다.
+
+        :param connections: 미리 열 연결 수 (동시 호출 수 이내)
+        """
+        client = await self._client_async()
+
+        async def touch() -> None:
+            with suppress(ClientError):
+                await self._call(client, "get_account_summary")
+
+        await asyncio.gather(*(touch() for _ in range(connections)))
+
+    # --------------------------- low‑level I/O ---------------------------
+    async def _client_async(self) -> "BaseClient":
+        """
+        싱글톤 IAM 클라이언트 반환 (비동기 락으로 중복 생성 방지)
+        """
+        # 이미 생성된 경우 반환
+        if self._client is None:
+            async with self._lock:
+                if self._client is None:  # double check
+                    client = await self._session.client(
+                        "iam",
+                        config=client_config(),
+                    ).__aenter__()
+                    # botocore 내부 재시도에 가려지는 Throttling도 감속에 반영
+                    client.meta.events.register_first(
+                        "needs-retry.iam",
+                        self._observe_retry,
+                    )
+                    self._client = client
+
+        # 클라이언트가 여전히 None인 경우 예외 발생
+        assert self._client is not None
+
+        # 클라이언트 반환
+        return self._client
+
+    def _observe_retry(self, response: Any = None, **kwargs: Any) -> None:
+        """botocore ``needs-retry`` 이벤트 핸들러.
+
+        모든 시도에 대해 호출되므로, Throttling 응답을 감속에 반영하고
+        Throttling / 연결 오류를 메트릭으로 기록한다. (재시도 여부 판단에는 관여하지 않음)
+
+        :param response: (http 응답, 파싱된 응답) 튜플
+        :param kwargs: 이벤트 인자 (operation: OperationModel,
+            caught_exception: 연결 오류/제한 시간 초과 시 예외)
+        """
+        self._limiter.observe_retry(response, **kwargs)
+        operation = kwargs.get("operation")
+        name = xform_name(operation.name) if operation is not None else "unknown"
+        if not response:
+            error = kwargs.get("caught_exception")
+            if error is not None:
+                CONNECTION_ERRORS.labels(
+                    operation=name,
+                    error=type(error).__name__,
+                ).inc()
+            return
+        if response[1].get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+            THROTTLES.labels(operation=name).inc()
+
+    async def _call(
+        self,
+        client: "BaseClient",
+        operation: str,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """토큰 버킷/세마포어를 거쳐 IAM API 호출.
+
+        - Throttling 응답 시 처리율을 감속(AIMD)한 뒤 재시도
+        - 그 외 오류 또는 재시도 횟수 초과 시 예외 전파
+
+        :param client: IAM 클라이언트
+        :param operation: 호출할 API 이름 (예: list_access_keys)
+        :param kwargs: API 인자
+        :return: API 응답
+        """
+        attempt = 0
+        while True:
+            wait_start = time.perf_counter()
+            async with self._sem:
+                await self._limiter.acquire()
+                LIMITER_WAIT_SECONDS.labels(operation=operation).observe(
+                    time.perf_counter() - wait_start,
+                )
+                # 작업 진행 상황 표시용 (Throttling 재시도 포함)
+                record_call()
+                try:
+                    with AWS_CALL_SECONDS.labels(operation=operation).time():
+                        resp = await getattr(client, operation)(**kwargs)
+                except ClientError as e:
+                    self._record_sdk_retries(operation, e.response)
+                    if not is_throttling_error(e):
+                        raise
+                    if attempt >= settings.iam_throttle_retries:
+                        raise
+                    self._limiter.on_throttle()
+                    RETRIES.labels(operation=operation).inc()
+                    attempt += 1
+                    continue
+
+            self._record_sdk_retries(operation, resp)
+            self._limiter.on_success()
+            return resp
+
+    @staticmethod
+    def _record_sdk_retries(operation: str, response: Dict[str, Any]) -> None:
+        """응답 메타데이터의 botocore 내부 재시도 횟수를 메트릭으로 기록.
+
+        :param operation: API 이름
+        :param response: API 응답 또는 ``ClientError.response``
+        """
+        attempts = response.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+        if attempts:
+            SDK_RETRIES.labels(operation=operation).inc(attempts)
+
+    async def _generate_credential_report(self, client: "BaseClient") -> None:
+        """IAM Credential Report 생성 (비동기 폴링).
+
+        동시 호출자는 하나의 폴링 루프를 공유한다 (single-flight).
+
+        :param client: IAM 클라이언트
+        :return: None
+        """
+        await self._flight.do(
+            GENERATE_CREDENTIAL_REPORT,
+            lambda: self._poll_credential_report(client),
+        )
+
+    async def _poll_credential_report(self, client: "BaseClient") -> None:
+        """Credential Report 생성 완료까지 지수 백오프로 폴링.
+
+        - 첫 호출이 COMPLETE이면 (4시간 이내 보고서 존재) 대기 없이 반환
+        - 생성 중(STARTED/INPROGRESS)이면 대기 간격을 두 배씩 늘리며 재확인
+        - ``CREDENTIAL_REPORT_TIMEOUT`` 안에 완료되지 않으면 예외 발생
+
+        :param client: IAM 클라이언트
+        :return: None
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.credential_report_timeout
+        delay = settings.credential_report_poll_initial
+
+        # 자격 증명 보고서 생성
+        resp = await self._call(client, "generate_credential_report")
+        state = resp["State"]
+
+        # 생성 완료 또는 제한 시간 도달 시 종료
+        while state != "COMPLETE":
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise RuntimeError(f"Credential report generation timed out: {state}")
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, settings.credential_report_poll_max)
+            resp = await self._call(client, "generate_credential_report")
+            state = resp["State"]
+
+    async def _fetch_keys_for_user(
+        self,
+        client: "BaseClient",
+        user: str,
+    ) -> List[Dict[str, Any]]:
+        """ListAccessKeys API를 rate-limit 하여 호출 (토큰 버킷 사용).
+
+        :param client: IAM 클라이언트
+        :param user: 유저 이름
+        :return: 액세스 키 목록
+        """
+        resp = await self._call(client, "list_access_keys", UserName=user)
+        return resp["AccessKeyMetadata"]
+
+    async def _iter_user_pages(self, client: "BaseClient") -> AsyncIterator[List[str]]:
+        """ListUsers API를 Marker 기반으로 페이지 단위 호출 (페이지마다 rate-limit).
+
+        :param client: IAM 클라이언트
+        :return: 페이지별 유저 이름 목록 (async iterator)
+        """
+        kwargs: Dict[str, Any] = {}
+        while True:
+            page = await self._call(client, "list_users", **kwargs)
+            yield [u["UserName"] for u in page["Users"]]
+            if not page.get("IsTruncated"):
+                return
+            kwargs = {"Marker": page["Marker"]}
+
+    async def _iter_access_keys(
+        self,
+        client: "BaseClient",
+        *,
+        listed: Optional[Callable[[int], None]] = None,
+    ) -> AsyncIterator[Tuple[str, List[Dict[str, Any]]]]:
+        """ListUsers 페이지 조회와 ListAccessKeys 호출을 파이프라인으로 처리.
+
+        - producer: ListUsers 페이지를 읽어 bounded 큐에 유저를 적재
+        - worker (고정 개수): 다음 페이지를 읽는 동안 ListAccessKeys 호출
+        - collector (호출자): 유저별 결과를 처리 완료 순서대로 수신
+
+        유저 수와 무관하게 태스크 수/메모리가 일정하게 유지된다.
+        호출자가 순회를 중단하면 남은 태스크는 모두 취소된다.
+
+        :param client: IAM 클라이언트
+        :param listed: ListUsers 조회가 끝나면 전체 유저 수로 호출할 함수
+        :return: (유저 이름, 액세스 키 목록) async iterator
+        """
+
+        async def iter_users() -> AsyncIterator[str]:
+            """ListUsers 페이지를 유저 단위로 펼침."""
+            count = 0
+            async for page in self._iter_user_pages(client):
+                count += len(page)
+                for user in page:
+                    yield user
+            if listed is not None:
+                listed(count)
+
+        async def fetch(user: str) -> Tuple[str, List[Dict[str, Any]]]:
+            """유저의 액세스 키 목록 조회."""
+            return user, await self._fetch_keys_for_user(client, user)
+
+        async for item in bounded_map(
+            iter_users(),
+            fetch,
+            workers=settings.iam_sweep_workers,
+            queue_size=settings.iam_sweep_queue_size,
+        ):
+            yield item
+
+    async def _get_credential_report(
+        self,
+        client: "BaseClient",
+        *,
+        refresh: bool = False,
+        max_age: Optional[float] = None,
+    ) -> CredentialReport:
+        """캐시된 Credential Report 반환 (AWS에서 받아온 시각 기준 TTL 만료 시 갱신).
+
+        AWS는 4시간 이내에 생성한 보고서를 재사용하므로 데이터 경과 시간은
+        TTL이나 ``refresh``와 관계없이 최대 4시간(+ TTL)까지 늘어날 수 있다.
+
+        동시 호출자는 하나의 생성/다운로드를 공유한다 (single-flight).
+
+        :param client: IAM 클라이언트
+        :param refresh: 캐시를 무시하고 AWS에서 다시 받아올지 여부 (새 보고서 생성은 강제하지 못함)
+        :param max_age: 보고서를 받아온 뒤 허용할 최대 경과 시간 (초, 초과 시 갱신 후 반환)
+        :return: 파싱된 Credential Report
+        """
+        ttl: float = settings.credential_report_ttl
+        if refresh:
+            ttl = 0
+        elif max_age is not None:
+            ttl = min(ttl, max_age)
+
+        report = self._report
+        if not refresh and report is not None:
+            if not report.expired(ttl):
+                return report
+            if self._report_restored and max_age is None:
+                # warm start로 복원한 보고서는 그대로 반환하고 백그라운드에서 갱신
+                if not self._flight.running(CREDENTIAL_REPORT):
+                    self._spawn(self._revalidate_credential_report(client))
+                return report
+
+        return await self._flight.do(
+            CREDENTIAL_REPORT,
+            lambda: self._refresh_credential_report(client, max_age=ttl),
+        )
+
+    async def _refresh_credential_report(
+        self,
+        client: "BaseClient",
+        *,
+        max_age: float,
+    ) -> CredentialReport:
+        """공유 저장소를 거쳐 Credential Report 갱신 후 캐시에 저장.
+
+        :param client: IAM 클라이언트
+        :param max_age: 저장된 보고서를 그대로 사용할 최대 경과 시간 (초)
+        :return: 파싱된 Credential Report
+        """
+        report = await self._refresh_shared(
+            CREDENTIAL_REPORT,
+            lambda: self._fetch_credential_report(client),
+            CredentialReport.loads,
+            current=self._report,
+            max_age=max_age,
+        )
+        self._report = report
+        self._report_restored = False
+        # 교체되어 보고서에서 사라진 키의 ID 캐시 항목 제거
+        self._key_ids.retain(report.keys)
+        return report
+
+    async def _revalidate_credential_report(
+        self,
+        client: "BaseClient",
+        *,
+        max_age: Optional[float] = None,
+    ) -> None:
+        """Credential Report 백그라운드 갱신 (실패 시 기존 보고서 유지).
+
+        :param client: IAM 클라이언트
+        :param max_age: 저장된 보고서를 그대로 사용할 최대 경과 시간 (초, 기본 TTL)
+        """
+        if max_age is None:
+            max_age = settings.credential_report_ttl
+        try:
+            await self._flight.do(
+                CREDENTIAL_REPORT,
+                lambda: self._refresh_credential_report(client, max_age=max_age),
+            )
+        except Exception as e:
+            logger.opt(exception=e).warning("IAM credential report refresh failed")
+
+    async def _fetch_credential_report(self, client: "BaseClient") -> CredentialReport:
+        """Credential Report를 AWS에서 생성/다운로드/파싱.
+
+        :param client: IAM 클라이언트
+        :return: 파싱된 Credential Report
+        """
+        # 자격 증명 보고서 생성
+        await self._generate_credential_report(client)
+
+        # 자격 증명 보고서 조회
+        resp = await self._call(client, "get_credential_report")
+
+        # AWS가 같은 보고서를 돌려준 경우 (4시간 이내 재사용) 파싱 생략
+        current = self._report
+        if current is not None and current.generated_at == resp["GeneratedTime"]:
+            return replace(current, fetched_at=time.time())
+
+        def parse(content: bytes) -> ReportKeys:
+            with REPORT_PARSE_SECONDS.time():
+                return parse_credential_report(content)
+
+        # 대용량 CSV 파싱은 이벤트 루프를 막지 않도록 스레드에서 수행
+        keys = await asyncio.to_thread(parse, resp["Content"])
+        return CredentialReport(generated_at=resp["GeneratedTime"], keys=keys)
+
+    # --------------------------- shared store ---------------------------
+    @property
+    def _store_key(self) -> str:
+        """공유 저장소의 계정 키."""
+        return self.account_id or "default"
+
+    async def _refresh_shared(
+        self,
+        kind: str,
+        fetch: Callable[[], Awaitable[S]],
+        loads: Callable[[float, bytes], S],
+        *,
+        current: Optional[S],
+        max_age: float,
+    ) -> S:
+        """워커 간 공유 저장소를 거쳐 스냅샷 갱신.
+
+        - 다른 워커가 저장한 충분히 새로운 스냅샷이 있으면 그대로 사용
+        - 갱신 락을 얻은 워커 하나만 AWS에서 조회하여 저장
+        - 나머지 워커는 새 스냅샷이 저장될 때까지 저장소를 폴링
+          (갱신하던 워커가 죽어 락이 풀리면 대신 갱신)
+
+        :param kind: 스냅샷 종류
+        :param fetch: AWS 조회 함수
+        :param loads: 저장된 스냅샷 복원 함수
+        :param current: 현재 워커가 가진 스냅샷
+        :param max_age: 저장된 스냅샷을 그대로 사용할 최대 경과 시간 (초)
+        :return: 갱신된 스냅샷
+        """
+        store = self._store
+        if store is None:
+            return await fetch()
+
+        account = self._store_key
+        known = current.fetched_at if current is not None else None
+
+        async def load_newer() -> Optional[Tuple[float, bytes]]:
+            return await asyncio.to_thread(store.load, kind, account, newer_than=known)
+
+        def fresh(stored: Optional[Tuple[float, bytes]]) -> bool:
+            return stored is not None and time.time() - stored[0] < max_age
+
+        stored = await load_newer()
+        while not fresh(stored):
+            lock = await asyncio.to_thread(store.try_lock, kind, account)
+            if lock is None:
+                # 다른 워커가 갱신 중 → 새 스냅샷이 저장될 때까지 대기
+                await asyncio.sleep(settings.snapshot_poll_interval)
+                if stored is not None:
+                    known = stored[0]
+                stored = await load_newer()
+                if stored is not None:
+                    break
+                continue
+
+            try:
+                # 락을 얻는 사이 다른 워커가 갱신을 마쳤는지 다시 확인
+                stored = await load_newer()
+                if fresh(stored):
+                    break
+                snapshot = await fetch()
+                payload = await asyncio.to_thread(snapshot.dumps)
+                await asyncio.to_thread(
+                    store.save,
+                    kind,
+                    account,
+                    snapshot.fetched_at,
+                    payload,
+                )
+                return snapshot
+            finally:
+                lock.release()
+
+        assert stored is not None
+        return await asyncio.to_thread(loads, *stored)
+
+    # ----------------------------- inventory -----------------------------
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> "asyncio.Task[None]":
+        """백그라운드 태스크 실행 (close 시 취소되도록 참조 유지).
+
+        :param coro: 실행할 코루틴
+        :return: 실행 중인 태스크
+        """
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _start_sweep(
+        self,
+        client: "BaseClient",
+        *,
+        max_age: Optional[float] = None,
+        keep: bool = False,
+    ) -> InventorySweep:
+        """전체 액세스 키 조회를 백그라운드로 시작 (진행 중이면 합류).
+
+        :param client: IAM 클라이언트
+        :param max_age: 공유 저장소의 스냅샷을 그대로 사용할 최대 경과 시간 (초)
+        :param keep: 기다리는 요청이 모두 떠나도 계속 조회할지 여부 (백그라운드 갱신)
+        :return: 진행 중인 전체 조회
+        """
+        sweep = self._sweep
+        if sweep is None:
+            sweep = self._sweep = InventorySweep()
+            sweep.task = self._spawn(self._run_sweep(client, sweep, max_age=max_age))
+        sweep.keep = sweep.keep or keep
+        return sweep
+
+    @contextmanager
+    def _consume(self, sweep: InventorySweep) -> Iterator[None]:
+        """요청이 전체 조회 결과를 기다리는 동안 소비자로 등록.
+
+        요청 경로에서 시작된 조회는 기다리던 요청이 모두 연결을 끊으면(취소) 함께
+        취소하여, 아무도 읽지 않을 결과에 계정의 rate budget을 쓰지 않는다.
+
+        :param sweep: 진행 중인 전체 조회
+        """
+        sweep.consumers += 1
+        abandoned = False
+        try:
+            yield
+        except (asyncio.CancelledError, GeneratorExit):
+            abandoned = True
+            raise
+        finally:
+            sweep.consumers -= 1
+            if abandoned and not sweep.consumers and not sweep.keep:
+                self._cancel_sweep(sweep)
+
+    def _cancel_sweep(self, sweep: InventorySweep) -> None:
+        """버려진 전체 조회 취소 (새 요청은 새 조회를 시작).
+
+        :param sweep: 취소할 전체 조회
+        """
+        if self._sweep is sweep:
+            self._sweep = None
+        if sweep.task is not None and not sweep.task.done():
+            sweep.task.cancel()
+            SWEEPS_CANCELLED.inc()
+
+    async def _run_sweep(
+        self,
+        client: "BaseClient",
+        sweep: InventorySweep,
+        *,
+        max_age: Optional[float] = None,
+    ) -> None:
+        """모든 유저의 액세스 키를 조회하여 인벤토리 스냅샷 갱신.
+
+        다른 워커가 공유 저장소에 저장한 스냅샷이 있으면 조회 없이 사용한다.
+
+        :param client: IAM 클라이언트
+        :param sweep: 결과를 누적할 전체 조회
+        :param max_age: 공유 저장소의 스냅샷을 그대로 사용할 최대 경과 시간 (초)
+        """
+        ttl: float = settings.inventory_ttl
+        if max_age is not None:
+            ttl = min(ttl, max_age)
+
+        async def fetch() -> InventorySnapshot:
+            """AWS에서 전체 액세스 키 조회."""
+            async for user, keys in self._iter_access_keys(
+                client,
+                listed=sweep.set_users_total,
+            ):
+                sweep.add(
+                    KeyRecord(
+                        user_name=user,
+                        access_key_id=k["AccessKeyId"],
+                        created_date=k["CreateDate"],
+                        status=k["Status"],
+                    )
+                    for k in keys
+                )
+            return InventorySnapshot(sweep.table, generated_at=sweep.started_at)
+
+        try:
+            snapshot = await self._refresh_shared(
+                INVENTORY,
+                fetch,
+                InventorySnapshot.loads,
+                current=self._inventory,
+                max_age=ttl,
+            )
+        except BaseException as e:
+            sweep.fail(e)
+            if not isinstance(e, Exception):
+                raise
+            logger.opt(exception=e).warning("IAM inventory sweep failed")
+        else:
+            self._inventory = snapshot
+            sweep.finish(snapshot)
+        finally:
+            if self._sweep is sweep:
+                self._sweep = None
+
+    def _inventory_expired(self, max_age: Optional[float]) -> bool:
+        """인벤토리가 없거나 허용할 최대 경과 시간을 넘었는지 확인.
+
+        :param max_age: 허용할 최대 경과 시간 (초, None이면 제한 없음)
+        :return: 전체 조회 완료까지 기다려야 하는지 여부
+        """
+        snapshot = self._inventory
+        return snapshot is None or (max_age is not None and snapshot.age > max_age)
+
+    def _get_inventory(self, client: "BaseClient") -> InventorySnapshot:
+        """인벤토리 스냅샷 반환 (stale-while-revalidate).
+
+        TTL이 지난 스냅샷은 그대로 반환하고, 백그라운드에서 갱신한다.
+        (스냅샷이 없거나 너무 오래된 경우는 호출자가 전체 조회를 기다림)
+
+        :param client: IAM 클라이언트
+        :return: 인벤토리 스냅샷
+        """
+        snapshot = self._inventory
+        assert snapshot is not None
+        if snapshot.age >= settings.inventory_ttl:
+            self._start_sweep(client, keep=True)
+        return snapshot
+
+    async def revalidate(self, *, ahead: float = 0) -> None:
+        """없거나 ``ahead``초 안에 TTL이 지나는 인벤토리/Credential Report를 갱신 (스케줄러용).
+
+        스케줄러는 다음 실행까지의 최대 대기 시간을 ``ahead``로 넘겨, 다음 실행 전에
+        만료될 스냅샷을 미리 갱신한다. (TTL이 ``ahead``보다 짧으면 매번 갱신)
+        실패는 로그로 남기고 기존 스냅샷을 유지한다.
+
+        :param ahead: 만료 전에 미리 갱신할 시간 (초)
+        """
+        client = await self._client_async()
+        inventory_age = max(settings.inventory_ttl - ahead, 0)
+        report_age = max(settings.credential_report_ttl - ahead, 0)
+
+        async def inventory() -> None:
+            if self._inventory_expired(inventory_age):
+                # 실패는 _run_sweep에서 로그로 남김
+                with suppress(Exception):
+                    sweep = self._start_sweep(client, max_age=inventory_age, keep=True)
+                    await sweep.wait()
+
+        async def report() -> None:
+            report = self._report
+            if report is None or report.expired(report_age):
+                await self._revalidate_credential_report(client, max_age=report_age)
+
+        await asyncio.gather(inventory(), report())
+
+    async def _resolve_report_keys(
+        self,
+        client: "BaseClient",
+        report: CredentialReport,
+        *,
+        hours: int,
+        progress: Optional[ScanProgress] = None,
+    ) -> AsyncIterator[OldKey]:
+        """Credential Report에서 N시간 이상된 후보를 추려 실제 키 ID를 조회.
+
+        키 ID 캐시에 있는 후보는 ListAccessKeys 호출 없이 변환하고,
+        새로 조회한 결과는 캐시에 반영하여 공유 저장소에 저장한다.
+        공유 저장소가 있으면 캐시에 없는 후보는 갱신 락을 얻은 워커 하나만 조회하고,
+        나머지 워커는 그 결과가 저장될 때까지 기다렸다가 캐시로 변환한다.
+
+        :param client: IAM 클라이언트
+        :param report: 파싱된 Credential Report
+        :param hours: 임계값 (시간)
+        :param progress: 진행 상황 (후보 유저 수 / 처리한 후보 수)
+        :return: 오래된 액세스 키 async iterator
+        """
+        # 임계값 계산 (epoch 초)
+        threshold = (datetime.now(timezone.utc) - timedelta(hours=hours)).timestamp()
+
+        # last_rotated된 시간이 임계값 이전인 (user, rotated_at) 검사 대상 목록
+        users = [(u, t) for u, t in report.keys if t < threshold]
+        if progress is not None:
+            progress.start()
+            progress.set_total(len(users))
+
+        async def id_for(candidate: Tuple[str, int]) -> Optional[OldKey]:
+            """검사 대상 유저의 액세스 키 중 생성일이 정확히 일치하는 키만 반환.
+
+            :param candidate: (유저 이름, 회전 일시 epoch 초)
+            :return: 오래된 액세스 키
+            """
+            user, rotated_at = candidate
+
+            # IAM 시간은 초 단위로 정확하므로, 생성일로 키를 특정할 수 있음
+            key_id = self._key_ids.get(user, rotated_at)
+            if key_id is None:
+                # 유저의 액세스 키 목록 조회 후 캐시 갱신
+                keys = await self._fetch_keys_for_user(client, user)
+                self._key_ids.update_user(
+                    user,
+                    ((k["CreateDate"], k["AccessKeyId"]) for k in keys),
+                )
+                key_id = self._key_ids.get(user, rotated_at)
+                if key_id is None:
+                    return None
+
+            return OldKey(
+                self.account_id,
+                user,
+                key_id,
+                datetime.fromtimestamp(rotated_at, timezone.utc),
+            )
+
+        lock = await self._elect_key_resolver(users)
+
+        # 캐시에 있는 후보가 먼저 나오도록 정렬 (조회 없이 바로 응답)
+        users.sort(key=lambda c: self._key_ids.get(*c) is None)
+
+        try:
+            async for result in bounded_map(
+                from_iterable(users),
+                id_for,
+                workers=settings.iam_sweep_workers,
+                queue_size=settings.iam_sweep_queue_size,
+            ):
+                if progress is not None:
+                    progress.advance()
+                if result is not None:
+                    yield result
+        finally:
+            # 기한 초과/연결 종료로 중단되어도 그때까지 조회한 키 ID는 저장
+            try:
+                await self._save_key_ids()
+            finally:
+                if lock is not None:
+                    lock.release()
+
+    async def _elect_key_resolver(
+        self,
+        users: List[Tuple[str, int]],
+    ) -> Optional[RefreshLock]:
+        """캐시에 없는 후보의 키 ID를 조회할 워커 선출 (``_refresh_shared``와 같은 락).
+
+        다른 워커가 조회 중이면 락이 풀릴 때까지 저장소를 폴링하며 저장된 키 ID를
+        병합하고, 그래도 남은 후보가 있으면 락을 얻어 직접 조회한다.
+
+        :param users: 검사 대상 (유저 이름, 회전 일시 epoch 초) 목록
+        :return: 획득한 락 (조회할 후보가 없거나 저장소가 없으면 None)
+        """
+        store = self._store
+        if store is None:
+            return None
+
+        def missing() -> bool:
+            return any(self._key_ids.get(*c) is None for c in users)
+
+        while missing():
+            lock = await asyncio.to_thread(store.try_lock, KEY_IDS, self._store_key)
+            if lock is not None:
+                # 락을 얻는 사이 다른 워커가 저장한 키 ID 반영
+                try:
+                    await self._load_key_ids()
+                except BaseException:
+                    lock.release()
+                    raise
+                if missing():
+                    return lock
+                lock.release()
+                return None
+            await asyncio.sleep(settings.snapshot_poll_interval)
+            await self._load_key_ids()
+        return None
+
+    async def _load_key_ids(self) -> None:
+        """공유 저장소의 키 ID 캐시를 병합 (이 캐시에 없는 유저만)."""
+        store = self._store
+        if store is None:
+            return
+        stored = await asyncio.to_thread(store.load, KEY_IDS, self._store_key)
+        if stored is not None:
+            self._key_ids.merge(await asyncio.to_thread(KeyIdCache.loads, stored[1]))
+
+    async def _save_key_ids(self) -> None:
+        """변경된 키 ID 캐시를 공유 저장소에 저장 (다른 워커의 항목과 병합)."""
+        store = self._store
+        cache = self._key_ids
+        if store is None or not cache.dirty:
+            return
+
+        cache.dirty = False
+        stored = await asyncio.to_thread(store.load, KEY_IDS, self._store_key)
+        if stored is not None:
+            cache.merge(await asyncio.to_thread(KeyIdCache.loads, stored[1]))
+        if self._report is not None:
+            cache.retain(self._report.keys)
+        payload = await asyncio.to_thread(cache.dumps)
+        await asyncio.to_thread(
+            store.save, KEY_IDS, self._store_key, time.time(), payload
+        )
+
+    # ---------------------------- public API ----------------------------
+    async def iter_old_access_keys_from_list_users(
+        self,
+        *,
+        hours: int,
+        max_age: Optional[float] = None,
+    ) -> AsyncIterator[OldKey]:
+        """모든 유저의 액세스 키 인벤토리에서 생성된 지 N시간 이상된 키를 반환.
+        (ListUsers + ListAccessKeys 조합, 비용↑)
+
+        인벤토리가 아직 없으면 전체 조회를 따라 읽으며,
+        유저별 조회가 끝나는 즉시 해당 유저의 오래된 키를 내보낸다 (스트리밍).
+
+        :param hours: 임계값 (시간)
+        :param max_age: 허용할 최대 데이터 경과 시간 (초, 초과 시 전체 조회)
+        :return: 오래된 액세스 키 async iterator
+        """
+        # 클라이언트 초기화
+        client = await self._client_async()
+
+        # 임계값 계산
+        threshold = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+        # 인벤토리가 없으면 (또는 너무 오래되었으면) 전체 조회 결과를 그대로 스트리밍
+        if self._inventory_expired(max_age):
+            sweep = self._start_sweep(client, max_age=max_age)
+            with self._consume(sweep):
+                async for record in sweep.follow():
+                    if record.created_date < threshold:
+                        yield record.to_old_key(self.account_id)
+            return
+
+        snapshot = self._get_inventory(client)
+        for key in snapshot.old_keys(threshold, self.account_id):
+            yield key
+
+    async def get_old_access_keys_from_list_users(
+        self,
+        *,
+        hours: int,
+        max_age: Optional[float] = None,
+        deadline: Optional[Deadline] = None,
+        progress: Optional[ScanProgress] = None,
+    ) -> OldAccessKeyResult:
+        """모든 유저의 액세스 키 인벤토리에서 생성된 지 N시간 이상된 키를 반환.
+        (ListUsers + ListAccessKeys 조합, 비용↑)
+
+        인벤토리는 생성일 순으로 정렬되어 있어 임의의 ``hours``를
+        이진 탐색 한 번으로 처리하며, ``INVENTORY_TTL``이 지나면 백그라운드에서 갱신된다.
+
+        전체 조회가 ``deadline`` 안에 끝나지 않으면 지금까지 조회된 키로 부분 결과를
+        반환하고, 전체 조회는 다음 요청을 위해 계속 진행한다.
+
+        :param hours: 임계값 (시간)
+        :param max_age: 허용할 최대 데이터 경과 시간 (초, 초과 시 전체 조회)
+        :param deadline: 요청 처리 기한
+        :param progress: 진행 상황 (전체 조회를 기다리는 경우 처리한 유저 수)
+        :return: 오래된 액세스 키 목록 및 스냅샷 기준 시각
+        """
+        deadline = deadline or Deadline()
+
+        # 클라이언트 초기화
+        client = await self._client_async()
+
+        # 임계값 계산
+        threshold = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+        # 인벤토리 스냅샷 조회 (없으면 전체 조회 완료까지 대기)
+        if self._inventory_expired(max_age):
+            sweep = self._start_sweep(client, max_age=max_age)
+            if progress is not None:
+                sweep.watch(progress)
+            with self._consume(sweep):
+                try:
+                    snapshot = await deadline.wait(sweep.wait())
+                except asyncio.TimeoutError:
+                    sweep.keep = True
+                    return OldAccessKeyResult(
+                        old_access_keys=sweep.old_keys(threshold, self.account_id),
+                        generated_at=sweep.started_at,
+                        complete=False,
+                    )
+        else:
+            snapshot = self._get_inventory(client)
+
+        # 임계값 이전 생성된 키만 반환
+        return OldAccessKeyResult(
+            old_access_keys=snapshot.old_keys(threshold, self.account_id),
+            generated_at=snapshot.generated_at,
+            version=snapshot.version(threshold),
+        )
+
+    async def get_old_access_keys_version_from_list_users(
+        self,
+        *,
+        hours: int,
+        max_age: Optional[float] = None,
+    ) -> Optional[ResultVersion]:
+        """``get_old_access_keys_from_list_users`` 응답의 내용 버전 (키 목록을 만들지 않음).
+
+        조건부 요청이 변경 없음(304)인지 키 변환/직렬화 없이 확인하는 데 사용한다.
+        인벤토리 갱신 규칙(stale-while-revalidate)은 같다.
+
+        :param hours: 임계값 (시간)
+        :param max_age: 허용할 최대 데이터 경과 시간 (초)
+        :return: 내용 버전 (전체 조회를 기다려야 하면 None)
+        """
+        if self._inventory_expired(max_age):
+            return None
+        client = await self._client_async()
+        snapshot = self._get_inventory(client)
+        threshold = datetime.now(timezone.utc) - timedelta(hours=hours)
+        return ResultVersion(snapshot.version(threshold), snapshot.generated_at)
+
+    async def iter_old_access_keys_from_credential_report(
+        self,
+        *,
+        hours: int,
+        refresh: bool = False,
+        max_age: Optional[float] = None,
+    ) -> AsyncIterator[OldKey]:
+        """Credential Report를 우선 활용해 후보를 추린 뒤, 실제 키 ID 조회는 ListAccessKeys로 제한적으로 호출 (비용↓).
+
+        Credential Report는 AWS에서 받아온 시각 기준으로 TTL 동안 캐시되며,
+        후보별 키 ID 조회가 끝나는 즉시 결과를 내보낸다 (스트리밍).
+        AWS는 4시간 이내에 생성한 보고서를 재사용하므로 ``refresh``로도 새 보고서
+        생성을 강제할 수 없다. (다시 받아오기만 하며 데이터는 최대 4시간 경과)
+
+        :param hours: 임계값 (시간)
+        :param refresh: Credential Report 캐시를 무시하고 AWS에서 다시 받아올지 여부
+        :param max_age: 허용할 최대 데이터 경과 시간 (초, 초과 시 다시 조회)
+        :return: 오래된 액세스 키 async iterator
+        """
+        # 클라이언트 초기화
+        client = await self._client_async()
+
+        # 자격 증명 보고서 조회 (캐시 또는 single-flight 생성/다운로드)
+        report = await self._get_credential_report(
+            client,
+            refresh=refresh,
+            max_age=max_age,
+        )
+
+        async for key in self._resolve_report_keys(client, report, hours=hours):
+            yield key
+
+    async def get_old_access_keys_from_credential_report(
+        self,
+        *,
+        hours: int,
+        refresh: bool = False,
+        max_age: Optional[float] = None,
+        deadline: Optional[Deadline] = None,
+        progress: Optional[ScanProgress] = None,
+    ) -> OldAccessKeyResult:
+        """Credential Report를 우선 활용해 후보를 추린 뒤, 실제 키 ID 조회는 ListAccessKeys로 제한적으로 호출 (비용↓).
+
+        Credential Report는 AWS에서 받아온 시각 기준으로 TTL 동안 캐시된다.
+        AWS는 4시간 이내에 생성한 보고서를 재사용하므로 ``refresh``로도 새 보고서
+        생성을 강제할 수 없다. (다시 받아오기만 하며 데이터는 최대 4시간 경과)
+        ``deadline``을 넘기면 남은 키 ID 조회를 취소하고 그때까지 찾은 키로
+        부분 결과를 반환한다. (보고서 생성은 공유 작업이므로 계속 진행)
+
+        :param hours: 임계값 (시간)
+        :param refresh: Credential Report 캐시를 무시하고 AWS에서 다시 받아올지 여부
+        :param max_age: 허용할 최대 데이터 경과 시간 (초, 초과 시 다시 조회)
+        :param deadline: 요청 처리 기한
+        :param progress: 진행 상황 (후보 유저 수 / 처리한 후보 수)
+        :return: 오래된 액세스 키 목록 및 Credential Report 생성 시각
+        """
+        deadline = deadline or Deadline()
+
+        # 클라이언트 초기화
+        client = await self._client_async()
+
+        # 자격 증명 보고서 조회 (캐시 또는 single-flight 생성/다운로드)
+        try:
+            report = await deadline.wait(
+                self._get_credential_report(
+                    client,
+                    refresh=refresh,
+                    max_age=max_age,
+                )
+            )
+        except asyncio.TimeoutError:
+            # 보고서를 받지 못했으므로 기준 시각 없는 빈 부분 결과
+            return OldAccessKeyResult(
+                old_access_keys=[],
+                generated_at=None,
+                complete=False,
+            )
+
+        keys, complete = await deadline.collect(
+            self._resolve_report_keys(
+                client,
+                report,
+                hours=hours,
+                progress=progress,
+            )
+        )
+        return OldAccessKeyResult(
+            old_access_keys=keys,
+            generated_at=report.generated_at,
+            complete=complete,
+        )
@@ -0,0 +1,51 @@
+import asyncio
+import time
+from typing import AsyncIterable, Awaitable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class Deadline:
+    """요청 처리 기한.
+
+    한 요청의 모든 계정 조회가 같은 기한을 공유한다. 기한을 넘긴 대기는 취소되고,
+    호출자는 그때까지의 결과를 부분 결과로 응답한다.
+    """
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        """
+        :param timeout: 지금부터의 제한 시간 (초, None이면 기한 없음)
+        """
+        self._at = None if timeout is None else time.monotonic() + timeout
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간 (초, 기한이 없으면 None)."""
+        if self._at is None:
+            return None
+        return max(0.0, self._at - time.monotonic())
+
+    async def wait(self, aw: Awaitable[T]) -> T:
+        """기한까지 ``aw`` 대기 (넘으면 취소 후 ``asyncio.TimeoutError`` 발생).
+
+        :param aw: 대기할 awaitable
+        :return: 결과
+        """
+        return await asyncio.wait_for(aw, self.remaining())
+
+    async def collect(self, items: AsyncIterable[T]) -> Tuple[List[T], bool]:
+        """기한까지 ``items``를 모음 (넘으면 순회를 취소하고 그때까지 모은 항목 반환).
+
+        :param items: 입력 async iterable
+        :return: (모은 항목, 끝까지 순회했는지 여부)
+        """
+        collected: List[T] = []
+
+        async def drain() -> None:
+            async for item in items:
+                collected.append(item)
+
+        try:
+            await self.wait(drain())
+        except asyncio.TimeoutError:
+            return collected, False
+        return collected, True
@@ -1,5 +1,7 @@
 from starlette.requests import Request
 
+from backend.services.iam.jobs import JobManager
+from backend.services.iam.result_sets import ResultSetCache
 from backend.services.iam.service import IAMService
 
 
@@ -13,3 +15,27 @@ async def get_iam_service(
     :return: IAMService instance.
     """
     return request.app.state.iam_service
+
+
+async def get_job_manager(
+    request: Request,
+) -> JobManager:  # pragma: no cover
+    """
+    Get JobManager instance.
+
+    :param request: Request instance.
+    :return: JobManager instance.
+    """
+    return request.app.state.iam_jobs
+
+
+async def get_result_sets(
+    request: Request,
+) -> ResultSetCache:  # pragma: no cover
+    """
+    Get ResultSetCache instance.
+
+    :param request: Request instance.
+    :return: ResultSetCache instance.
+    """
+    return request.app.state.iam_result_sets
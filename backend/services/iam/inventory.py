@@ -0,0 +1,556 @@
+import asyncio
+import hashlib
+import sys
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import ujson
+
+from backend.services.iam.progress import ScanProgress
+
+
+@dataclass(slots=True)
+class OldKey:
+    """오래된 액세스 키 (응답 직렬화용 경량 레코드).
+
+    키마다 Pydantic 모델을 검증/생성하지 않도록 서비스는 이 레코드를 반환한다.
+    필드 이름은 응답 스키마 ``OldAccessKey``와 같다.
+    """
+
+    account_id: Optional[str]
+    user_name: str
+    access_key_id: str
+    created_date: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class KeyRecord:
+    """액세스 키 레코드 (인벤토리에는 ``KeyTable`` 컬럼으로 보관)."""
+
+    user_name: str
+    access_key_id: str
+    created_date: datetime
+    status: str
+
+    def to_old_key(self, account_id: Optional[str] = None) -> OldKey:
+        """응답 레코드로 변환.
+
+        :param account_id: AWS 계정 ID
+        :return: 오래된 액세스 키
+        """
+        return OldKey(account_id, self.user_name, self.access_key_id, self.created_date)
+
+
+@dataclass(frozen=True)
+class OldAccessKeyResult:
+    """오래된 액세스 키 조회 결과와 데이터 기준 시각."""
+
+    old_access_keys: List[OldKey]
+    # 데이터 기준 시각 (인벤토리 스냅샷 / Credential Report 생성 시각)
+    # 기한 안에 데이터를 받지 못한 부분 결과면 None
+    generated_at: Optional[datetime]
+    # False면 요청 기한 안에 조회를 끝내지 못한 부분 결과
+    complete: bool = True
+    # 응답 내용 버전 (같으면 같은 키 목록, 직렬화 없이 ETag로 사용, 모르면 None)
+    version: Optional[str] = None
+
+    @property
+    def age(self) -> Optional[float]:
+        """데이터 경과 시간 (초, 기준 시각이 없으면 None)."""
+        if self.generated_at is None:
+            return None
+        return (datetime.now(timezone.utc) - self.generated_at).total_seconds()
+
+    @classmethod
+    def merge(cls, results: List["OldAccessKeyResult"]) -> "OldAccessKeyResult":
+        """여러 계정의 조회 결과 병합 (기준 시각은 가장 오래된 결과 기준).
+
+        기준 시각이 없는 계정 결과가 있으면 병합 결과의 기준 시각도 None이다.
+
+        :param results: 계정별 조회 결과
+        :return: 병합된 조회 결과
+        """
+        if len(results) == 1:
+            return results[0]
+        versions = [r.version for r in results]
+        times = [r.generated_at for r in results]
+        return cls(
+            old_access_keys=[k for r in results for k in r.old_access_keys],
+            generated_at=(
+                min(t for t in times if t is not None) if None not in times else None
+            ),
+            complete=all(r.complete for r in results),
+            version=(
+                combine_versions([v for v in versions if v is not None])
+                if None not in versions
+                else None
+            ),
+        )
+
+    def dumps(self) -> bytes:
+        """공유 저장소용 직렬화.
+
+        :return: 직렬화된 결과 (키는 [계정 ID, 유저, 키 ID, 생성일 epoch] 배열)
+        """
+        return ujson.dumps(
+            {
+                "generated_at": (
+                    self.generated_at.timestamp()
+                    if self.generated_at is not None
+                    else None
+                ),
+                "complete": self.complete,
+                "keys": [
+                    [
+                        k.account_id,
+                        k.user_name,
+                        k.access_key_id,
+                        k.created_date.timestamp(),
+                    ]
+                    for k in self.old_access_keys
+                ],
+            }
+        ).encode()
+
+    @classmethod
+    def loads(cls, payload: bytes) -> "OldAccessKeyResult":
+        """``dumps``로 직렬화된 결과 복원.
+
+        :param payload: 직렬화된 결과
+        :return: 조회 결과
+        """
+        data = ujson.loads(payload)
+        generated_at = data["generated_at"]
+        return cls(
+            old_access_keys=[
+                OldKey(
+                    account, user, key_id, datetime.fromtimestamp(created, timezone.utc)
+                )
+                for account, user, key_id, created in data["keys"]
+            ],
+            generated_at=(
+                datetime.fromtimestamp(generated_at, timezone.utc)
+                if generated_at is not None
+                else None
+            ),
+            complete=data["complete"],
+        )
+
+
+@dataclass(frozen=True)
+class ResultVersion:
+    """키 목록을 만들지 않고 구한 응답 내용 버전과 데이터 기준 시각."""
+
+    version: str
+    generated_at: datetime
+
+    @property
+    def age(self) -> float:
+        """데이터 경과 시간 (초)."""
+        return (datetime.now(timezone.utc) - self.generated_at).total_seconds()
+
+    @classmethod
+    def merge(cls, versions: List["ResultVersion"]) -> "ResultVersion":
+        """여러 계정의 버전 병합 (``OldAccessKeyResult.merge``와 같은 규칙).
+
+        :param versions: 계정별 버전
+        :return: 병합된 버전
+        """
+        if len(versions) == 1:
+            return versions[0]
+        return cls(
+            version=combine_versions([v.version for v in versions]),
+            generated_at=min(v.generated_at for v in versions),
+        )
+
+
+def combine_versions(versions: List[str]) -> str:
+    """계정별 응답 내용 버전을 하나로 합침 (계정 순서 유지).
+
+    :param versions: 계정별 버전
+    :return: 병합된 버전
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for version in versions:
+        h.update(f"{version}\n".encode())
+    return h.hexdigest()
+
+
+class KeyTable:
+    """액세스 키 레코드를 레코드별 객체 없이 컬럼으로 보관하는 컴팩트 테이블.
+
+    - 유저 이름 / 상태: intern된 문자열 (같은 유저의 키, 복원한 스냅샷끼리 공유)
+    - 생성일: epoch 초 ``array('q')`` (IAM 시각은 초 단위)
+    - 키 ID: 이어 붙인 바이트 버퍼 + 끝 위치 ``array('I')``
+    """
+
+    __slots__ = ("users", "created", "statuses", "_key_ids", "_key_ends")
+
+    def __init__(self) -> None:
+        self.users: List[str] = []
+        self.created: "array[int]" = array("q")
+        self.statuses: List[str] = []
+        self._key_ids = bytearray()
+        self._key_ends: "array[int]" = array("I")
+
+    def __len__(self) -> int:
+        return len(self.created)
+
+    def append(
+        self,
+        user_name: str,
+        access_key_id: str,
+        created: int,
+        status: str,
+    ) -> None:
+        """레코드 추가.
+
+        :param user_name: 유저 이름
+        :param access_key_id: 액세스 키 ID
+        :param created: 생성일 (epoch 초)
+        :param status: 키 상태
+        """
+        self.users.append(sys.intern(user_name))
+        self.created.append(created)
+        self.statuses.append(sys.intern(status))
+        self._key_ids += access_key_id.encode()
+        self._key_ends.append(len(self._key_ids))
+
+    def extend(self, records: Iterable[KeyRecord]) -> None:
+        """레코드 목록 추가.
+
+        :param records: 액세스 키 레코드
+        """
+        for r in records:
+            self.append(
+                r.user_name,
+                r.access_key_id,
+                int(r.created_date.timestamp()),
+                r.status,
+            )
+
+    def key_id(self, idx: int) -> str:
+        """``idx`` 번째 레코드의 액세스 키 ID."""
+        start = self._key_ends[idx - 1] if idx else 0
+        return self._key_ids[start : self._key_ends[idx]].decode()
+
+    def record(self, idx: int) -> KeyRecord:
+        """``idx`` 번째 레코드.
+
+        :param idx: 레코드 위치
+        :return: 액세스 키 레코드
+        """
+        return KeyRecord(
+            user_name=self.users[idx],
+            access_key_id=self.key_id(idx),
+            created_date=datetime.fromtimestamp(self.created[idx], timezone.utc),
+            status=self.statuses[idx],
+        )
+
+    def rows(self) -> Iterator[Tuple[str, str, int, str]]:
+        """(유저 이름, 키 ID, 생성일 epoch, 상태) 순회."""
+        start = 0
+        for user, end, created, status in zip(
+            self.users, self._key_ends, self.created, self.statuses
+        ):
+            yield user, self._key_ids[start:end].decode(), created, status
+            start = end
+
+    def columns(self) -> Dict[str, Any]:
+        """직렬화용 컬럼 (키 ID는 이어 붙인 문자열과 끝 위치).
+
+        :return: 컬럼 이름 → 값 목록
+        """
+        return {
+            "users": self.users,
+            "created": self.created.tolist(),
+            "statuses": self.statuses,
+            "key_ids": self._key_ids.decode(),
+            "key_ends": self._key_ends.tolist(),
+        }
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Any]) -> "KeyTable":
+        """``columns``로 직렬화한 컬럼에서 테이블 복원.
+
+        :param columns: 컬럼 이름 → 값 목록
+        :return: 테이블
+        """
+        table = cls()
+        table.users = [sys.intern(u) for u in columns["users"]]
+        table.created = array("q", columns["created"])
+        table.statuses = [sys.intern(s) for s in columns["statuses"]]
+        table._key_ids = bytearray(columns["key_ids"].encode())
+        table._key_ends = array("I", columns["key_ends"])
+        return table
+
+    def sorted_by_created(self) -> "KeyTable":
+        """생성일 순으로 정렬한 테이블 (이미 정렬되어 있으면 그대로 반환).
+
+        같은 생성일의 레코드는 기존 순서를 유지한다.
+        """
+        created = self.created
+        if all(created[i] <= created[i + 1] for i in range(len(created) - 1)):
+            return self
+        order = sorted(range(len(self)), key=created.__getitem__)
+        table = KeyTable()
+        table.users = [self.users[i] for i in order]
+        table.created = array("q", [self.created[i] for i in order])
+        table.statuses = [self.statuses[i] for i in order]
+        ends = self._key_ends
+        for i in order:
+            table._key_ids += self._key_ids[ends[i - 1] if i else 0 : ends[i]]
+            table._key_ends.append(len(table._key_ids))
+        return table
+
+    def old_keys(self, stop: int, account_id: Optional[str]) -> List[OldKey]:
+        """앞에서부터 ``stop``개 레코드를 응답 레코드로 변환.
+
+        :param stop: 변환할 레코드 수
+        :param account_id: AWS 계정 ID
+        :return: 오래된 액세스 키 목록
+        """
+        keys: List[OldKey] = []
+        start = 0
+        for user, end, created in zip(
+            self.users[:stop], self._key_ends[:stop], self.created[:stop]
+        ):
+            keys.append(
+                OldKey(
+                    account_id,
+                    user,
+                    self._key_ids[start:end].decode(),
+                    datetime.fromtimestamp(created, timezone.utc),
+                )
+            )
+            start = end
+        return keys
+
+
+class InventorySnapshot:
+    """생성일 순으로 정렬된 액세스 키 인벤토리 스냅샷.
+
+    임의의 ``hours`` 임계값을 생성일 배열의 이진 탐색 한 번으로 처리한다.
+    """
+
+    def __init__(self, table: KeyTable, *, generated_at: datetime) -> None:
+        """레코드를 생성일 순으로 정렬하여 스냅샷 생성.
+
+        :param table: 액세스 키 레코드 테이블
+        :param generated_at: 스냅샷 기준 시각 (조회 시작 시각)
+        """
+        self.table = table.sorted_by_created()
+        self.generated_at = generated_at
+        self.snapshot_id = self._digest(self.table)
+
+    @staticmethod
+    def _digest(table: KeyTable) -> str:
+        """레코드 내용 기반 스냅샷 ID (내용이 같으면 같은 ID)."""
+        h = hashlib.blake2b(digest_size=8)
+        for user, key_id, created, status in table.rows():
+            h.update(f"{user}\0{key_id}\0{created}\0{status}\n".encode())
+        return h.hexdigest()
+
+    def dumps(self) -> bytes:
+        """공유 저장소용 직렬화 (``KeyTable.columns`` 컬럼 객체).
+
+        레코드별 배열 대신 컬럼으로 저장하여 복원 시 만드는 객체 수를 줄인다.
+
+        :return: 직렬화된 레코드
+        """
+        return ujson.dumps(self.table.columns()).encode()
+
+    @classmethod
+    def loads(cls, generated_at: float, payload: bytes) -> "InventorySnapshot":
+        """공유 저장소의 스냅샷 복원.
+
+        :param generated_at: 스냅샷 기준 시각 (epoch 초)
+        :param payload: ``dumps``로 직렬화된 레코드
+        :return: 스냅샷
+        """
+        data = ujson.loads(payload)
+        if isinstance(data, dict):
+            table = KeyTable.from_columns(data)
+        else:
+            # 이전 버전 형식: [유저, 키 ID, 생성일 epoch(float), 상태] 배열
+            table = KeyTable()
+            for user_name, access_key_id, created, status in data:
+                table.append(user_name, access_key_id, int(created), status)
+        return cls(
+            table, generated_at=datetime.fromtimestamp(generated_at, timezone.utc)
+        )
+
+    @property
+    def age(self) -> float:
+        """스냅샷 경과 시간 (초)."""
+        return (datetime.now(timezone.utc) - self.generated_at).total_seconds()
+
+    @property
+    def fetched_at(self) -> float:
+        """공유 저장소 기준 시각 (epoch 초, 조회 시작 시각과 같음)."""
+        return self.generated_at.timestamp()
+
+    def old_keys(self, threshold: datetime, account_id: Optional[str]) -> List[OldKey]:
+        """생성일이 임계값 이전인 키를 응답 레코드로 반환 (이진 탐색).
+
+        :param threshold: 임계 시각
+        :param account_id: AWS 계정 ID
+        :return: 생성일 순 오래된 액세스 키 목록
+        """
+        stop = bisect_left(self.table.created, threshold.timestamp())
+        return self.table.old_keys(stop, account_id)
+
+    def version(self, threshold: datetime) -> str:
+        """``old_keys(threshold)`` 결과의 내용 버전 (키 목록을 만들지 않음).
+
+        결과는 생성일 순 앞부분이므로 스냅샷 ID와 키 수로 정해진다.
+
+        :param threshold: 임계 시각
+        :return: 내용 버전
+        """
+        stop = bisect_left(self.table.created, threshold.timestamp())
+        return f"{self.snapshot_id}-{stop}"
+
+
+class InventorySweep:
+    """진행 중인 전체 액세스 키 조회.
+
+    조회된 레코드를 누적하며, 여러 소비자가 같은 조회 결과를
+    처음부터 (진행 중인 부분까지) 따라 읽을 수 있다.
+    """
+
+    def __init__(self) -> None:
+        self.started_at = datetime.now(timezone.utc)
+        self.table = KeyTable()
+        self.users_processed = 0
+        # ListUsers 조회가 끝나 확정된 전체 유저 수
+        self.users_total: Optional[int] = None
+        self.snapshot: Optional[InventorySnapshot] = None
+        # 조회 태스크 / 결과를 기다리는 요청 수
+        self.task: Optional["asyncio.Task[None]"] = None
+        self.consumers = 0
+        # 기다리는 요청이 모두 떠나도 계속 조회할지 여부 (백그라운드 갱신 등)
+        self.keep = False
+        self._watchers: List[ScanProgress] = []
+        self._error: Optional[BaseException] = None
+        self._done = False
+        self._changed = asyncio.Event()
+
+    def _notify(self) -> None:
+        """대기 중인 소비자 깨우기."""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def watch(self, progress: ScanProgress) -> None:
+        """진행 상황에 이 조회의 처리한 유저 수 / 전체 유저 수 반영 (이후 갱신 포함).
+
+        :param progress: 진행 상황
+        """
+        progress.start()
+        progress.advance(self.users_processed)
+        if self.users_total is not None:
+            progress.set_total(self.users_total)
+        if not self._done:
+            self._watchers.append(progress)
+
+    def set_users_total(self, count: int) -> None:
+        """ListUsers 조회 완료 (전체 유저 수 확정).
+
+        :param count: 전체 유저 수
+        """
+        self.users_total = count
+        for progress in self._watchers:
+            progress.set_total(count)
+
+    def add(self, records: Iterable[KeyRecord]) -> None:
+        """유저 한 명의 조회 결과 추가.
+
+        :param records: 유저의 액세스 키 레코드
+        """
+        self.table.extend(records)
+        self.users_processed += 1
+        for progress in self._watchers:
+            progress.advance()
+        self._notify()
+
+    def old_keys(self, threshold: datetime, account_id: Optional[str]) -> List[OldKey]:
+        """지금까지 조회된 키 중 생성일이 임계값 이전인 키 (부분 결과용).
+
+        :param threshold: 임계 시각
+        :param account_id: AWS 계정 ID
+        :return: 생성일 순 오래된 액세스 키 목록
+        """
+        table = self.table
+        limit = threshold.timestamp()
+        keys = [
+            table.record(idx).to_old_key(account_id)
+            for idx, created in enumerate(table.created)
+            if created < limit
+        ]
+        keys.sort(key=lambda k: k.created_date)
+        return keys
+
+    def finish(self, snapshot: InventorySnapshot) -> None:
+        """조회 완료 처리.
+
+        다른 워커가 저장한 스냅샷을 받은 경우처럼 누적된 레코드가 없으면
+        스냅샷의 레코드를 따라 읽도록 한다.
+
+        :param snapshot: 완성된 스냅샷
+        """
+        if not len(self.table):
+            self.table = snapshot.table
+        if self.users_total is None:
+            # 다른 워커가 저장한 스냅샷을 받은 경우
+            self.set_users_total(self.users_processed)
+        self.snapshot = snapshot
+        self._done = True
+        self._watchers = []
+        self._notify()
+
+    def fail(self, error: BaseException) -> None:
+        """조회 실패 처리.
+
+        전체 유저 수를 알기 전에 실패했으면 처리한 유저 수로 확정하여
+        진행 상황의 대기 중인 계정 수를 해제한다.
+
+        :param error: 발생한 예외
+        """
+        if self.users_total is None:
+            self.set_users_total(self.users_processed)
+        self._error = error
+        self._done = True
+        self._watchers = []
+        self._notify()
+
+    async def wait(self) -> InventorySnapshot:
+        """조회 완료까지 대기.
+
+        :return: 완성된 스냅샷
+        """
+        while not self._done:
+            await self._changed.wait()
+        if self._error is not None:
+            raise self._error
+        assert self.snapshot is not None
+        return self.snapshot
+
+    async def follow(self) -> AsyncIterator[KeyRecord]:
+        """조회된 레코드를 처음부터 순서대로, 조회가 끝날 때까지 따라 읽음.
+
+        :return: 레코드 async iterator
+        """
+        idx = 0
+        while True:
+            changed = self._changed
+            while idx < len(self.table):
+                yield self.table.record(idx)
+                idx += 1
+            if self._done:
+                if self._error is not None:
+                    raise self._error
+                return
+            await changed.wait()
@@ -0,0 +1,396 @@
+import asyncio
+import enum
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import ujson
+from loguru import logger
+
+from backend.services.iam.inventory import OldAccessKeyResult
+from backend.services.iam.progress import ScanProgress, track
+from backend.services.iam.service import IAMService
+from backend.settings import settings
+
+# 공유 저장소의 작업 상태 / 결과 종류 (계정 자리에 작업 ID)
+JOB = "job"
+JOB_RESULT = "job_result"
+
+
+class JobMethod(str, enum.Enum):  # noqa: WPS600
+    """작업 조회 방식."""
+
+    LIST_USERS = "list-users"
+    CREDENTIAL_REPORT = "credential-report"
+
+
+class JobStatus(str, enum.Enum):  # noqa: WPS600
+    """작업 상태."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobQueueFullError(RuntimeError):
+    """작업 대기열이 가득 차 새 작업을 받을 수 없는 경우 발생."""
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """작업 조회 조건 (같은 조건의 대기/실행 중 작업은 하나로 합침)."""
+
+    method: JobMethod
+    hours: int
+    # 조회할 계정 ID (None이면 전체 계정)
+    accounts: Optional[Tuple[str, ...]] = None
+    max_age: Optional[int] = None
+    refresh: bool = False
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    """직렬화용 epoch 초."""
+    return value.timestamp() if value is not None else None
+
+
+def _datetime(value: Optional[float]) -> Optional[datetime]:
+    """epoch 초 → UTC datetime."""
+    return datetime.fromtimestamp(value, timezone.utc) if value is not None else None
+
+
+class Job:
+    """오래된 액세스 키 조회 작업."""
+
+    def __init__(
+        self,
+        spec: JobSpec,
+        *,
+        job_id: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        :param spec: 조회 조건
+        :param job_id: 작업 ID (기본값: 새 ID)
+        :param created_at: 접수 시각 (기본값: 현재 시각)
+        """
+        self.id = job_id or uuid.uuid4().hex
+        self.spec = spec
+        self.status = JobStatus.PENDING
+        self.created_at = created_at or datetime.now(timezone.utc)
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.progress = ScanProgress()
+        self.result: Optional[OldAccessKeyResult] = None
+        self.result_count: Optional[int] = None
+        self.error: Optional[str] = None
+        # 완료 시점의 IAM API 호출 수 (이후 백그라운드 조회의 호출은 제외)
+        self._calls = 0
+
+    @property
+    def finished(self) -> bool:
+        """완료(성공/실패) 여부."""
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    @property
+    def aws_calls(self) -> int:
+        """이 작업이 실행한 IAM API 호출 수.
+
+        다른 요청/작업이 먼저 시작한 조회에 합류한 경우 그 호출은 포함하지 않는다.
+        """
+        return self._calls if self.finished else self.progress.aws_calls
+
+    def begin(self) -> None:
+        """실행 시작."""
+        self.status = JobStatus.RUNNING
+        self.started_at = datetime.now(timezone.utc)
+
+    def end(
+        self,
+        *,
+        result: Optional[OldAccessKeyResult] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """실행 종료 (``result``가 있으면 성공, 없으면 실패).
+
+        :param result: 조회 결과
+        :param error: 실패 사유
+        """
+        self._calls = self.progress.aws_calls
+        self.finished_at = datetime.now(timezone.utc)
+        if result is not None:
+            self.status = JobStatus.SUCCEEDED
+            self.result = result
+            self.result_count = len(result.old_access_keys)
+        else:
+            self.status = JobStatus.FAILED
+            self.error = error
+
+    def dumps(self) -> bytes:
+        """공유 저장소용 상태 직렬화 (결과 제외).
+
+        :return: 직렬화된 상태
+        """
+        spec = self.spec
+        return ujson.dumps(
+            {
+                "id": self.id,
+                "method": spec.method.value,
+                "hours": spec.hours,
+                "accounts": spec.accounts,
+                "max_age": spec.max_age,
+                "refresh": spec.refresh,
+                "status": self.status.value,
+                "created_at": _timestamp(self.created_at),
+                "started_at": _timestamp(self.started_at),
+                "finished_at": _timestamp(self.finished_at),
+                "users_processed": self.progress.users_processed,
+                "users_total": self.progress.users_total,
+                "aws_calls": self.aws_calls,
+                "result_count": self.result_count,
+                "error": self.error,
+            }
+        ).encode()
+
+    @classmethod
+    def loads(cls, payload: bytes) -> "Job":
+        """다른 워커가 저장한 작업 상태 복원 (결과는 ``JobManager.result``로 조회).
+
+        :param payload: ``dumps``로 직렬화된 상태
+        :return: 작업
+        """
+        data: Dict[str, Any] = ujson.loads(payload)
+        accounts = data["accounts"]
+        job = cls(
+            JobSpec(
+                method=JobMethod(data["method"]),
+                hours=data["hours"],
+                accounts=tuple(accounts) if accounts is not None else None,
+                max_age=data["max_age"],
+                refresh=data["refresh"],
+            ),
+            job_id=data["id"],
+            created_at=_datetime(data["created_at"]),
+        )
+        job.status = JobStatus(data["status"])
+        job.started_at = _datetime(data["started_at"])
+        job.finished_at = _datetime(data["finished_at"])
+        job.progress.start()
+        job.progress.advance(data["users_processed"])
+        if data["users_total"] is not None:
+            job.progress.set_total(data["users_total"])
+        job.progress.aws_calls = job._calls = data["aws_calls"]
+        job.result_count = data["result_count"]
+        job.error = data["error"]
+        return job
+
+
+def _cutoff() -> float:
+    """이 시각(epoch) 이전에 끝난 작업은 만료 (``IAM_JOB_TTL``)."""
+    return time.time() - settings.iam_job_ttl
+
+
+def _expired(job: Job, cutoff: float) -> bool:
+    """작업 만료 여부.
+
+    :param job: 작업
+    :param cutoff: 만료 기준 시각 (epoch)
+    :return: ``cutoff`` 이전에 끝난 작업이면 True
+    """
+    return job.finished_at is not None and job.finished_at.timestamp() < cutoff
+
+
+class JobManager:
+    """``IAMService``로 오래된 액세스 키 조회를 비동기 작업으로 실행.
+
+    - 작업은 bounded 대기열(``IAM_JOB_QUEUE_SIZE``)에 쌓이고,
+      고정 개수의 worker(``IAM_JOB_WORKERS``)가 접수 순서대로 실행
+    - 같은 조건의 대기/실행 중 작업이 있으면 새로 만들지 않고 그 작업을 반환
+      (워커 프로세스 단위, 다른 워커가 접수한 작업과는 합치지 않음)
+    - 완료된 작업은 ``IAM_JOB_TTL``초 동안 결과와 함께 보관
+    - 공유 저장소가 있으면 상태/결과를 저장하여 다른 워커도 작업을 조회할 수 있음
+    """
+
+    def __init__(self, service: IAMService) -> None:
+        """
+        :param service: 조회에 사용할 IAMService
+        """
+        self._service = service
+        self._store = service.store
+        self._queue: "asyncio.Queue[Job]" = asyncio.Queue(
+            maxsize=settings.iam_job_queue_size,
+        )
+        self._jobs: Dict[str, Job] = {}
+        # 대기/실행 중인 작업 (조건별 중복 제거)
+        self._active: Dict[JobSpec, Job] = {}
+        self._workers: List["asyncio.Task[None]"] = []
+
+    def start(self) -> None:
+        """작업 worker 시작 (이미 실행 중이면 무시)."""
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._work())
+                for _ in range(settings.iam_job_workers)
+            ]
+
+    async def stop(self) -> None:
+        """작업 worker 종료 (실행 중인 작업은 실패 처리)."""
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def submit(self, spec: JobSpec) -> Job:
+        """작업 접수 (같은 조건의 대기/실행 중 작업이 있으면 그 작업 반환).
+
+        :param spec: 조회 조건
+        :return: 접수된 작업
+        :raises UnknownAccountError: 설정되지 않은 계정 ID
+        :raises JobQueueFullError: 대기열이 가득 참
+        """
+        self._service.select(list(spec.accounts) if spec.accounts else None)
+        job = self._active.get(spec)
+        if job is not None:
+            return job
+
+        await self._expire()
+        job = Job(spec)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise JobQueueFullError("IAM job queue is full") from None
+        self._jobs[job.id] = job
+        self._active[spec] = job
+        await self._save(job)
+        return job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        """작업 조회 (다른 워커가 접수한 작업은 공유 저장소에서 조회).
+
+        :param job_id: 작업 ID
+        :return: 작업 (없거나 만료되었으면 None)
+        """
+        job = self._jobs.get(job_id)
+        if job is None and self._store is not None:
+            stored = await asyncio.to_thread(self._store.load, JOB, job_id)
+            job = Job.loads(stored[1]) if stored is not None else None
+        if job is None or _expired(job, _cutoff()):
+            return None
+        return job
+
+    async def result(self, job: Job) -> Optional[OldAccessKeyResult]:
+        """성공한 작업의 결과.
+
+        :param job: 작업
+        :return: 조회 결과 (완료되지 않았거나 만료되었으면 None)
+        """
+        if job.result is not None or job.status is not JobStatus.SUCCEEDED:
+            return job.result
+        store = self._store
+        if store is None:
+            return None
+        stored = await asyncio.to_thread(store.load, JOB_RESULT, job.id)
+        if stored is None:
+            return None
+        return await asyncio.to_thread(OldAccessKeyResult.loads, stored[1])
+
+    async def _work(self) -> None:
+        """대기열의 작업을 차례로 실행."""
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        """작업 실행 (실행 중에는 진행 상황을 주기적으로 저장).
+
+        :param job: 실행할 작업
+        """
+        spec = job.spec
+        job.begin()
+        saver = asyncio.create_task(self._save_periodically(job))
+        try:
+            with track(job.progress):
+                result = await self._execute(spec, job.progress)
+        except asyncio.CancelledError:
+            job.end(error="cancelled")
+            raise
+        except Exception as e:
+            logger.opt(exception=e).warning("IAM job {} failed", job.id)
+            job.end(error=f"{type(e).__name__}: {e}")
+        else:
+            job.end(result=result)
+        finally:
+            if self._active.get(spec) is job:
+                del self._active[spec]
+            saver.cancel()
+            await asyncio.gather(saver, return_exceptions=True)
+            await self._save(job)
+
+    async def _execute(
+        self,
+        spec: JobSpec,
+        progress: ScanProgress,
+    ) -> OldAccessKeyResult:
+        """조회 조건대로 ``IAMService`` 조회 실행.
+
+        :param spec: 조회 조건
+        :param progress: 진행 상황
+        :return: 조회 결과
+        """
+        accounts = list(spec.accounts) if spec.accounts else None
+        if spec.method is JobMethod.LIST_USERS:
+            return await self._service.get_old_access_keys_from_list_users(
+                hours=spec.hours,
+                max_age=spec.max_age,
+                accounts=accounts,
+                progress=progress,
+            )
+        return await self._service.get_old_access_keys_from_credential_report(
+            hours=spec.hours,
+            refresh=spec.refresh,
+            max_age=spec.max_age,
+            accounts=accounts,
+            progress=progress,
+        )
+
+    async def _save_periodically(self, job: Job) -> None:
+        """실행 중인 작업의 진행 상황을 ``SNAPSHOT_POLL_INTERVAL``마다 저장.
+
+        :param job: 실행 중인 작업
+        """
+        if self._store is None:
+            return
+        while True:
+            await self._save(job)
+            await asyncio.sleep(settings.snapshot_poll_interval)
+
+    async def _save(self, job: Job) -> None:
+        """작업 상태(완료 시 결과 포함)를 공유 저장소에 저장.
+
+        :param job: 작업
+        """
+        store = self._store
+        if store is None:
+            return
+        now = time.time()
+        if job.result is not None:
+            payload = await asyncio.to_thread(job.result.dumps)
+            await asyncio.to_thread(store.save, JOB_RESULT, job.id, now, payload)
+        await asyncio.to_thread(store.save, JOB, job.id, now, job.dumps())
+
+    async def _expire(self) -> None:
+        """``IAM_JOB_TTL``이 지난 완료 작업 삭제 (공유 저장소 포함)."""
+        cutoff = _cutoff()
+        for job_id, job in list(self._jobs.items()):
+            if _expired(job, cutoff):
+                del self._jobs[job_id]
+
+        store = self._store
+        if store is not None:
+            for kind in (JOB, JOB_RESULT):
+                await asyncio.to_thread(store.purge, kind, cutoff)
@@ -0,0 +1,96 @@
+import sys
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+import ujson
+
+
+class KeyIdCache:
+    """(유저 이름, 생성일) → 액세스 키 ID 매핑 캐시.
+
+    키의 생성일과 ID는 바뀌지 않으므로, Credential Report의
+    (유저, last_rotated)를 ListAccessKeys 호출 없이 키 ID로 변환할 수 있다.
+    키를 교체한 유저의 항목은 ``update_user``/``retain``으로 제거한다.
+    """
+
+    def __init__(self) -> None:
+        # 유저 이름 → {생성일 epoch 초: 액세스 키 ID}
+        self._users: Dict[str, Dict[int, str]] = {}
+        # 마지막 저장 이후 변경 여부
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return sum(len(keys) for keys in self._users.values())
+
+    def get(self, user: str, created: int) -> Optional[str]:
+        """캐시된 액세스 키 ID 조회.
+
+        :param user: 유저 이름
+        :param created: 키 생성일 (epoch 초)
+        :return: 액세스 키 ID (없으면 None)
+        """
+        keys = self._users.get(user)
+        if keys is None:
+            return None
+        return keys.get(created)
+
+    def update_user(self, user: str, keys: Iterable[Tuple[datetime, str]]) -> None:
+        """유저의 현재 액세스 키 목록으로 항목 교체 (교체된 키 제거).
+
+        :param user: 유저 이름
+        :param keys: (생성일, 액세스 키 ID) 목록
+        """
+        self._users[user] = {int(created.timestamp()): key for created, key in keys}
+        self.dirty = True
+
+    def retain(self, keys: Iterable[Tuple[str, int]]) -> None:
+        """Credential Report에 남아 있는 (유저, 생성일) 항목만 유지.
+
+        :param keys: Credential Report의 (유저 이름, last_rotated epoch 초) 목록
+        """
+        active: Dict[str, Dict[int, str]] = {}
+        for user, created in keys:
+            cached = self._users.get(user)
+            if cached is None:
+                continue
+            key = cached.get(created)
+            if key is not None:
+                active.setdefault(user, {})[created] = key
+
+        # 유지할 항목은 기존 항목의 부분 집합이므로 개수로 변경 여부 판단
+        if sum(len(k) for k in active.values()) != len(self):
+            self._users = active
+            self.dirty = True
+
+    def merge(self, other: "KeyIdCache") -> None:
+        """이 캐시에 없는 유저의 항목을 다른 캐시에서 가져옴.
+
+        :param other: 다른 워커가 저장한 캐시
+        """
+        for user, keys in other._users.items():
+            self._users.setdefault(user, keys)
+
+    def dumps(self) -> bytes:
+        """공유 저장소용 직렬화 ([유저 이름, 생성일 epoch, 키 ID] 배열).
+
+        :return: 직렬화된 캐시
+        """
+        return ujson.dumps(
+            [
+                [user, created, key]
+                for user, keys in self._users.items()
+                for created, key in keys.items()
+            ]
+        ).encode()
+
+    @classmethod
+    def loads(cls, payload: bytes) -> "KeyIdCache":
+        """공유 저장소의 캐시 복원.
+
+        :param payload: ``dumps``로 직렬화된 캐시
+        :return: 키 ID 캐시
+        """
+        cache = cls()
+        for user, created, key in ujson.loads(payload):
+            cache._users.setdefault(sys.intern(user), {})[created] = key
+        return cache
@@ -1,12 +1,133 @@
+import asyncio
+from contextlib import suppress
+
 from fastapi import FastAPI
+from loguru import logger
 
+from backend.services.iam.jobs import JobManager
+from backend.services.iam.result_sets import ResultSetCache
+from backend.services.iam.scheduler import RefreshScheduler
 from backend.services.iam.service import IAMService
+from backend.settings import settings
 
 
-def init_iam_service(app: FastAPI) -> None:  # pragma: no cover
+async def init_iam_service(app: FastAPI) -> None:  # pragma: no cover
     """
     initialize iam service.
 
+    저장된 마지막 스냅샷이 있으면 AWS 조회 없이 바로 복원한다 (warm start).
+
+    :param app: fastAPI application.
+    """
+    iam_service = IAMService()
+    try:
+        await iam_service.restore()
+    except Exception as e:
+        logger.opt(exception=e).warning("Failed to restore IAM snapshots")
+    app.state.iam_service = iam_service
+
+
+def init_result_sets(app: FastAPI) -> None:  # pragma: no cover
+    """
+    initialize cursor result set cache.
+
+    :param app: fastAPI application.
+    """
+    app.state.iam_result_sets = ResultSetCache(app.state.iam_service.store)
+
+
+def init_job_manager(app: FastAPI) -> None:  # pragma: no cover
+    """
+    start asynchronous scan job workers.
+
+    :param app: fastAPI application.
+    """
+    jobs = JobManager(app.state.iam_service)
+    jobs.start()
+    app.state.iam_jobs = jobs
+
+
+async def shutdown_job_manager(app: FastAPI) -> None:  # pragma: no cover
+    """
+    stop asynchronous scan job workers.
+
+    :param app: fastAPI application.
+    """
+    jobs = getattr(app.state, "iam_jobs", None)
+    if jobs is not None:
+        await jobs.stop()
+
+
+def start_sdk_warm_up(app: FastAPI) -> None:  # pragma: no cover
+    """
+    warm up AWS SDK in background.
+
+    기동(소켓 바인딩)을 막지 않도록 ``IAM_SDK_PREWARM_DELAY``초 뒤 스레드에서
+    AWS SDK를 import하고 IAM/STS 서비스 모델을 미리 로드한다.
+    ``IAM_POOL_PREWARM``이 설정되면 이어서 계정별 연결 풀을 미리 연다.
+    ``IAM_SDK_PREWARM``이 False이면 첫 AWS 호출 시점에 로드한다.
+
+    :param app: fastAPI application.
+    """
+    app.state.iam_warm_up = None
+    if not settings.iam_sdk_prewarm:
+        return
+
+    async def warm_up() -> None:
+        await asyncio.sleep(settings.iam_sdk_prewarm_delay)
+        try:
+            await app.state.iam_service.warm_up()
+        except Exception as e:
+            logger.opt(exception=e).warning("Failed to warm up AWS SDK")
+
+    app.state.iam_warm_up = asyncio.create_task(warm_up())
+
+
+async def stop_sdk_warm_up(app: FastAPI) -> None:  # pragma: no cover
+    """
+    cancel background AWS SDK warm up.
+
+    종료 시점까지 끝나지 않은 warm up(대기 중이거나 연결 풀을 여는 중)을 취소하고
+    끝날 때까지 기다린 뒤 IAMService를 닫는다.
+
+    :param app: fastAPI application.
+    """
+    task = getattr(app.state, "iam_warm_up", None)
+    if task is None:
+        return
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+    app.state.iam_warm_up = None
+
+
+def init_refresh_scheduler(app: FastAPI) -> None:  # pragma: no cover
+    """
+    start background refresh scheduler.
+
+    ``IAM_REFRESH_INTERVAL``이 0이면 스케줄러 없이 요청 시점에만 갱신한다.
+
+    :param app: fastAPI application.
+    """
+    app.state.iam_scheduler = None
+    if settings.iam_refresh_interval <= 0:
+        return
+
+    scheduler = RefreshScheduler(
+        app.state.iam_service,
+        interval=settings.iam_refresh_interval,
+        jitter=settings.iam_refresh_jitter,
+    )
+    scheduler.start()
+    app.state.iam_scheduler = scheduler
+
+
+async def shutdown_refresh_scheduler(app: FastAPI) -> None:  # pragma: no cover
+    """
+    stop background refresh scheduler.
+
     :param app: fastAPI application.
     """
-    app.state.iam_service = IAMService()
+    scheduler = getattr(app.state, "iam_scheduler", None)
+    if scheduler is not None:
+        await scheduler.stop()
@@ -0,0 +1,82 @@
+from prometheus_client import Counter, Histogram
+
+from backend.metrics import DEFAULT_BUCKETS
+
+# IAM API 호출 시간 (토큰 버킷/세마포어 대기 제외)
+AWS_CALL_SECONDS = Histogram(
+    "iam_aws_call_duration_seconds",
+    "IAM API call latency in seconds.",
+    ["operation"],
+    buckets=DEFAULT_BUCKETS,
+)
+
+# 세마포어 + 토큰 버킷 대기 시간
+LIMITER_WAIT_SECONDS = Histogram(
+    "iam_limiter_wait_seconds",
+    "Time spent waiting on the IAM concurrency and rate limiter in seconds.",
+    ["operation"],
+    buckets=DEFAULT_BUCKETS,
+)
+
+# Throttling 응답 수 (botocore 내부 재시도 포함)
+THROTTLES = Counter(
+    "iam_throttles",
+    "IAM API responses rejected with a throttling error.",
+    ["operation"],
+)
+
+# Throttling 후 감속하여 다시 호출한 횟수
+RETRIES = Counter(
+    "iam_retries",
+    "IAM API calls retried after throttling.",
+    ["operation"],
+)
+
+# botocore 내부 재시도 수 (Throttling, 5xx, 연결 오류/제한 시간 초과)
+SDK_RETRIES = Counter(
+    "iam_sdk_retries",
+    "IAM API attempts retried inside botocore.",
+    ["operation"],
+)
+
+# 연결 오류 / 제한 시간 초과 (botocore 재시도 전 시도별)
+CONNECTION_ERRORS = Counter(
+    "iam_connection_errors",
+    "IAM API attempts failed with a connection error or timeout.",
+    ["operation", "error"],
+)
+
+# 결과를 기다리던 요청이 모두 연결을 끊어 취소된 전체 조회 수
+SWEEPS_CANCELLED = Counter(
+    "iam_sweeps_cancelled",
+    "Inventory sweeps cancelled after every waiting request disconnected.",
+)
+
+# 요청 기한을 넘겨 부분 결과로 응답한 수
+PARTIAL_RESPONSES = Counter(
+    "iam_partial_responses",
+    "Responses returned incomplete because the request deadline expired.",
+    ["endpoint"],
+)
+
+# If-None-Match가 일치하여 본문 없이 304로 응답한 수
+NOT_MODIFIED_RESPONSES = Counter(
+    "iam_not_modified_responses",
+    "Conditional requests answered with 304 Not Modified.",
+    ["endpoint"],
+)
+
+# Credential Report CSV 파싱 시간
+REPORT_PARSE_SECONDS = Histogram(
+    "iam_credential_report_parse_seconds",
+    "Credential report parse time in seconds.",
+    buckets=DEFAULT_BUCKETS,
+)
+
+# 응답한 오래된 액세스 키 수
+KEYS_RETURNED = Histogram(
+    "iam_old_access_keys_returned",
+    "Number of old access keys returned per request.",
+    ["endpoint"],
+    buckets=(0, 1, 10, 100, 1_000, 10_000, 100_000),
+)
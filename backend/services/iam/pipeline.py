@@ -0,0 +1,138 @@
+import asyncio
+from contextlib import aclosing
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Sequence,
+    TypeVar,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 입력 종료 표시
+_DONE = object()
+
+
+async def from_iterable(items: Iterable[T]) -> AsyncIterator[T]:
+    """동기 iterable을 async iterator로 변환.
+
+    :param items: 입력 iterable
+    :return: async iterator
+    """
+    for item in items:
+        yield item
+
+
+async def bounded_map(
+    source: AsyncIterable[T],
+    fn: Callable[[T], Awaitable[R]],
+    *,
+    workers: int,
+    queue_size: int,
+) -> AsyncIterator[R]:
+    """입력을 읽는 동안 고정 개수의 worker로 ``fn``을 병렬 실행하는 파이프라인.
+
+    - producer: ``source``를 읽어 bounded 입력 큐에 적재
+    - worker (고정 개수): 입력 큐에서 꺼내 ``fn`` 실행 후 결과 큐에 적재
+    - collector (호출자): 결과를 처리 완료 순서대로 수신
+
+    입력 크기와 무관하게 태스크 수/메모리가 일정하게 유지되며,
+    producer/worker의 예외는 호출자에게 다시 발생한다.
+    호출자가 순회를 중단하면 남은 태스크는 모두 취소된다.
+
+    :param source: 입력 async iterable
+    :param fn: 입력 항목별로 실행할 코루틴 함수
+    :param workers: worker 수
+    :param queue_size: 입력/결과 큐 최대 크기
+    :return: ``fn`` 결과 async iterator
+    """
+    inputs: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=queue_size)
+    results: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=queue_size)
+
+    async def produce() -> None:
+        """입력을 읽어 입력 큐에 적재 (종료 시 worker 수만큼 종료 표시)."""
+        async for item in source:
+            await inputs.put(item)
+        for _ in range(workers):
+            await inputs.put(_DONE)
+
+    async def work() -> None:
+        """입력 큐에서 꺼낸 항목을 처리하여 결과 큐에 적재."""
+        while (item := await inputs.get()) is not _DONE:
+            await results.put(await fn(item))
+        await results.put(_DONE)
+
+    tasks = [asyncio.create_task(_guard(produce(), results))]
+    tasks.extend(asyncio.create_task(_guard(work(), results)) for _ in range(workers))
+    async with aclosing(_collect(results, tasks, remaining=workers)) as collected:
+        async for result in collected:
+            yield result
+
+
+async def merge(
+    sources: Sequence[AsyncIterable[T]],
+    *,
+    concurrency: int,
+    queue_size: int,
+) -> AsyncIterator[T]:
+    """여러 async iterable을 최대 ``concurrency``개씩 동시에 읽어 하나로 합침.
+
+    항목은 도착 순서대로 내보내며, 입력의 예외는 호출자에게 다시 발생한다.
+    호출자가 순회를 중단하면 남은 태스크는 모두 취소된다.
+
+    :param sources: 입력 async iterable 목록
+    :param concurrency: 동시에 읽을 입력 수
+    :param queue_size: 결과 큐 최대 크기
+    :return: 합쳐진 async iterator
+    """
+    results: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=queue_size)
+    sem = asyncio.Semaphore(concurrency)
+
+    async def drain(source: AsyncIterable[T]) -> None:
+        """입력을 끝까지 읽어 결과 큐에 적재 (종료 시 종료 표시)."""
+        async with sem:
+            async for item in source:
+                await results.put(item)
+        await results.put(_DONE)
+
+    tasks = [asyncio.create_task(_guard(drain(s), results)) for s in sources]
+    async with aclosing(_collect(results, tasks, remaining=len(tasks))) as collected:
+        async for result in collected:
+            yield result
+
+
+async def _guard(coro: Awaitable[None], results: "asyncio.Queue[Any]") -> None:
+    """태스크 예외를 결과 큐로 전달하여 collector에서 다시 발생시킴."""
+    try:
+        await coro
+    except Exception as e:
+        await results.put(e)
+
+
+async def _collect(
+    results: "asyncio.Queue[Any]",
+    tasks: List["asyncio.Task[None]"],
+    *,
+    remaining: int,
+) -> AsyncGenerator[Any, None]:
+    """종료 표시가 ``remaining``개 모일 때까지 결과 큐를 읽음 (종료 시 태스크 정리)."""
+    try:
+        while remaining:
+            result = await results.get()
+            if result is _DONE:
+                remaining -= 1
+            elif isinstance(result, Exception):
+                raise result
+            else:
+                yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
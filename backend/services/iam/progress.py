@@ -0,0 +1,76 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class ScanProgress:
+    """조회 진행 상황 (여러 계정의 처리한 유저 수 / 전체 유저 수 합계).
+
+    계정별 조회는 시작할 때 ``start``, 전체 유저(후보) 수를 알게 되면 ``set_total``,
+    유저 하나를 처리할 때마다 ``advance``를 호출한다.
+    ``track`` 안에서 실행한 IAM API 호출 수는 ``aws_calls``에 기록된다.
+    """
+
+    def __init__(self) -> None:
+        self.users_processed = 0
+        self.aws_calls = 0
+        self._total = 0
+        self._started = False
+        # 전체 유저 수를 아직 모르는 계정 조회 수
+        self._pending = 0
+
+    @property
+    def users_total(self) -> Optional[int]:
+        """전체 유저 수 (조회 시작 전이거나 아직 모르는 계정 조회가 있으면 None)."""
+        if not self._started or self._pending:
+            return None
+        return self._total
+
+    def start(self) -> None:
+        """전체 유저 수를 모르는 계정 조회 시작."""
+        self._started = True
+        self._pending += 1
+
+    def set_total(self, count: int) -> None:
+        """``start``한 계정 조회의 전체 유저 수 확정.
+
+        :param count: 전체 유저 수
+        """
+        self._total += count
+        self._pending -= 1
+
+    def advance(self, count: int = 1) -> None:
+        """처리한 유저 수 증가.
+
+        :param count: 처리한 유저 수
+        """
+        self.users_processed += count
+
+
+# IAM API 호출 수를 기록할 진행 상황 (``track`` 안에서 시작한 태스크에도 전파)
+_tracked: ContextVar[Optional[ScanProgress]] = ContextVar(
+    "iam_tracked_progress",
+    default=None,
+)
+
+
+@contextmanager
+def track(progress: ScanProgress) -> Iterator[None]:
+    """이 블록(및 블록 안에서 시작한 태스크)의 IAM API 호출 수를 ``progress``에 기록.
+
+    다른 요청이 먼저 시작한 조회/다운로드에 합류한 경우 그 호출은 기록되지 않는다.
+
+    :param progress: 호출 수를 기록할 진행 상황
+    """
+    token = _tracked.set(progress)
+    try:
+        yield
+    finally:
+        _tracked.reset(token)
+
+
+def record_call() -> None:
+    """IAM API 호출 한 번을 ``track`` 중인 진행 상황에 기록 (없으면 무시)."""
+    progress = _tracked.get()
+    if progress is not None:
+        progress.aws_calls += 1
@@ -0,0 +1,142 @@
+import asyncio
+import time
+from typing import Any, Optional
+
+from botocore.exceptions import ClientError
+
+from backend.settings import settings
+
+# Throttling으로 간주하는 AWS 에러 코드
+THROTTLING_ERROR_CODES = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "RequestLimitExceeded",
+        "TooManyRequestsException",
+    },
+)
+
+
+def worker_share(value: float) -> float:
+    """계정 단위 예산 중 워커 프로세스 하나의 몫.
+
+    AWS IAM rate limit은 계정 단위로 적용되므로, ``WORKERS_COUNT``개 워커가
+    각자 전체 예산을 쓰지 않도록 워커 수로 나눈다.
+
+    :param value: 계정 단위 예산 (처리율, 동시성 등)
+    :return: 워커 하나의 몫
+    """
+    return value / max(settings.workers_count, 1)
+
+
+def max_concurrency() -> int:
+    """워커 하나의 계정별 동시 IAM 호출 수 (``IAM_MAX_CONCURRENCY``의 워커 몫)."""
+    return max(int(worker_share(settings.iam_max_concurrency)), 1)
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """botocore 예외가 Throttling 응답인지 확인.
+
+    :param error: 발생한 예외
+    :return: Throttling 여부
+    """
+    if not isinstance(error, ClientError):
+        return False
+    return error.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+
+
+class TokenBucket:
+    """AIMD 방식으로 처리율을 스스로 조절하는 비동기 토큰 버킷.
+
+    - 초당 ``rate`` 개의 토큰이 채워지며, 최대 ``burst`` 개까지 누적
+    - 호출 성공 시 처리율을 가산 증가 (Additive Increase, 최대 ``max_rate``)
+    - Throttling 발생 시 처리율을 곱셈 감소 (Multiplicative Decrease, 최소 ``min_rate``)
+    """
+
+    # 연속된 Throttling 응답에 대해 중복 감속을 막기 위한 최소 간격 (초)
+    _DECREASE_COOLDOWN = 1.0
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        *,
+        min_rate: float,
+        increase: float,
+        decrease: float,
+        max_rate: Optional[float] = None,
+    ) -> None:
+        """토큰 버킷 초기화.
+
+        :param rate: 초기 처리율 (초당 호출 수)
+        :param burst: 최대 누적 토큰 수
+        :param min_rate: 감속 시 하한 처리율
+        :param increase: 초당 가산 증가량 (TPS)
+        :param decrease: Throttling 시 곱해지는 감소 비율 (0 < decrease < 1)
+        :param max_rate: 증속 시 상한 처리율 (기본값: ``rate``)
+        """
+        self._rate = rate
+        self._max_rate = max_rate if max_rate is not None else rate
+        self._min_rate = min(min_rate, self._max_rate)
+        self._burst = max(burst, 1)
+        self._increase = increase
+        self._decrease = decrease
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self._last_decrease = 0.0
+        self._lock = asyncio.Lock()  # 대기 순서 보장 (FIFO)
+
+    @property
+    def rate(self) -> float:
+        """현재 처리율 (초당 호출 수)."""
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        """경과 시간만큼 토큰 충전."""
+        elapsed = now - self._updated
+        self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """토큰 1개를 획득할 때까지 대기.
+
+        :return: 대기한 시간 (초)
+        """
+        async with self._lock:
+            start = time.monotonic()
+            self._refill(start)
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill(time.monotonic())
+            self._tokens -= 1
+            return time.monotonic() - start
+
+    def on_success(self) -> None:
+        """호출 성공 시 처리율 가산 증가 (초당 ``increase`` TPS 수준)."""
+        if self._rate < self._max_rate:
+            self._rate = min(self._max_rate, self._rate + self._increase / self._rate)
+
+    def on_throttle(self) -> None:
+        """Throttling 발생 시 처리율 곱셈 감소 및 누적 토큰 소진."""
+        now = time.monotonic()
+        if now - self._last_decrease < self._DECREASE_COOLDOWN:
+            return
+        self._last_decrease = now
+        self._refill(now)
+        self._rate = max(self._min_rate, self._rate * self._decrease)
+        self._tokens = min(self._tokens, 0.0)
+
+    def observe_retry(self, response: Any = None, **kwargs: Any) -> None:
+        """botocore ``needs-retry`` 이벤트 핸들러.
+
+        botocore 내부 재시도로 가려지는 Throttling 응답도 감속에 반영한다.
+        (재시도 여부 판단에는 관여하지 않도록 항상 None 반환)
+
+        :param response: (http 응답, 파싱된 응답) 튜플
+        :param kwargs: 이벤트 인자
+        """
+        if not response:
+            return
+        code = response[1].get("Error", {}).get("Code")
+        if code in THROTTLING_ERROR_CODES:
+            self.on_throttle()
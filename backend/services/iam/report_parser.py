@@ -0,0 +1,117 @@
+import csv
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+# 루트 계정 행의 user 컬럼 값
+ROOT_ACCOUNT = b"<root_account>"
+
+# 고정 형식 시각 뒤에 붙이는 UTC 오프셋
+_UTC_SUFFIX = "+00:00"
+
+# 액세스 키 슬롯 (access_key_1, access_key_2)
+_KEY_SLOTS = (1, 2)
+
+
+def parse_epoch(value: bytes) -> Optional[int]:
+    """Credential Report의 고정 형식 UTC 시각을 strptime 없이 epoch 초로 변환.
+
+    ``YYYY-MM-DDTHH:MM:SS`` 뒤의 접미사(``Z`` 또는 ``+00:00``)는 UTC로 간주하고,
+    C로 구현된 ``datetime.fromisoformat``으로 한 번에 변환한다.
+
+    :param value: 시각 문자열 (bytes)
+    :return: epoch 초 (N/A 또는 빈 값이면 None)
+    """
+    if len(value) < 19:
+        return None
+    return int(datetime.fromisoformat(value[:19].decode() + _UTC_SUFFIX).timestamp())
+
+
+@dataclass(frozen=True)
+class ReportKeys:
+    """Credential Report 활성 키의 (유저 이름, last_rotated) 병렬 배열.
+
+    행마다 튜플/datetime을 만들지 않도록 유저 이름은 목록에 (같은 유저의 키는
+    같은 문자열 공유), last_rotated는 epoch 초 ``array('q')``에 보관한다.
+    """
+
+    users: List[str] = field(default_factory=list)
+    rotated: "array[int]" = field(default_factory=lambda: array("q"))
+
+    def __len__(self) -> int:
+        return len(self.rotated)
+
+    def __iter__(self) -> Iterator[Tuple[str, int]]:
+        return zip(self.users, self.rotated)
+
+    def append(self, user: str, rotated: int) -> None:
+        """키 추가.
+
+        :param user: 유저 이름
+        :param rotated: last_rotated (epoch 초)
+        """
+        self.users.append(user)
+        self.rotated.append(rotated)
+
+
+def _split_quoted(line: bytes) -> Sequence[bytes]:
+    """따옴표가 포함된 (드문) CSV 한 줄을 csv 모듈로 분리."""
+    row = next(csv.reader([line.decode()]))
+    return [field.encode() for field in row]
+
+
+def parse_credential_report(content: bytes) -> ReportKeys:
+    """Credential Report CSV에서 활성화된 키의 (유저 이름, last_rotated) 추출.
+
+    - 헤더에서 필요한 컬럼 위치를 한 번만 계산
+    - ``user``, ``access_key_N_active``, ``access_key_N_last_rotated`` 컬럼만 처리
+    - 디코딩/dict 생성 없이 bytes 그대로 처리
+    - 루트 계정 및 last_rotated가 없는 키는 제외
+
+    :param content: Credential Report CSV 바이트
+    :return: (유저 이름, last_rotated epoch 초) 병렬 배열
+    """
+    keys = ReportKeys()
+    lines = content.splitlines()
+    if not lines:
+        return keys
+
+    header = lines[0].split(b",")
+    user_idx = header.index(b"user")
+    slots = [
+        (
+            header.index(f"access_key_{idx}_active".encode()),
+            header.index(f"access_key_{idx}_last_rotated".encode()),
+        )
+        for idx in _KEY_SLOTS
+    ]
+    # 필요한 마지막 컬럼까지만 분리
+    maxsplit = max(user_idx, *(i for slot in slots for i in slot)) + 1
+    users_append = keys.users.append
+    rotated_append = keys.rotated.append
+
+    for line in lines[1:]:
+        if not line:
+            continue
+        if b'"' in line:
+            fields = _split_quoted(line)
+        else:
+            fields = line.split(b",", maxsplit)
+        user = fields[user_idx]
+        # 루트 계정은 무시
+        if user == ROOT_ACCOUNT:
+            continue
+
+        name: Optional[str] = None
+        for active_idx, rotated_idx in slots:
+            # 활성화된 키 중 last_rotated된 시간이 있는 키만 추가
+            if fields[active_idx] != b"true":
+                continue
+            rotated = parse_epoch(fields[rotated_idx])
+            if rotated is not None:
+                if name is None:
+                    name = user.decode()
+                users_append(name)
+                rotated_append(rotated)
+    return keys
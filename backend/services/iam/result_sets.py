@@ -0,0 +1,166 @@
+import asyncio
+import base64
+import binascii
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import ujson
+
+from backend.services.iam.inventory import OldAccessKeyResult
+from backend.services.iam.snapshot_store import SnapshotStore
+from backend.settings import settings
+
+# 공유 저장소의 결과 집합 종류 (계정 자리에 결과 집합 ID)
+RESULT_SET = "result_set"
+
+
+class InvalidCursorError(ValueError):
+    """커서를 해석할 수 없거나 다른 조회 조건의 커서인 경우 발생."""
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """다음 페이지 위치 (결과 집합 ID + 오프셋).
+
+    클라이언트에는 불투명한 토큰(base64url)으로 전달한다.
+    """
+
+    result_set: str
+    offset: int
+
+    def encode(self) -> str:
+        """커서 토큰 생성."""
+        raw = ujson.dumps([self.result_set, self.offset]).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        """커서 토큰 해석.
+
+        :param token: ``encode``로 만든 토큰
+        :return: 커서
+        :raises InvalidCursorError: 해석할 수 없는 토큰
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            result_set, offset = ujson.loads(raw)
+        except (binascii.Error, ValueError, TypeError) as e:
+            raise InvalidCursorError(f"Invalid cursor: {token}") from e
+        if not isinstance(result_set, str) or not isinstance(offset, int) or offset < 0:
+            raise InvalidCursorError(f"Invalid cursor: {token}")
+        return cls(result_set, offset)
+
+
+@dataclass
+class ResultSet:
+    """페이지 응답용으로 보관한 조회 결과."""
+
+    id: str
+    # 조회 조건 (다른 조건의 요청이 커서를 재사용하지 못하도록 확인)
+    query: str
+    result: OldAccessKeyResult
+    # 보관 시작 시각 (epoch 초)
+    created_at: float
+
+    def dumps(self) -> bytes:
+        """공유 저장소용 직렬화 (조회 조건 한 줄 + 결과)."""
+        return self.query.encode() + b"\n" + self.result.dumps()
+
+    @classmethod
+    def loads(cls, set_id: str, created_at: float, payload: bytes) -> "ResultSet":
+        """``dumps``로 직렬화된 결과 집합 복원.
+
+        :param set_id: 결과 집합 ID
+        :param created_at: 보관 시작 시각 (epoch 초)
+        :param payload: 직렬화된 결과 집합
+        :return: 결과 집합
+        """
+        query, result = payload.split(b"\n", 1)
+        return cls(set_id, query.decode(), OldAccessKeyResult.loads(result), created_at)
+
+
+class ResultSetCache:
+    """커서 페이지 응답용 조회 결과 보관소.
+
+    - 첫 페이지 요청의 조회 결과를 보관하고, 다음 페이지는 AWS 조회 없이 이 결과에서 자름
+    - 페이지를 넘기는 동안 스냅샷이 갱신되어도 같은 결과를 이어서 응답
+    - 워커당 최근 ``IAM_RESULT_SET_MAX``개를 ``IAM_RESULT_SET_TTL``초 동안 보관
+    - 공유 저장소가 있으면 다른 워커로 간 다음 페이지 요청도 응답할 수 있음
+    """
+
+    def __init__(self, store: Optional[SnapshotStore] = None) -> None:
+        """
+        :param store: 워커 간 공유 스냅샷 저장소
+        """
+        self._store = store
+        self._sets: "OrderedDict[str, ResultSet]" = OrderedDict()
+
+    async def put(self, query: str, result: OldAccessKeyResult) -> str:
+        """조회 결과 보관.
+
+        :param query: 조회 조건
+        :param result: 조회 결과
+        :return: 결과 집합 ID
+        """
+        result_set = ResultSet(uuid.uuid4().hex, query, result, time.time())
+        self._remember(result_set)
+
+        store = self._store
+        if store is not None:
+            payload = await asyncio.to_thread(result_set.dumps)
+            await asyncio.to_thread(
+                store.save,
+                RESULT_SET,
+                result_set.id,
+                result_set.created_at,
+                payload,
+            )
+            await asyncio.to_thread(store.purge, RESULT_SET, _cutoff())
+        return result_set.id
+
+    async def get(self, set_id: str, query: str) -> Optional[OldAccessKeyResult]:
+        """보관한 조회 결과 (다른 워커가 보관한 결과는 공유 저장소에서 조회).
+
+        :param set_id: 결과 집합 ID
+        :param query: 조회 조건
+        :return: 조회 결과 (없거나 만료되었으면 None)
+        :raises InvalidCursorError: 다른 조회 조건으로 만든 결과 집합
+        """
+        result_set = self._sets.get(set_id)
+        if result_set is None and self._store is not None:
+            stored = await asyncio.to_thread(self._store.load, RESULT_SET, set_id)
+            if stored is not None:
+                result_set = await asyncio.to_thread(
+                    ResultSet.loads,
+                    set_id,
+                    stored[0],
+                    stored[1],
+                )
+                self._remember(result_set)
+        if result_set is None or result_set.created_at < _cutoff():
+            return None
+        if result_set.query != query:
+            raise InvalidCursorError("Cursor does not match the request parameters")
+        return result_set.result
+
+    def _remember(self, result_set: ResultSet) -> None:
+        """결과 집합을 워커 메모리에 보관 (만료되었거나 오래된 것부터 제거).
+
+        :param result_set: 결과 집합
+        """
+        sets = self._sets
+        sets[result_set.id] = result_set
+        cutoff = _cutoff()
+        while sets:
+            oldest = next(iter(sets.values()))
+            if oldest.created_at >= cutoff and len(sets) <= settings.iam_result_set_max:
+                break
+            sets.popitem(last=False)
+
+
+def _cutoff() -> float:
+    """이 시각(epoch) 이전에 보관한 결과 집합은 만료 (``IAM_RESULT_SET_TTL``)."""
+    return time.time() - settings.iam_result_set_ttl
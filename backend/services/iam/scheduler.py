@@ -0,0 +1,58 @@
+import asyncio
+import random
+from typing import Optional
+
+from loguru import logger
+
+from backend.services.iam.service import IAMService
+
+
+class RefreshScheduler:
+    """인벤토리/Credential Report를 주기적으로 갱신하는 백그라운드 스케줄러.
+
+    요청 경로에서 AWS 조회를 기다리지 않도록 다음 실행 전에 TTL이 지날 스냅샷을
+    미리 갱신한다. (``revalidate``에 다음 실행까지의 최대 대기 시간을 넘김)
+    여러 워커/레플리카가 같은 시각에 갱신하지 않도록 주기에 jitter를 더한다.
+    """
+
+    def __init__(self, service: IAMService, *, interval: float, jitter: float) -> None:
+        """스케줄러 초기화.
+
+        :param service: 갱신할 IAMService
+        :param interval: 갱신 주기 (초)
+        :param jitter: 주기에 더할 무작위 편차 비율 (0.1이면 ±10%)
+        """
+        self._service = service
+        self._interval = interval
+        self._jitter = jitter
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def _delay(self) -> float:
+        """다음 갱신까지 대기 시간 (초, jitter 포함)."""
+        return self._interval * (1 + random.uniform(-self._jitter, self._jitter))
+
+    @property
+    def _ahead(self) -> float:
+        """다음 실행까지의 최대 대기 시간 (초, 이 안에 만료될 스냅샷을 미리 갱신)."""
+        return self._interval * (1 + self._jitter)
+
+    async def _run(self) -> None:
+        """즉시 한 번 갱신한 뒤 주기적으로 반복."""
+        while True:
+            try:
+                await self._service.revalidate(ahead=self._ahead)
+            except Exception as e:
+                logger.opt(exception=e).warning("IAM snapshot refresh failed")
+            await asyncio.sleep(self._delay())
+
+    def start(self) -> None:
+        """스케줄러 시작 (이미 실행 중이면 무시)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """스케줄러 종료 (진행 중인 갱신 취소)."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
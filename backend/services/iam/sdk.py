@@ -0,0 +1,106 @@
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+
+from backend.settings import settings
+
+if TYPE_CHECKING:
+    import aioboto3  # type: ignore  # noqa: F401
+    from aiobotocore.config import AioConfig
+
+# 클라이언트 생성 시 읽는 botocore 공통 데이터 파일
+_COMMON_DATA = ("endpoints", "partitions", "sdk-default-configuration", "_retry")
+# 서비스별 데이터 파일
+_SERVICE_DATA = ("service-2", "endpoint-rule-set-1")
+
+
+def _default_session() -> "aioboto3.Session":
+    """기본 자격 증명 체인을 사용하는 aioboto3 세션 생성."""
+    import aioboto3
+
+    return aioboto3.Session()
+
+
+def client_config() -> "AioConfig":
+    """설정으로 구성한 IAM/STS 클라이언트 botocore Config.
+
+    - 연결 풀 크기를 계정별 동시 호출 수에 맞춰 aiohttp 풀 대기를 없앰
+    - 연결/읽기 제한 시간으로 멈춘 연결이 호출을 무기한 붙잡지 않도록 함
+    - standard/adaptive 재시도 모드로 jitter 지수 백오프 적용
+
+    :return: aiobotocore 클라이언트 설정
+    """
+    from aiobotocore.config import AioConfig
+
+    from backend.services.iam.rate_limiter import max_concurrency
+
+    return AioConfig(
+        connector_args={"keepalive_timeout": settings.iam_keepalive_timeout},
+        max_pool_connections=(settings.iam_max_pool_connections or max_concurrency()),
+        connect_timeout=settings.iam_connect_timeout,
+        read_timeout=settings.iam_read_timeout,
+        tcp_keepalive=settings.iam_tcp_keepalive,
+        retries={
+            "mode": settings.iam_retry_mode.value,
+            "total_max_attempts": settings.iam_max_attempts,
+        },
+    )
+
+
+class LazySession:
+    """처음 사용할 때 생성되는 aioboto3 세션.
+
+    aioboto3/aiobotocore import(수백 ms)와 botocore 데이터 파일 로딩을 앱 기동 시점에서
+    첫 AWS 호출 시점(또는 ``warm_up``)으로 미룬다. ``client()``를 위임하므로
+    aioboto3 세션 대신 그대로 사용할 수 있다.
+    """
+
+    def __init__(
+        self,
+        factory: Optional[Callable[[], "aioboto3.Session"]] = None,
+    ) -> None:
+        """
+        :param factory: 세션 생성 함수 (기본값: 기본 자격 증명 체인)
+        """
+        self._factory = factory or _default_session
+        self._session: Optional["aioboto3.Session"] = None
+        # warm_up 스레드와 이벤트 루프에서 동시에 생성하지 않도록 보호
+        self._lock = threading.Lock()
+
+    def get(self) -> "aioboto3.Session":
+        """세션 반환 (처음 호출 시 생성).
+
+        :return: aioboto3 세션
+        """
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._factory()
+        return self._session
+
+    def client(self, service_name: str, **kwargs: Any) -> Any:
+        """aioboto3 ``Session.client`` 위임.
+
+        :param service_name: AWS 서비스 이름
+        :return: 클라이언트 컨텍스트 매니저
+        """
+        return self.get().client(service_name, **kwargs)
+
+    def data_loader(self) -> Any:
+        """세션의 botocore 데이터 로더 (로드한 모델/데이터를 캐시)."""
+        return self.get()._session.get_component("data_loader")
+
+    def warm_up(self, services: Sequence[str] = ("iam", "sts")) -> None:
+        """SDK import 및 클라이언트 생성에 필요한 데이터 파일 미리 로드.
+
+        블로킹 작업이므로 ``asyncio.to_thread``로 실행한다.
+
+        :param services: 미리 로드할 서비스 이름 목록
+        """
+        import aiobotocore.client  # noqa: F401
+
+        loader = self.data_loader()
+        for name in _COMMON_DATA:
+            loader.load_data(name)
+        for service in services:
+            for type_name in _SERVICE_DATA:
+                loader.load_service_model(service, type_name)
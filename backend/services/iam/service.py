@@ -1,13 +1,115 @@
 import asyncio
-import csv
-import io
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from backend.services.iam.account import IAMAccount
+from backend.services.iam.deadline import Deadline
+from backend.services.iam.inventory import OldAccessKeyResult, OldKey, ResultVersion
+from backend.services.iam.pipeline import merge
+from backend.services.iam.progress import ScanProgress
+from backend.services.iam.sdk import LazySession, client_config
+from backend.services.iam.snapshot_store import SnapshotStore
+from backend.settings import settings
+
+T = TypeVar("T")
+
+
+class UnknownAccountError(ValueError):
+    """설정되지 않은 AWS 계정 ID로 조회한 경우 발생."""
+
+
+def account_id_from_arn(role_arn: str) -> str:
+    """role ARN에서 AWS 계정 ID 추출.
+
+    :param role_arn: role ARN (arn:aws:iam::<account-id>:role/<name>)
+    :return: AWS 계정 ID
+    """
+    return role_arn.split(":")[4]
+
+
+class AssumeRoleCredentialProvider:
+    """AssumeRole 임시 자격 증명을 발급하는 aiobotocore credential provider.
+
+    botocore ``CredentialResolver``의 provider 인터페이스(``METHOD``, ``load``)를
+    구현하며, 세션의 ``credential_provider`` 컴포넌트로 등록하여 사용한다.
+    """
+
+    METHOD = "sts-assume-role"
+
+    def __init__(self, refresh: Callable[[], Awaitable[Dict[str, str]]]) -> None:
+        """
+        :param refresh: 임시 자격 증명 발급 함수 (botocore refreshable 형식 dict 반환)
+        """
+        self._refresh = refresh
+
+    async def load(self) -> Any:
+        """처음 사용할 때 발급되고 만료 전에 다시 발급되는 자격 증명.
+
+        :return: aiobotocore deferred refreshable credentials
+        """
+        from aiobotocore.credentials import AioDeferredRefreshableCredentials
+
+        return AioDeferredRefreshableCredentials(
+            refresh_using=self._refresh,
+            method=self.METHOD,
+        )
+
+
+def assume_role_session(
+    base_session: LazySession,
+    role_arn: str,
+) -> LazySession:
+    """AssumeRole 자격 증명을 사용하는 aioboto3 세션 생성.
+
+    자격 증명은 처음 사용할 때 발급되어 캐시되며,
+    만료되기 전에 botocore refreshable credentials가 자동으로 다시 발급한다.
+    기본 자격 증명 체인 대신 ``AssumeRoleCredentialProvider``만 사용한다.
+    botocore 데이터 로더는 기본 세션과 공유하여 서비스 모델을 한 번만 읽는다.
+
+    :param base_session: AssumeRole을 호출할 기본 세션
+    :param role_arn: 대상 계정의 role ARN
+    :return: 대상 계정 세션 (처음 사용할 때 생성)
+    """
 
-import aioboto3  # type: ignore
-from botocore.client import BaseClient
+    async def refresh() -> Dict[str, str]:
+        """STS AssumeRole로 임시 자격 증명 발급."""
+        async with base_session.client("sts", config=client_config()) as sts:
+            resp = await sts.assume_role(
+                RoleArn=role_arn,
+                RoleSessionName=settings.iam_role_session_name,
+                DurationSeconds=settings.iam_role_duration,
+            )
+        creds = resp["Credentials"]
+        return {
+            "access_key": creds["AccessKeyId"],
+            "secret_key": creds["SecretAccessKey"],
+            "token": creds["SessionToken"],
+            "expiry_time": creds["Expiration"].isoformat(),
+        }
+
+    def create() -> Any:
+        import aioboto3  # type: ignore
+        from aiobotocore.credentials import AioCredentialResolver
+        from aiobotocore.session import AioSession
+
+        botocore_session = AioSession()
+        botocore_session.register_component("data_loader", base_session.data_loader())
+        botocore_session.register_component(
+            "credential_provider",
+            AioCredentialResolver([AssumeRoleCredentialProvider(refresh)]),
+        )
+        return aioboto3.Session(botocore_session=botocore_session)
+
+    return LazySession(create)
 
-from backend.web.api.iam.schema import OldAccessKey
 
 # ---------------------------------------------------------------------------
 # IAMService
@@ -15,220 +117,296 @@ from backend.web.api.iam.schema import OldAccessKey
 
 
 class IAMService:
-    """재사용 가능한, 비동기 친화적인 IAM 액세스 키 관리를 위한 도우미.
+    """여러 AWS 계정의 오래된 IAM 액세스 키 조회를 묶는 진입점.
 
-    - 싱글톤 aioboto3 클라이언트 (비동기 락)
-    - 세마포어로 동시성 제한 (AWS IAM API rate limit 보호)
-    - 오래된 액세스 키 조회를 위한 두 가지 public 메서드 제공
+    - ``IAM_ROLE_ARNS``가 설정되면 role ARN별 AssumeRole 세션으로 계정 풀을 구성
+      (계정마다 독립된 클라이언트/rate budget/캐시)
+    - 설정되지 않으면 기본 자격 증명의 단일 계정으로 동작
+    - 계정은 최대 ``IAM_ACCOUNT_CONCURRENCY``개까지 동시에 조회
     """
 
-    _TIME_FMT = "%Y-%m-%dT%H:%M:%SZ"
-
     # ---------------------------- life‑cycle ----------------------------
     def __init__(self) -> None:
-        """aioboto3 세션 및 싱글톤 클라이언트, 락/세마포어 초기화."""
+        """기본 aioboto3 세션 및 계정 풀 초기화.
+
+        aioboto3 세션은 처음 사용할 때 생성된다. (``warm_up``으로 미리 로드 가능)
+        """
+
+        session = LazySession()
+        self._session = session
+        role_arns = [arn.strip() for arn in settings.iam_role_arns.split(",")]
+        role_arns = [arn for arn in role_arns if arn]
+        store = (
+            SnapshotStore(settings.snapshot_dir) if settings.snapshot_store else None
+        )
+        self._store = store
+
+        self._accounts: List[IAMAccount] = [
+            IAMAccount(
+                assume_role_session(session, arn),
+                account_id=account_id_from_arn(arn),
+                store=store,
+            )
+            for arn in role_arns
+        ] or [IAMAccount(session, store=store)]
+        self._account_sem = asyncio.Semaphore(settings.iam_account_concurrency)
+
+    @property
+    def accounts(self) -> List[IAMAccount]:
+        """조회 대상 계정 목록."""
+        return self._accounts
+
+    @property
+    def store(self) -> Optional[SnapshotStore]:
+        """워커 간 공유 스냅샷 저장소 (비활성화 시 None)."""
+        return self._store
+
+    async def warm_up(self) -> None:
+        """AWS SDK import 및 IAM/STS 클라이언트 데이터 파일을 스레드에서 미리 로드.
+
+        기동 직후 백그라운드에서 실행하여 첫 요청의 클라이언트 생성 지연을 줄인다.
+        ``IAM_POOL_PREWARM``이 설정되면 계정별 클라이언트를 만들고 연결을 미리 연다.
+        """
+        await asyncio.to_thread(self._session.warm_up)
+        if settings.iam_pool_prewarm <= 0:
+            return
+
+        async def run(account: IAMAccount) -> None:
+            async with self._account_sem:
+                await account.warm_up_pool(settings.iam_pool_prewarm)
+
+        await asyncio.gather(*(run(account) for account in self._accounts))
+
+    async def restore(self) -> None:
+        """모든 계정의 캐시를 저장된 마지막 스냅샷으로 복원 (warm start)."""
+        await asyncio.gather(*(account.restore() for account in self._accounts))
 
-        self._session = aioboto3.Session()
-        self._client: Optional[BaseClient] = None
-        self._lock = asyncio.Lock()  # double‑check locking
-        self._sem = asyncio.Semaphore(5)  # IAM ≈ 10 TPS → 5 동시 호출 정도로 제한
+    async def revalidate(self, *, ahead: float = 0) -> None:
+        """모든 계정의 없거나 ``ahead``초 안에 TTL이 지나는 인벤토리/Credential Report 갱신.
+
+        :param ahead: 만료 전에 미리 갱신할 시간 (초)
+        """
+
+        async def run(account: IAMAccount) -> None:
+            async with self._account_sem:
+                await account.revalidate(ahead=ahead)
+
+        await asyncio.gather(*(run(account) for account in self._accounts))
 
     async def close(self) -> None:
-        """싱글톤 클라이언트 종료 (자원 해제).
+        """모든 계정의 백그라운드 작업 및 클라이언트 종료 (자원 해제).
 
         서비스 종료 시 반드시 호출 필요
         """
-        if self._client is not None:
-            await self._client.__aexit__(None, None, None)
-            self._client = None
+        await asyncio.gather(*(account.close() for account in self._accounts))
 
-    # --------------------------- low‑level I/O ---------------------------
-    async def _client_async(self) -> BaseClient:
+    # ------------------------------ fan-out ------------------------------
+    def select(self, account_ids: Optional[List[str]]) -> List[IAMAccount]:
+        """조회할 계정 선택.
+
+        :param account_ids: 계정 ID 목록 (None이면 전체 계정)
+        :return: 선택된 계정 목록
         """
-        싱글톤 IAM 클라이언트 반환 (비동기 락으로 중복 생성 방지)
+        if account_ids is None:
+            return self._accounts
+
+        known = {account.account_id: account for account in self._accounts}
+        unknown = [i for i in account_ids if i not in known]
+        if unknown:
+            raise UnknownAccountError(f"Unknown AWS account: {', '.join(unknown)}")
+        return [known[i] for i in dict.fromkeys(account_ids)]
+
+    async def _fan_out(
+        self,
+        accounts: List[IAMAccount],
+        fn: Callable[[IAMAccount], Awaitable[T]],
+    ) -> List[T]:
+        """계정별 조회를 ``IAM_ACCOUNT_CONCURRENCY``개씩 동시에 실행.
+
+        :param accounts: 조회할 계정 목록
+        :param fn: 계정별 조회 함수
+        :return: 계정 순서대로의 조회 결과
         """
-        # 이미 생성된 경우 반환
-        if self._client is None:
-            async with self._lock:
-                if self._client is None:  # double check
-                    self._client = await self._session.client("iam").__aenter__()
 
-        # 클라이언트가 여전히 None인 경우 예외 발생
-        assert self._client is not None
+        async def run(account: IAMAccount) -> T:
+            async with self._account_sem:
+                return await fn(account)
 
-        # 클라이언트 반환
-        return self._client
+        return list(await asyncio.gather(*(run(account) for account in accounts)))
 
-    async def _generate_credential_report(
+    async def _gather(
         self,
-        client: BaseClient,
-        *,
-        max_attempts: int = 10,
-        delay: int = 2,
-    ) -> None:
-        """IAM Credential Report 생성 (비동기 폴링).
-
-        - IN_PROGRESS 상태일 경우 delay 간격으로 재시도
-        - 실패/타임아웃 시 예외 발생
-
-        :param client: IAM 클라이언트
-        :param max_attempts: 최대 재시도 횟수
-        :param delay: 재시도 간격 (초)
-        :return: None
-        """
-        # 자격 증명 보고서 생성
-        resp = await client.generate_credential_report()
-        state = resp["State"]
-        attempt = 0
-
-        # 생성 완료 또는 최대 재시도 횟수 도달 시 종료
-        while state == "IN_PROGRESS" and attempt < max_attempts:
-            await asyncio.sleep(delay)
-            resp = await client.generate_credential_report()
-            state = resp["State"]
-            attempt += 1
-
-        # 생성 실패 시 예외 발생
-        if state != "COMPLETE":
-            raise RuntimeError(f"Credential report generation failed: {state}")
-
-    async def _fetch_keys_for_user(
+        accounts: List[IAMAccount],
+        fn: Callable[[IAMAccount], Awaitable[OldAccessKeyResult]],
+    ) -> OldAccessKeyResult:
+        """계정별 조회를 동시에 실행하여 결과 병합.
+
+        :param accounts: 조회할 계정 목록
+        :param fn: 계정별 조회 함수
+        :return: 병합된 조회 결과
+        """
+        return OldAccessKeyResult.merge(await self._fan_out(accounts, fn))
+
+    def _merge(
         self,
-        client: BaseClient,
-        user: str,
-    ) -> List[Dict[str, Any]]:
-        """ListAccessKeys API를 rate-limit 하여 호출 (세마포어 사용).
+        accounts: List[IAMAccount],
+        fn: Callable[[IAMAccount], AsyncIterator[OldKey]],
+    ) -> AsyncIterator[OldKey]:
+        """계정별 스트림을 동시에 읽어 도착 순서대로 합침.
 
-        :param client: IAM 클라이언트
-        :param user: 유저 이름
-        :return: 액세스 키 목록
-        """
-        # 세마포어 사용
-        async with self._sem:
-            return (await client.list_access_keys(UserName=user))["AccessKeyMetadata"]
+        ``_fan_out``과 같은 세마포어로 다른 요청을 포함해 동시에 읽는 계정 수를
+        ``IAM_ACCOUNT_CONCURRENCY``개로 제한한다.
 
-    # -------------------------- helper utilities -------------------------
-    @classmethod
-    def _parse_dt(cls, s: str) -> Optional[datetime]:
-        """
-        AWS ISO8601 문자열을 datetime 객체로 변환
+        :param accounts: 조회할 계정 목록
+        :param fn: 계정별 스트리밍 조회 함수
+        :return: 합쳐진 오래된 액세스 키 async iterator
         """
-        # N/A 또는 빈 문자열인 경우 None 반환
-        if not s or s == "N/A":
-            return None
 
-        # 시간 문자열 파싱
-        return datetime.strptime(s, cls._TIME_FMT).replace(tzinfo=timezone.utc)
+        async def run(account: IAMAccount) -> AsyncIterator[OldKey]:
+            async with self._account_sem:
+                async for key in fn(account):
+                    yield key
+
+        if len(accounts) == 1:
+            return run(accounts[0])
+        return merge(
+            [run(account) for account in accounts],
+            concurrency=settings.iam_account_concurrency,
+            queue_size=settings.iam_sweep_queue_size,
+        )
 
     # ---------------------------- public API ----------------------------
+    def iter_old_access_keys_from_list_users(
+        self,
+        *,
+        hours: int,
+        max_age: Optional[float] = None,
+        accounts: Optional[List[str]] = None,
+    ) -> AsyncIterator[OldKey]:
+        """계정별 액세스 키 인벤토리에서 생성된 지 N시간 이상된 키를 스트리밍.
+
+        :param hours: 임계값 (시간)
+        :param max_age: 허용할 최대 데이터 경과 시간 (초, 초과 시 다시 조회)
+        :param accounts: 조회할 계정 ID 목록 (None이면 전체 계정)
+        :return: 오래된 액세스 키 async iterator
+        """
+        return self._merge(
+            self.select(accounts),
+            lambda account: account.iter_old_access_keys_from_list_users(
+                hours=hours,
+                max_age=max_age,
+            ),
+        )
+
     async def get_old_access_keys_from_list_users(
-        self, *, hours: int
-    ) -> List[OldAccessKey]:
-        """모든 유저의 액세스 키를 brute-force로 조회하여, 생성된 지 N시간 이상된 키를 반환.
+        self,
+        *,
+        hours: int,
+        max_age: Optional[float] = None,
+        accounts: Optional[List[str]] = None,
+        deadline: Optional[Deadline] = None,
+        progress: Optional[ScanProgress] = None,
+    ) -> OldAccessKeyResult:
+        """계정별 액세스 키 인벤토리에서 생성된 지 N시간 이상된 키를 반환.
         (ListUsers + ListAccessKeys 조합, 비용↑)
 
         :param hours: 임계값 (시간)
-        :return: 오래된 액세스 키 목록
-        """
-        # 클라이언트 초기화
-        client = await self._client_async()
-
-        # 임계값 계산
-        threshold = datetime.now(timezone.utc) - timedelta(hours=hours)
-
-        # 모든 유저 목록 수집
-        users: List[str] = []
-
-        # 모든 유저 목록 조회 (루트 계정 포함), 페이지네이터 사용
-        paginator = client.get_paginator("list_users")
-        pages = paginator.paginate()
-        async for page in pages:  # type: ignore
-            users.extend(u["UserName"] for u in page["Users"])
-
-        async def process(user: str) -> List[OldAccessKey]:
-            """각 유저의 액세스 키 중 임계값 이전 생성된 것만 필터링.
-
-            :param user: 유저 이름
-            :return: 오래된 액세스 키 목록
-            """
-            # 유저의 액세스 키 목록 조회
-            keys = await self._fetch_keys_for_user(client, user)
-
-            # 임계값 이전 생성된 것만 필터링
-            return [
-                OldAccessKey(
-                    user_name=user,
-                    access_key_id=k["AccessKeyId"],
-                    created_date=k["CreateDate"],
-                )
-                for k in keys
-                if k["CreateDate"] < threshold
-            ]
-
-        # 모든 유저의 오래된 액세스 키 목록 수집
-        batches = await asyncio.gather(*(process(u) for u in users))
-        return [item for sub in batches for item in sub]
-
-    async def get_old_access_keys_from_credential_report(
-        self, *, hours: int
-    ) -> List[OldAccessKey]:
-        """Credential Report를 우선 활용해 후보를 추린 뒤, 실제 키 ID 조회는 ListAccessKeys로 제한적으로 호출 (비용↓).
+        :param max_age: 허용할 최대 데이터 경과 시간 (초, 초과 시 다시 조회)
+        :param accounts: 조회할 계정 ID 목록 (None이면 전체 계정)
+        :param deadline: 요청 처리 기한 (넘기면 계정별 부분 결과 병합)
+        :param progress: 진행 상황 (계정별 처리한 유저 수 합계)
+        :return: 오래된 액세스 키 목록 및 데이터 기준 시각
+        """
+        return await self._gather(
+            self.select(accounts),
+            lambda account: account.get_old_access_keys_from_list_users(
+                hours=hours,
+                max_age=max_age,
+                deadline=deadline,
+                progress=progress,
+            ),
+        )
+
+    async def get_old_access_keys_version_from_list_users(
+        self,
+        *,
+        hours: int,
+        max_age: Optional[float] = None,
+        accounts: Optional[List[str]] = None,
+    ) -> Optional[ResultVersion]:
+        """``get_old_access_keys_from_list_users`` 응답의 내용 버전 (키 목록을 만들지 않음).
 
         :param hours: 임계값 (시간)
-        :return: 오래된 액세스 키 목록
-        """
-        # 클라이언트 초기화
-        client = await self._client_async()
-
-        # 자격 증명 보고서 생성
-        await self._generate_credential_report(client)
-
-        # 자격 증명 보고서 조회
-        report_bytes = (await client.get_credential_report())["Content"]
-
-        # 임계값 계산
-        threshold = datetime.now(timezone.utc) - timedelta(hours=hours)
-        reader = csv.DictReader(io.StringIO(report_bytes.decode()))
-
-        # (user, rotated_at) 검사 대상 유저 목록
-        users: List[Tuple[str, datetime]] = []
-        for row in reader:
-            user = row["user"]
-            # 루트 계정은 무시
-            if user == "<root_account>":
-                continue
-
-            # 활성화된 키 중 last_rotated된 시간이 임계값 이전인 것만 추려냄
-            for idx in (1, 2):
-                # 활성화된 키만 처리
-                if row[f"access_key_{idx}_active"] != "true":
-                    continue
-
-                # last_rotated된 시간이 있고, 임계값 이전인 경우 검사 대상에 추가
-                rotated = self._parse_dt(row[f"access_key_{idx}_last_rotated"])
-                if rotated and rotated < threshold:
-                    users.append((user, rotated))
-
-        async def id_for(user: str, rotated_at: datetime) -> Optional[OldAccessKey]:
-            """검사 대상 유저의 액세스 키 중 생성일이 정확히 일치하는 키만 반환.
-
-            :param user: 유저 이름
-            :param rotated_at: 회전 일시
-            :return: 오래된 액세스 키 목록
-            """
-            # 유저의 액세스 키 목록 조회
-            keys = await self._fetch_keys_for_user(client, user)
-
-            # 생성일이 정확히 일치하는 키만 반환
-            for k in keys:
-                # IAM 시간은 초 단위로 정확하므로, 엄격한 동등성 검사 가능
-                if k["CreateDate"] == rotated_at:
-                    return OldAccessKey(
-                        user_name=user,
-                        access_key_id=k["AccessKeyId"],
-                        created_date=k["CreateDate"],
-                    )
+        :param max_age: 허용할 최대 데이터 경과 시간 (초)
+        :param accounts: 조회할 계정 ID 목록 (None이면 전체 계정)
+        :return: 내용 버전 (전체 조회를 기다려야 하는 계정이 있으면 None)
+        """
+        versions = await self._fan_out(
+            self.select(accounts),
+            lambda account: account.get_old_access_keys_version_from_list_users(
+                hours=hours,
+                max_age=max_age,
+            ),
+        )
+        known = [v for v in versions if v is not None]
+        if len(known) < len(versions):
             return None
+        return ResultVersion.merge(known)
+
+    def iter_old_access_keys_from_credential_report(
+        self,
+        *,
+        hours: int,
+        refresh: bool = False,
+        max_age: Optional[float] = None,
+        accounts: Optional[List[str]] = None,
+    ) -> AsyncIterator[OldKey]:
+        """계정별 Credential Report에서 생성된 지 N시간 이상된 키를 스트리밍.
+
+        :param hours: 임계값 (시간)
+        :param refresh: Credential Report 캐시를 무시하고 AWS에서 다시 받아올지 여부
+            (AWS가 4시간 이내 보고서를 재사용하므로 새 보고서 생성은 강제하지 못함)
+        :param max_age: 허용할 최대 데이터 경과 시간 (초, 초과 시 다시 조회)
+        :param accounts: 조회할 계정 ID 목록 (None이면 전체 계정)
+        :return: 오래된 액세스 키 async iterator
+        """
+        return self._merge(
+            self.select(accounts),
+            lambda account: account.iter_old_access_keys_from_credential_report(
+                hours=hours,
+                refresh=refresh,
+                max_age=max_age,
+            ),
+        )
+
+    async def get_old_access_keys_from_credential_report(
+        self,
+        *,
+        hours: int,
+        refresh: bool = False,
+        max_age: Optional[float] = None,
+        accounts: Optional[List[str]] = None,
+        deadline: Optional[Deadline] = None,
+        progress: Optional[ScanProgress] = None,
+    ) -> OldAccessKeyResult:
+        """계정별 Credential Report에서 생성된 지 N시간 이상된 키를 반환 (비용↓).
 
-        results = await asyncio.gather(*(id_for(u, t) for u, t in users))
-        return [r for r in results if r is not None]
+        :param hours: 임계값 (시간)
+        :param refresh: Credential Report 캐시를 무시하고 AWS에서 다시 받아올지 여부
+            (AWS가 4시간 이내 보고서를 재사용하므로 새 보고서 생성은 강제하지 못함)
+        :param max_age: 허용할 최대 데이터 경과 시간 (초, 초과 시 다시 조회)
+        :param accounts: 조회할 계정 ID 목록 (None이면 전체 계정)
+        :param deadline: 요청 처리 기한 (넘기면 계정별 부분 결과 병합)
+        :param progress: 진행 상황 (계정별 처리한 유저 수 합계)
+        :return: 오래된 액세스 키 목록 및 데이터 기준 시각
+        """
+        return await self._gather(
+            self.select(accounts),
+            lambda account: account.get_old_access_keys_from_credential_report(
+                hours=hours,
+                refresh=refresh,
+                max_age=max_age,
+                deadline=deadline,
+                progress=progress,
+            ),
+        )
@@ -0,0 +1,44 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """동일 키에 대한 동시 호출을 하나의 실행으로 합치는 도우미.
+
+    - 진행 중인 실행이 있으면 새로 시작하지 않고 그 결과를 함께 기다림
+    - 실행은 별도 태스크로 돌기 때문에, 대기자가 취소되어도 중단되지 않음
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, "asyncio.Future[T]"] = {}
+
+    def running(self, key: Hashable) -> bool:
+        """키에 대한 실행이 진행 중인지 확인.
+
+        :param key: 실행 키
+        :return: 진행 중 여부
+        """
+        return key in self._inflight
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """키에 대한 실행을 시작하거나, 진행 중인 실행에 합류.
+
+        :param key: 실행 키
+        :param fn: 실행할 코루틴 함수
+        :return: 실행 결과
+        """
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(fn())
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(fut)
+
+    def _forget(self, key: Hashable, fut: "asyncio.Future[T]") -> None:
+        """완료된 실행 정리 (대기자가 없어도 예외가 유실 경고를 남기지 않도록 회수)."""
+        if self._inflight.get(key) is fut:
+            del self._inflight[key]
+        if not fut.cancelled():
+            fut.exception()
@@ -0,0 +1,147 @@
+import fcntl
+import os
+import sqlite3
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Protocol, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    kind TEXT NOT NULL,
+    account TEXT NOT NULL,
+    generated_at REAL NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (kind, account)
+)
+"""
+
+
+class SharedSnapshot(Protocol):
+    """공유 저장소에 저장할 수 있는 스냅샷."""
+
+    @property
+    def fetched_at(self) -> float:
+        """저장소 기준 시각 (epoch 초, 이 워커가 AWS에서 조회한 시각)."""
+        ...
+
+    def dumps(self) -> bytes:
+        """저장용 직렬화."""
+        ...
+
+
+class RefreshLock:
+    """스냅샷 갱신 권한을 가진 워커가 보유하는 파일 락."""
+
+    def __init__(self, fd: int) -> None:
+        self._fd: Optional[int] = fd
+
+    def release(self) -> None:
+        """락 해제."""
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+class SnapshotStore:
+    """워커 프로세스 간에 공유되는 SQLite 스냅샷 저장소.
+
+    - (종류, 계정)별 최신 스냅샷 하나를 압축하여 보관 (WAL 모드로 동시 읽기 허용)
+    - 프로세스가 재시작되어도 남아 있어 warm start에 사용
+    - 파일 락으로 갱신할 워커 하나를 선출하고, 나머지 워커는 저장된 스냅샷을 읽음
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """저장소 디렉토리 및 스키마 초기화.
+
+        :param directory: SQLite 파일과 락 파일을 둘 디렉토리
+        """
+        self._directory = directory
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._path = directory / "snapshots.sqlite3"
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """호출마다 새 연결 생성 후 커밋/종료 (스레드/프로세스 간 공유하지 않음)."""
+        conn = sqlite3.connect(self._path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def load(
+        self,
+        kind: str,
+        account: str,
+        *,
+        newer_than: Optional[float] = None,
+    ) -> Optional[Tuple[float, bytes]]:
+        """저장된 스냅샷 조회.
+
+        :param kind: 스냅샷 종류
+        :param account: 계정 키
+        :param newer_than: 이 시각보다 새로운 스냅샷만 조회 (epoch 초)
+        :return: (기준 시각, payload) 또는 None
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT generated_at, payload FROM snapshots "
+                "WHERE kind = ? AND account = ? AND generated_at > ?",
+                (kind, account, newer_than if newer_than is not None else -1.0),
+            ).fetchone()
+        return (row[0], zlib.decompress(row[1])) if row else None
+
+    def save(
+        self, kind: str, account: str, generated_at: float, payload: bytes
+    ) -> None:
+        """스냅샷 저장 (더 오래된 스냅샷으로 덮어쓰지 않음).
+
+        :param kind: 스냅샷 종류
+        :param account: 계정 키
+        :param generated_at: 기준 시각 (epoch 초)
+        :param payload: 직렬화된 스냅샷
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO snapshots (kind, account, generated_at, payload) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (kind, account) DO UPDATE SET "
+                "generated_at = excluded.generated_at, payload = excluded.payload "
+                "WHERE excluded.generated_at >= snapshots.generated_at",
+                (kind, account, generated_at, zlib.compress(payload, 1)),
+            )
+
+    def purge(self, kind: str, older_than: float) -> int:
+        """기준 시각이 ``older_than`` 이전인 스냅샷 삭제.
+
+        :param kind: 스냅샷 종류
+        :param older_than: 삭제 기준 시각 (epoch 초)
+        :return: 삭제한 스냅샷 수
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM snapshots WHERE kind = ? AND generated_at < ?",
+                (kind, older_than),
+            )
+        return cursor.rowcount
+
+    def try_lock(self, kind: str, account: str) -> Optional[RefreshLock]:
+        """갱신 권한 획득 시도 (대기하지 않음).
+
+        :param kind: 스냅샷 종류
+        :param account: 계정 키
+        :return: 획득한 락 (다른 워커가 갱신 중이면 None)
+        """
+        path = self._directory / f"{kind}-{account}.lock"
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        return RefreshLock(fd)
@@ -20,6 +20,21 @@ class LogLevel(str, enum.Enum):  # noqa: WPS600
     FATAL = "FATAL"
 
 
+class LogFormat(str, enum.Enum):  # noqa: WPS600
+    """Possible log output formats."""
+
+    TEXT = "TEXT"
+    JSON = "JSON"
+
+
+class RetryMode(str, enum.Enum):  # noqa: WPS600
+    """botocore retry modes."""
+
+    LEGACY = "legacy"
+    STANDARD = "standard"
+    ADAPTIVE = "adaptive"
+
+
 class Settings(BaseSettings):
     """
     Application settings.
@@ -35,11 +50,19 @@ class Settings(BaseSettings):
     workers_count: int = 1
     # Enable uvicorn reloading
     reload: bool = False
+    # 워커가 여러 개일 때 /metrics가 합산할 워커별 메트릭 파일 디렉토리 (기동 시 비움)
+    metrics_dir: Path = TEMP_DIR / "musinsa_sre_metrics"
 
     # Current environment
     environment: str = "local"
 
     log_level: LogLevel = LogLevel.INFO
+    # 로그 출력 형식 (TEXT: 사람이 읽는 형식, JSON: 한 줄에 JSON 레코드 하나)
+    log_format: LogFormat = LogFormat.TEXT
+    # 로그 출력을 별도 스레드에서 처리 (이벤트 루프에서 stdout 쓰기 제거)
+    log_enqueue: bool = False
+    # 접근 로그 샘플링 비율 (0~1, 4xx/5xx 응답은 항상 기록)
+    log_access_sample_rate: float = 1.0
 
     # openapi server
     openapi_server: str = "http://localhost:8000"
@@ -52,6 +75,95 @@ class Settings(BaseSettings):
     aws_access_key_id: str = ""
     aws_secret_access_key: str = ""
 
+    # IAM API rate limit (AIMD 토큰 버킷)
+    # IAM ≈ 10 TPS → 여유를 두고 초당 8회, 동시 호출 5개로 제한
+    # 계정 단위 예산이며, 워커 프로세스마다 WORKERS_COUNT로 나눈 몫을 사용
+    iam_rate_limit: float = 8.0
+    iam_rate_burst: int = 5
+    iam_rate_min: float = 1.0
+    # 호출 성공 시 초당 가산 증가량 (TPS) / Throttling 시 감소 비율
+    iam_rate_increase: float = 0.5
+    iam_rate_decrease: float = 0.5
+    iam_max_concurrency: int = 5
+    # Throttling 응답에 대한 최대 재시도 횟수
+    iam_throttle_retries: int = 5
+
+    # 기동 후 백그라운드 스레드에서 AWS SDK import 및 IAM/STS 모델 미리 로드
+    # False이면 첫 AWS 호출 시점에 로드 (기동 시 CPU 사용 최소화)
+    iam_sdk_prewarm: bool = True
+    # 미리 로드 시작 지연 (초, 소켓 바인딩/첫 헬스 체크와 CPU를 경쟁하지 않도록)
+    iam_sdk_prewarm_delay: float = 0.5
+
+    # IAM/STS 클라이언트 botocore Config (계정별 클라이언트마다 적용)
+    # 연결 풀 크기 (0이면 IAM_MAX_CONCURRENCY와 같게 맞춰 풀 대기 없이 동시 호출)
+    iam_max_pool_connections: int = 0
+    # 연결 / 응답 읽기 제한 시간 (초, 멈춘 연결 하나가 전체 조회를 붙잡지 않도록)
+    iam_connect_timeout: float = 5.0
+    iam_read_timeout: float = 15.0
+    # 유휴 연결 유지 시간 (초) / TCP keepalive
+    iam_keepalive_timeout: float = 12.0
+    iam_tcp_keepalive: bool = True
+    # botocore 재시도 모드 (standard/adaptive: jitter 지수 백오프)와 최대 시도 횟수 (첫 호출 포함)
+    iam_retry_mode: RetryMode = RetryMode.STANDARD
+    iam_max_attempts: int = 3
+    # SDK 미리 로드 후 계정별로 미리 열어 둘 연결 수 (0이면 첫 호출 시 연결)
+    iam_pool_prewarm: int = 0
+
+    # 멀티 계정 모드: AssumeRole 대상 role ARN (쉼표 구분)
+    # 비어 있으면 기본 자격 증명의 단일 계정으로 동작
+    iam_role_arns: str = ""
+    iam_role_session_name: str = "musinsa-sre"
+    # AssumeRole 자격 증명 유효 시간 (초, 만료 전 자동 갱신)
+    iam_role_duration: int = 3600
+    # 동시에 조회할 계정 수 (rate budget은 계정별로 적용)
+    iam_account_concurrency: int = 10
+
+    # list-users 조회 파이프라인 (ListAccessKeys worker 수 / 큐 크기)
+    iam_sweep_workers: int = 5
+    iam_sweep_queue_size: int = 1000
+
+    # JSON 응답 기본 기한 (초, 0이면 없음, 요청의 timeout 파라미터가 우선)
+    # ingress 제한 시간보다 짧게 두면 끊기기 전에 부분 결과로 응답
+    iam_request_timeout: float = 0
+
+    # 비동기 조회 작업 (worker 수 / 대기열 크기 / 완료 후 보관 시간(초))
+    iam_job_workers: int = 2
+    iam_job_queue_size: int = 100
+    iam_job_ttl: int = 60 * 60
+
+    # 페이지 응답 (기본 페이지 크기 / 커서 결과 집합 보관 시간(초) / 워커당 보관 개수)
+    # 첫 페이지 조회 결과를 서버에 보관하고, 다음 페이지는 커서로 이 결과에서 잘라 응답
+    iam_page_size: int = 1000
+    iam_result_set_ttl: int = 600
+    iam_result_set_max: int = 100
+
+    # list-users 인벤토리 갱신 주기 (초)
+    # TTL이 지난 인벤토리는 그대로 응답하고, 백그라운드에서 갱신
+    inventory_ttl: int = 300
+
+    # Credential Report 캐시 유효 시간 (초, AWS에서 받아온 시각 기준)
+    # AWS는 4시간 이내에 생성한 보고서를 재사용하므로 데이터는 최대 4시간 + TTL 경과할 수 있음
+    credential_report_ttl: int = 4 * 60 * 60
+    # Credential Report 생성 폴링 (첫 대기 간격 / 최대 대기 간격 / 전체 제한 시간, 초)
+    # 대기 간격은 두 배씩 늘어남
+    credential_report_poll_initial: float = 0.25
+    credential_report_poll_max: float = 5.0
+    credential_report_timeout: float = 300.0
+
+    # 인벤토리/Credential Report 백그라운드 갱신 주기 (초, 0이면 비활성화)
+    # 주기마다 다음 실행 전(주기 + jitter 안)에 TTL이 지날 스냅샷을 미리 갱신하여
+    # 요청은 항상 메모리에서 응답 (TTL이 주기보다 짧으면 매 주기 갱신)
+    iam_refresh_interval: int = 60
+    # 갱신 주기 jitter 비율 (워커/레플리카 간 동시 갱신 방지)
+    iam_refresh_jitter: float = 0.1
+
+    # 워커 간 공유 스냅샷 저장소 (SQLite + 파일 락)
+    # 갱신 락을 얻은 워커 하나만 AWS를 조회하고, 나머지 워커는 저장된 스냅샷을 사용
+    snapshot_store: bool = True
+    snapshot_dir: Path = TEMP_DIR / "musinsa_sre"
+    # 다른 워커의 갱신 완료를 확인하는 폴링 간격 (초)
+    snapshot_poll_interval: float = 1.0
+
     class Config:
         env_file = ".env"
         # env_prefix = "MUSINSA_SRE_"
@@ -0,0 +1,53 @@
+import random
+import time
+
+from loguru import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# 접근 로그를 남기지 않는 라우트 이름 (헬스 체크 프로브)
+EXCLUDED_ROUTES = frozenset({"health_check"})
+
+
+class AccessLogMiddleware:
+    """라우트 템플릿 기준 구조화 접근 로그 ASGI 미들웨어.
+
+    uvicorn 접근 로그 대신 사용한다. 헬스 체크 제외는 메시지 문자열이 아닌
+    매칭된 라우트로 판단하고, 정상 응답(4xx/5xx 제외)은 ``sample_rate`` 비율만 기록한다.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 1.0) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            if getattr(route, "name", None) not in EXCLUDED_ROUTES and (
+                status >= 400 or random.random() < self.sample_rate
+            ):
+                client = scope.get("client")
+                # 메시지 포맷은 레벨 필터를 통과한 경우에만 수행된다
+                logger.info(
+                    '{client} - "{method} {path}" {status} {duration_ms}ms',
+                    client=f"{client[0]}:{client[1]}" if client else "-",
+                    method=scope["method"],
+                    path=scope["path"],
+                    route=getattr(route, "path", "unmatched"),
+                    status=status,
+                    duration_ms=round((time.perf_counter() - start) * 1000, 2),
+                )
@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import TypeAdapter  # type: ignore
+
+from backend.services.iam.inventory import OldAccessKeyResult, OldKey
+
+
+@dataclass(slots=True)
+class _Body:
+    """``OldAccessKeyPageResponse``와 같은 형식의 응답 본문."""
+
+    old_access_keys: List[OldKey]
+    generated_at: Optional[datetime]
+    snapshot_age: Optional[float]
+    complete: bool
+    next_cursor: Optional[str]
+
+
+@dataclass(slots=True)
+class _Page:
+    """``JobResultResponse``와 같은 형식의 작업 결과 페이지."""
+
+    old_access_keys: List[OldKey]
+    generated_at: Optional[datetime]
+    snapshot_age: Optional[float]
+    complete: bool
+    total: int
+    next_offset: Optional[int]
+
+
+# 직렬화만 수행 (검증 없음): 레코드 속성을 읽어 일시 변환과 JSON 인코딩을 한 번에 처리
+_BODY = TypeAdapter(_Body)
+_PAGE = TypeAdapter(_Page)
+_KEY = TypeAdapter(OldKey)
+
+
+def encode_old_access_keys(
+    keys: List[OldKey],
+    *,
+    generated_at: Optional[datetime],
+    snapshot_age: Optional[float],
+    complete: bool = True,
+    next_cursor: Optional[str] = None,
+) -> bytes:
+    """``OldAccessKeyPageResponse`` 형식의 JSON 응답 본문 생성.
+
+    키마다 Pydantic 모델을 만들어 검증/덤프하지 않고, 조회 결과 레코드를
+    JSON 바이트로 바로 인코딩한다.
+
+    :param keys: 오래된 액세스 키
+    :param generated_at: 데이터 기준 시각
+    :param snapshot_age: 데이터 경과 시간 (초)
+    :param complete: 부분 결과가 아닌지 여부
+    :param next_cursor: 다음 페이지 커서
+    :return: JSON 바이트
+    """
+    return _BODY.dump_json(
+        _Body(keys, generated_at, snapshot_age, complete, next_cursor)
+    )
+
+
+def encode_old_access_key_line(key: OldKey) -> bytes:
+    """NDJSON 스트리밍 응답의 한 줄 (``OldAccessKey`` JSON + 개행).
+
+    :param key: 오래된 액세스 키
+    :return: JSON 한 줄
+    """
+    return _KEY.dump_json(key) + b"\n"
+
+
+def encode_job_result_page(
+    result: OldAccessKeyResult,
+    *,
+    offset: int,
+    limit: int,
+) -> bytes:
+    """``JobResultResponse`` 형식의 작업 결과 페이지 JSON 생성.
+
+    :param result: 작업 결과
+    :param offset: 건너뛸 키 수
+    :param limit: 페이지 크기
+    :return: JSON 바이트
+    """
+    keys = result.old_access_keys
+    end = offset + limit
+    return _PAGE.dump_json(
+        _Page(
+            keys[offset:end],
+            result.generated_at,
+            result.age,
+            result.complete,
+            len(keys),
+            end if end < len(keys) else None,
+        )
+    )
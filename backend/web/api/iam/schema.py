@@ -1,10 +1,19 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel, Field  # type: ignore
 
+from backend.services.iam.jobs import JobMethod, JobStatus
+
+# 작업 결과 페이지 최대 크기
+MAX_PAGE_SIZE = 10_000
+
 
 class OldAccessKey(BaseModel):
+    account_id: Optional[str] = Field(
+        None,
+        description="AWS 계정 ID (멀티 계정 모드)",
+    )
     user_name: str = Field(
         ...,
         description="사용자 이름",
@@ -19,9 +28,135 @@ class OldAccessKey(BaseModel):
     )
 
 
-class OldAccessKeyRequest(BaseModel):
+class ScanRequest(BaseModel):
     hours: int = Field(..., description="N시간 이상된 키 조회")
+    accounts: Optional[str] = Field(
+        None,
+        description="조회할 AWS 계정 ID (쉼표 구분, 미지정 시 전체 계정)",
+    )
+    max_age: Optional[int] = Field(
+        None,
+        ge=0,
+        description="허용할 최대 데이터 경과 시간 (초, 초과 시 다시 조회한 뒤 응답)",
+    )
+
+    def account_ids(self) -> Optional[List[str]]:
+        """조회할 AWS 계정 ID 목록.
+
+        :return: 계정 ID 목록 (미지정 시 None)
+        """
+        if not self.accounts:
+            return None
+        return [a.strip() for a in self.accounts.split(",") if a.strip()]
+
+
+class OldAccessKeyRequest(ScanRequest):
+    timeout: Optional[float] = Field(
+        None,
+        gt=0,
+        description="응답 기한 (초, 넘기면 그때까지의 부분 결과를 complete=false로 응답)",
+    )
+    limit: Optional[int] = Field(
+        None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="페이지 크기 (지정하면 next_cursor로 다음 페이지 조회, 커서 요청의 기본값은 IAM_PAGE_SIZE)",
+    )
+    cursor: Optional[str] = Field(
+        None,
+        description="이전 페이지의 next_cursor (첫 페이지와 같은 조회 결과의 다음 페이지)",
+    )
+
+
+class CredentialReportRequest(OldAccessKeyRequest):
+    refresh: bool = Field(
+        False,
+        description=(
+            "캐시된 Credential Report를 무시하고 AWS에서 다시 받아옴 "
+            "(AWS가 4시간 이내 보고서를 재사용하므로 새 보고서 생성은 강제하지 못함)"
+        ),
+    )
 
 
 class OldAccessKeyResponse(BaseModel):
     old_access_keys: List[OldAccessKey]
+    generated_at: Optional[datetime] = Field(
+        None,
+        description=(
+            "데이터 기준 시각 (인벤토리 스냅샷 / Credential Report 생성 시각, "
+            "기한 안에 데이터를 받지 못한 부분 결과면 null)"
+        ),
+    )
+    snapshot_age: Optional[float] = Field(
+        None,
+        description="데이터 경과 시간 (초, generated_at이 null이면 null)",
+    )
+    complete: bool = Field(
+        default=True,
+        description="False면 응답 기한 안에 조회를 끝내지 못한 부분 결과",
+    )
+
+
+class OldAccessKeyPageResponse(OldAccessKeyResponse):
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="다음 페이지 커서 (limit 미지정 또는 마지막 페이지면 null)",
+    )
+
+
+class JobRequest(ScanRequest):
+    method: JobMethod = Field(
+        ...,
+        description="조회 방식 (list-users / credential-report)",
+    )
+    refresh: bool = Field(
+        False,
+        description=(
+            "(credential-report) 캐시된 Credential Report를 무시하고 다시 받아옴 "
+            "(새 보고서 생성은 강제하지 못함)"
+        ),
+    )
+
+
+class JobResultRequest(BaseModel):
+    offset: int = Field(0, ge=0, description="건너뛸 키 수")
+    limit: Optional[int] = Field(
+        None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="페이지 크기 (미지정 시 IAM_PAGE_SIZE)",
+    )
+
+
+class JobProgress(BaseModel):
+    users_processed: int = Field(..., description="처리한 유저(후보) 수")
+    users_total: Optional[int] = Field(
+        None,
+        description="전체 유저(후보) 수 (ListUsers 조회가 끝나기 전에는 null)",
+    )
+    aws_calls: int = Field(
+        ...,
+        description="이 작업이 실행한 IAM API 호출 수 (다른 요청이 시작한 조회에 합류한 호출 제외)",
+    )
+
+
+class JobResponse(BaseModel):
+    id: str = Field(..., description="작업 ID")
+    method: JobMethod = Field(..., description="조회 방식")
+    status: JobStatus = Field(..., description="작업 상태")
+    hours: int = Field(..., description="N시간 이상된 키 조회")
+    accounts: Optional[List[str]] = Field(None, description="조회할 AWS 계정 ID")
+    created_at: datetime = Field(..., description="접수 시각")
+    started_at: Optional[datetime] = Field(None, description="실행 시작 시각")
+    finished_at: Optional[datetime] = Field(None, description="완료 시각")
+    progress: JobProgress
+    result_count: Optional[int] = Field(None, description="결과 키 수 (성공 시)")
+    error: Optional[str] = Field(None, description="실패 사유")
+
+
+class JobResultResponse(OldAccessKeyResponse):
+    total: int = Field(..., description="결과 전체 키 수")
+    next_offset: Optional[int] = Field(
+        None,
+        description="다음 페이지의 offset (마지막 페이지면 null)",
+    )
@@ -1,49 +1,609 @@
-from typing import List
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional, TypeVar, Union
 
-from fastapi import APIRouter, Depends  # type: ignore
+from fastapi import APIRouter, Depends, Header, HTTPException, Request  # type: ignore
+from fastapi.responses import Response, StreamingResponse
 
-from backend.services.iam.dependency import get_iam_service
-from backend.services.iam.service import IAMService
+from backend.services.iam.deadline import Deadline
+from backend.services.iam.dependency import (
+    get_iam_service,
+    get_job_manager,
+    get_result_sets,
+)
+from backend.services.iam.inventory import OldAccessKeyResult, OldKey
+from backend.services.iam.jobs import (
+    Job,
+    JobManager,
+    JobQueueFullError,
+    JobSpec,
+    JobStatus,
+)
+from backend.services.iam.metrics import (
+    KEYS_RETURNED,
+    NOT_MODIFIED_RESPONSES,
+    PARTIAL_RESPONSES,
+)
+from backend.services.iam.result_sets import (
+    Cursor,
+    InvalidCursorError,
+    ResultSetCache,
+)
+from backend.services.iam.service import IAMService, UnknownAccountError
+from backend.settings import settings
+from backend.web.api.iam.encoder import (
+    encode_job_result_page,
+    encode_old_access_key_line,
+    encode_old_access_keys,
+)
 from backend.web.api.iam.schema import (
-    OldAccessKey,
+    CredentialReportRequest,
+    JobProgress,
+    JobRequest,
+    JobResponse,
+    JobResultRequest,
+    JobResultResponse,
+    OldAccessKeyPageResponse,
     OldAccessKeyRequest,
-    OldAccessKeyResponse,
 )
 
+T = TypeVar("T")
+
 router = APIRouter()
 
+# 스트리밍 응답 미디어 타입 (한 줄에 OldAccessKey 하나)
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# 클라이언트가 응답 전에 연결을 끊은 요청의 상태 코드 (접근 로그용, nginx 관례)
+CLIENT_CLOSED_REQUEST = 499
+
+# OpenAPI 문서에 스트리밍 응답 형식 추가
+STREAMING_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    200: {
+        "content": {
+            NDJSON_MEDIA_TYPE: {
+                "schema": {"$ref": "#/components/schemas/OldAccessKey"},
+            },
+        },
+    },
+}
+
+
+def wants_ndjson(accept: Optional[str]) -> bool:
+    """Accept 헤더가 NDJSON 스트리밍 응답을 요청하는지 확인.
+
+    :param accept: Accept 헤더 값
+    :return: NDJSON 요청 여부
+    """
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
+
+
+def ndjson_response(
+    keys: AsyncIterator[OldKey],
+    *,
+    endpoint: str,
+) -> StreamingResponse:
+    """오래된 액세스 키를 조회되는 즉시 한 줄씩 내보내는 NDJSON 응답 생성.
+
+    :param keys: 오래된 액세스 키 async iterator
+    :param endpoint: 메트릭 라벨 (엔드포인트 이름)
+    :return: 스트리밍 응답
+    """
+
+    async def lines() -> AsyncIterator[bytes]:
+        count = 0
+        async for key in keys:
+            count += 1
+            yield encode_old_access_key_line(key)
+        KEYS_RETURNED.labels(endpoint=endpoint).observe(count)
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
+
+
+def request_deadline(request: OldAccessKeyRequest) -> Deadline:
+    """요청의 ``timeout`` (없으면 ``IAM_REQUEST_TIMEOUT``) 기준 처리 기한.
+
+    :param request: 조회 요청
+    :return: 처리 기한
+    """
+    return Deadline(request.timeout or settings.iam_request_timeout or None)
+
+
+async def cancel_on_disconnect(http_request: Request, aw: Awaitable[T]) -> Optional[T]:
+    """클라이언트가 연결을 끊으면 ``aw``를 취소.
+
+    일반 JSON 응답은 연결이 끊겨도 핸들러가 계속 실행되므로, 조회가 끝날 때까지
+    ``http.disconnect`` 메시지를 기다리다 도착하면 조회(계정별 태스크 포함)를 취소한다.
+
+    :param http_request: HTTP 요청
+    :param aw: 조회 awaitable
+    :return: 조회 결과 (연결이 끊겨 취소했으면 None)
+    """
+
+    async def disconnected() -> None:
+        while (await http_request.receive())["type"] != "http.disconnect":
+            pass
 
-@router.get("/v1/iam/old-access-keys/list-users")
+    task = asyncio.ensure_future(aw)
+    listener = asyncio.ensure_future(disconnected())
+    try:
+        await asyncio.wait({task, listener}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        listener.cancel()
+        if not task.done():
+            task.cancel()
+        await asyncio.gather(task, listener, return_exceptions=True)
+    if task.cancelled():
+        return None
+    return task.result()
+
+
+def json_response(result: OldAccessKeyResult, *, endpoint: str) -> Response:
+    """``OldAccessKeyResponse`` 형식의 JSON 응답 생성.
+
+    응답 모델 검증/직렬화를 거치지 않고 조회 결과를 바로 JSON 바이트로 인코딩한다.
+    (OpenAPI 문서는 라우트의 ``response_model``을 그대로 사용)
+
+    :param result: 조회 결과
+    :param endpoint: 메트릭 라벨 (엔드포인트 이름)
+    :return: JSON 응답
+    """
+    KEYS_RETURNED.labels(endpoint=endpoint).observe(len(result.old_access_keys))
+    if not result.complete:
+        PARTIAL_RESPONSES.labels(endpoint=endpoint).inc()
+    return Response(
+        encode_old_access_keys(
+            result.old_access_keys,
+            generated_at=result.generated_at,
+            snapshot_age=result.age,
+            complete=result.complete,
+        ),
+        media_type="application/json",
+    )
+
+
+def cache_headers(
+    version: Optional[str],
+    *,
+    age: Optional[float],
+    ttl: float,
+) -> Dict[str, str]:
+    """응답 내용 버전의 ETag / Cache-Control 헤더.
+
+    ETag는 스냅샷 ID 기반 내용 버전으로 만들며, ``generated_at``/``snapshot_age``가
+    달라도 키 목록이 같으면 같은 값이므로 weak ETag로 표시한다.
+    Cache-Control의 max-age는 스냅샷이 갱신 대상이 되기까지 남은 시간이다.
+
+    :param version: 응답 내용 버전 (부분 결과 등 모르면 None)
+    :param age: 데이터 경과 시간 (초, 모르면 None)
+    :param ttl: 스냅샷 갱신 주기 (초)
+    :return: 응답 헤더 (버전이나 경과 시간이 없으면 캐시 금지)
+    """
+    if version is None or age is None:
+        return {"Cache-Control": "no-store"}
+    return {
+        "ETag": f'W/"{version}"',
+        "Cache-Control": f"private, max-age={max(0, int(ttl - age))}",
+        "Vary": "Accept",
+    }
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (weak 비교).
+
+    :param if_none_match: If-None-Match 헤더 값
+    :param etag: 현재 ETag
+    :return: 일치 여부
+    """
+    if if_none_match is None:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def not_modified(
+    if_none_match: Optional[str],
+    headers: Dict[str, str],
+    *,
+    endpoint: str,
+) -> Optional[Response]:
+    """If-None-Match가 현재 ETag와 일치하면 본문 없는 304 응답.
+
+    :param if_none_match: If-None-Match 헤더 값
+    :param headers: ``cache_headers``로 만든 응답 헤더
+    :param endpoint: 메트릭 라벨 (엔드포인트 이름)
+    :return: 304 응답 (일치하지 않으면 None)
+    """
+    etag = headers.get("ETag")
+    if etag is None or not etag_matches(if_none_match, etag):
+        return None
+    NOT_MODIFIED_RESPONSES.labels(endpoint=endpoint).inc()
+    return Response(status_code=304, headers=headers)
+
+
+def result_set_query(endpoint: str, request: OldAccessKeyRequest) -> str:
+    """커서가 가리키는 결과 집합의 조회 조건 (엔드포인트, 시간, 계정).
+
+    :param endpoint: 엔드포인트 이름
+    :param request: 조회 요청
+    :return: 조회 조건 문자열
+    """
+    accounts = ",".join(sorted(set(request.account_ids() or [])))
+    return f"{endpoint}|{request.hours}|{accounts}"
+
+
+def page_response(
+    result: OldAccessKeyResult,
+    cursor: Cursor,
+    *,
+    limit: int,
+    endpoint: str,
+) -> Response:
+    """결과 집합의 ``cursor`` 위치부터 ``limit``개 키를 담은 JSON 응답 생성.
+
+    :param result: 결과 집합의 조회 결과
+    :param cursor: 페이지 위치
+    :param limit: 페이지 크기
+    :param endpoint: 메트릭 라벨 (엔드포인트 이름)
+    :return: JSON 응답
+    """
+    keys = result.old_access_keys
+    end = cursor.offset + limit
+    page = keys[cursor.offset : end]
+    KEYS_RETURNED.labels(endpoint=endpoint).observe(len(page))
+    return Response(
+        encode_old_access_keys(
+            page,
+            generated_at=result.generated_at,
+            snapshot_age=result.age,
+            complete=result.complete,
+            next_cursor=(
+                Cursor(cursor.result_set, end).encode() if end < len(keys) else None
+            ),
+        ),
+        media_type="application/json",
+    )
+
+
+async def first_page(
+    result: OldAccessKeyResult,
+    request: OldAccessKeyRequest,
+    result_sets: ResultSetCache,
+    *,
+    endpoint: str,
+) -> Response:
+    """조회 결과의 첫 페이지 응답 (다음 페이지가 있으면 결과를 서버에 보관).
+
+    :param result: 조회 결과
+    :param request: 조회 요청 (``limit`` 지정)
+    :param result_sets: 결과 집합 보관소
+    :param endpoint: 메트릭 라벨 (엔드포인트 이름)
+    :return: JSON 응답
+    """
+    limit = request.limit or settings.iam_page_size
+    if not result.complete:
+        PARTIAL_RESPONSES.labels(endpoint=endpoint).inc()
+    # 한 페이지에 모두 담기면 다음 페이지가 없으므로 보관하지 않음
+    set_id = ""
+    if len(result.old_access_keys) > limit:
+        set_id = await result_sets.put(result_set_query(endpoint, request), result)
+    return page_response(result, Cursor(set_id, 0), limit=limit, endpoint=endpoint)
+
+
+async def next_page(
+    request: OldAccessKeyRequest,
+    result_sets: ResultSetCache,
+    *,
+    endpoint: str,
+) -> Response:
+    """``cursor``가 가리키는 결과 집합의 다음 페이지 응답 (AWS 조회 없음).
+
+    :param request: 조회 요청 (``cursor`` 지정)
+    :param result_sets: 결과 집합 보관소
+    :param endpoint: 메트릭 라벨 (엔드포인트 이름)
+    :return: JSON 응답
+    """
+    try:
+        cursor = Cursor.decode(request.cursor or "")
+        result = await result_sets.get(
+            cursor.result_set,
+            result_set_query(endpoint, request),
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if result is None:
+        raise HTTPException(
+            status_code=410,
+            detail="Cursor has expired; request the first page again",
+        )
+    return page_response(
+        result,
+        cursor,
+        limit=request.limit or settings.iam_page_size,
+        endpoint=endpoint,
+    )
+
+
+@router.get(
+    "/v1/iam/old-access-keys/list-users",
+    response_model=OldAccessKeyPageResponse,
+    responses=STREAMING_RESPONSES,
+)
 async def list_old_access_keys(
+    http_request: Request,
     request: OldAccessKeyRequest = Depends(),
+    accept: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
     iam_service: IAMService = Depends(get_iam_service),
-) -> OldAccessKeyResponse:
+    result_sets: ResultSetCache = Depends(get_result_sets),
+) -> Response:
     """N시간 이상된 AWS Access Key 목록 조회.
 
+    `Accept: application/x-ndjson` 요청 시 유저별 조회가 끝나는 즉시 스트리밍한다.
+    JSON 응답은 `timeout`을 넘기면 부분 결과를 `complete: false`로 응답한다.
+    `limit`을 지정하면 페이지로 나눠 응답하고, 다음 페이지는 `next_cursor`로 조회한다.
+    전체 JSON 응답에는 `ETag`를 붙이고, `If-None-Match`가 일치하면 본문 없이 304로 응답한다.
+
     :param hours: 조회할 시간
+    :param max_age: 허용할 최대 데이터 경과 시간 (초)
+    :param accounts: 조회할 AWS 계정 ID (쉼표 구분)
+    :param timeout: 응답 기한 (초)
+    :param limit: 페이지 크기
+    :param cursor: 다음 페이지 커서
+    :param accept: Accept 헤더
+    :param if_none_match: If-None-Match 헤더
     :return: 조회된 Access Key 목록
     """
-    old_access_keys: List[OldAccessKey] = (
-        await iam_service.get_old_access_keys_from_list_users(
-            hours=request.hours,
+    endpoint = "list_users"
+    try:
+        if wants_ndjson(accept):
+            return ndjson_response(
+                iam_service.iter_old_access_keys_from_list_users(
+                    hours=request.hours,
+                    max_age=request.max_age,
+                    accounts=request.account_ids(),
+                ),
+                endpoint=endpoint,
+            )
+        if request.cursor is not None:
+            return await next_page(request, result_sets, endpoint=endpoint)
+
+        ttl: float = settings.inventory_ttl
+        if request.max_age is not None:
+            ttl = min(ttl, request.max_age)
+
+        # 변경이 없으면 키 목록을 만들거나 직렬화하지 않고 304로 응답
+        if if_none_match is not None and request.limit is None:
+            current = await iam_service.get_old_access_keys_version_from_list_users(
+                hours=request.hours,
+                max_age=request.max_age,
+                accounts=request.account_ids(),
+            )
+            if current is not None:
+                response = not_modified(
+                    if_none_match,
+                    cache_headers(current.version, age=current.age, ttl=ttl),
+                    endpoint=endpoint,
+                )
+                if response is not None:
+                    return response
+
+        result = await cancel_on_disconnect(
+            http_request,
+            iam_service.get_old_access_keys_from_list_users(
+                hours=request.hours,
+                max_age=request.max_age,
+                accounts=request.account_ids(),
+                deadline=request_deadline(request),
+            ),
         )
+    except UnknownAccountError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    if result is None:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    if request.limit is not None:
+        return await first_page(result, request, result_sets, endpoint=endpoint)
+
+    headers = cache_headers(
+        result.version if result.complete else None,
+        age=result.age,
+        ttl=ttl,
     )
-    return OldAccessKeyResponse(old_access_keys=old_access_keys)
+    response = not_modified(if_none_match, headers, endpoint=endpoint)
+    if response is None:
+        response = json_response(result, endpoint=endpoint)
+        response.headers.update(headers)
+    return response
 
 
-@router.post("/v1/iam/old-access-keys/credential-report")
+@router.post(
+    "/v1/iam/old-access-keys/credential-report",
+    response_model=OldAccessKeyPageResponse,
+    responses=STREAMING_RESPONSES,
+)
 async def list_old_access_keys_from_credential_report(
-    request: OldAccessKeyRequest = Depends(),
+    http_request: Request,
+    request: CredentialReportRequest = Depends(),
+    accept: Optional[str] = Header(None),
     iam_service: IAMService = Depends(get_iam_service),
-) -> OldAccessKeyResponse:
+    result_sets: ResultSetCache = Depends(get_result_sets),
+) -> Response:
     """Credential Report에서 N시간 이상된 AWS Access Key 목록 조회.
 
+    `Accept: application/x-ndjson` 요청 시 키 ID 조회가 끝나는 즉시 스트리밍한다.
+    JSON 응답은 `timeout`을 넘기면 부분 결과를 `complete: false`로 응답한다.
+    `limit`을 지정하면 페이지로 나눠 응답하고, 다음 페이지는 `next_cursor`로 조회한다.
+
     :param hours: 조회할 시간
+    :param refresh: Credential Report 강제 갱신 여부
+    :param max_age: 허용할 최대 데이터 경과 시간 (초)
+    :param accounts: 조회할 AWS 계정 ID (쉼표 구분)
+    :param timeout: 응답 기한 (초)
+    :param limit: 페이지 크기
+    :param cursor: 다음 페이지 커서
+    :param accept: Accept 헤더
     :return: 조회된 Access Key 목록
     """
-    old_access_keys: List[OldAccessKey] = (
-        await iam_service.get_old_access_keys_from_credential_report(
-            hours=request.hours,
+    endpoint = "credential_report"
+    try:
+        if wants_ndjson(accept):
+            return ndjson_response(
+                iam_service.iter_old_access_keys_from_credential_report(
+                    hours=request.hours,
+                    refresh=request.refresh,
+                    max_age=request.max_age,
+                    accounts=request.account_ids(),
+                ),
+                endpoint=endpoint,
+            )
+        if request.cursor is not None:
+            return await next_page(request, result_sets, endpoint=endpoint)
+
+        result = await cancel_on_disconnect(
+            http_request,
+            iam_service.get_old_access_keys_from_credential_report(
+                hours=request.hours,
+                refresh=request.refresh,
+                max_age=request.max_age,
+                accounts=request.account_ids(),
+                deadline=request_deadline(request),
+            ),
         )
+    except UnknownAccountError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    if result is None:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    if request.limit is not None:
+        return await first_page(result, request, result_sets, endpoint=endpoint)
+    return json_response(result, endpoint=endpoint)
+
+
+def job_response(job: Job) -> JobResponse:
+    """작업 상태 응답 생성.
+
+    :param job: 작업
+    :return: 작업 상태
+    """
+    spec = job.spec
+    return JobResponse(
+        id=job.id,
+        method=spec.method,
+        status=job.status,
+        hours=spec.hours,
+        accounts=list(spec.accounts) if spec.accounts else None,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        progress=JobProgress(
+            users_processed=job.progress.users_processed,
+            users_total=job.progress.users_total,
+            aws_calls=job.aws_calls,
+        ),
+        result_count=job.result_count,
+        error=job.error,
+    )
+
+
+async def find_job(jobs: JobManager, job_id: str) -> Job:
+    """작업 조회 (없으면 404).
+
+    :param jobs: 작업 관리자
+    :param job_id: 작업 ID
+    :return: 작업
+    """
+    job = await jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown IAM job: {job_id}")
+    return job
+
+
+@router.post(
+    "/v1/iam/old-access-keys/jobs",
+    response_model=JobResponse,
+    status_code=202,
+)
+async def submit_old_access_key_job(
+    request: JobRequest = Depends(),
+    jobs: JobManager = Depends(get_job_manager),
+) -> JobResponse:
+    """오래된 AWS Access Key 조회 작업 접수 (작업 ID 즉시 반환).
+
+    요청 하나가 전체 조회를 기다리지 않도록 조회를 백그라운드 작업으로 실행한다.
+    같은 조건의 대기/실행 중 작업이 있으면 그 작업을 반환한다.
+    중복 확인은 요청을 받은 워커 프로세스 안에서만 하므로, 다른 워커(pod)로 간
+    같은 조건의 요청은 별도 작업이 된다 (작업 ID로 조회는 모든 워커에서 가능).
+
+    :param method: 조회 방식 (list-users / credential-report)
+    :param hours: 조회할 시간
+    :param max_age: 허용할 최대 데이터 경과 시간 (초)
+    :param accounts: 조회할 AWS 계정 ID (쉼표 구분)
+    :param refresh: Credential Report 강제 갱신 여부
+    :return: 접수된 작업 상태
+    """
+    account_ids = request.account_ids()
+    spec = JobSpec(
+        method=request.method,
+        hours=request.hours,
+        accounts=tuple(sorted(set(account_ids))) if account_ids else None,
+        max_age=request.max_age,
+        refresh=request.refresh,
+    )
+    try:
+        job = await jobs.submit(spec)
+    except UnknownAccountError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
+    return job_response(job)
+
+
+@router.get("/v1/iam/old-access-keys/jobs/{job_id}", response_model=JobResponse)
+async def get_old_access_key_job(
+    job_id: str,
+    jobs: JobManager = Depends(get_job_manager),
+) -> JobResponse:
+    """조회 작업 상태와 진행 상황 (처리한 유저 수 / 전체 유저 수, IAM API 호출 수).
+
+    :param job_id: 작업 ID
+    :return: 작업 상태
+    """
+    return job_response(await find_job(jobs, job_id))
+
+
+@router.get(
+    "/v1/iam/old-access-keys/jobs/{job_id}/result",
+    response_model=JobResultResponse,
+)
+async def get_old_access_key_job_result(
+    job_id: str,
+    request: JobResultRequest = Depends(),
+    jobs: JobManager = Depends(get_job_manager),
+) -> Response:
+    """성공한 조회 작업의 결과 (offset/limit 페이지).
+
+    완료되지 않았거나 실패한 작업은 409로 응답한다.
+
+    :param job_id: 작업 ID
+    :param offset: 건너뛸 키 수
+    :param limit: 페이지 크기
+    :return: 결과 페이지
+    """
+    job = await find_job(jobs, job_id)
+    if job.status is not JobStatus.SUCCEEDED:
+        detail = f"IAM job {job_id} is {job.status.value}"
+        if job.error:
+            detail = f"{detail}: {job.error}"
+        raise HTTPException(status_code=409, detail=detail)
+
+    result = await jobs.result(job)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Unknown IAM job: {job_id}")
+    return Response(
+        encode_job_result_page(
+            result,
+            offset=request.offset,
+            limit=request.limit or settings.iam_page_size,
+        ),
+        media_type="application/json",
     )
-    return OldAccessKeyResponse(old_access_keys=old_access_keys)
@@ -0,0 +1,5 @@
+"""API for exposing Prometheus metrics."""
+
+from backend.web.api.metrics.views import router
+
+__all__ = ["router"]
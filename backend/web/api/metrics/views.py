@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Response
+
+from backend.metrics import CONTENT_TYPE, render
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """
+    Prometheus text 형식의 메트릭 (워커가 여러 개면 모든 워커의 합계).
+
+    :return: 메트릭 응답
+    """
+    return Response(render(), media_type=CONTENT_TYPE)
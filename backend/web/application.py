@@ -1,83 +1,105 @@
 # flake8: noqa
 import base64
+import re
+from importlib import metadata
 from pathlib import Path
 from typing import Any, Dict
 
-import toml  # type: ignore
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import PlainTextResponse, UJSONResponse
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from backend.logging import configure_logging
 from backend.settings import settings
+from backend.web.access_log import AccessLogMiddleware
 from backend.web.api.router import api_router
 from backend.web.lifetime import (
     register_shutdown_event,
     register_startup_event,
 )
+from backend.web.metrics import MetricsMiddleware
 
 APP_ROOT = Path(__file__).parent.parent
 
 
-def get_version_from_pyproject() -> str:
+def get_version() -> str:
     """
-    Read the version from pyproject.toml.
-
-    :return: The version string from pyproject.toml.
-    """
-    with open("pyproject.toml", "r", encoding="utf-8") as pyproject_file:
-        pyproject_contents = toml.load(pyproject_file)
-        return pyproject_contents["project"]["version"]
+    Resolve the application version.
 
+    설치된 패키지 메타데이터(빌드 시점에 기록)를 사용하고, 패키지가 설치되지 않은
+    소스 체크아웃에서만 pyproject.toml의 ``version = "..."`` 줄을 읽는다.
+    (작업 디렉토리와 무관, TOML 파서 의존성 없음)
 
-class BasicAuthMiddleware(BaseHTTPMiddleware):
-    """Basic Authentication 미들웨어."""
+    :return: The version string.
+    """
+    try:
+        return metadata.version("backend")
+    except metadata.PackageNotFoundError:
+        pyproject = APP_ROOT.parent / "pyproject.toml"
+        if not pyproject.exists():
+            return "0.0.0"
+        found = re.search(
+            r'^version\s*=\s*"([^"]+)"',
+            pyproject.read_text(encoding="utf-8"),
+            re.MULTILINE,
+        )
+        return found.group(1) if found else "0.0.0"
+
+
+class BasicAuthMiddleware:
+    """Basic Authentication 미들웨어 (순수 ASGI).
+
+    ``include_path_prefix``로 시작하지 않는 요청은 그대로 다음 앱으로 전달하므로
+    보호 대상이 아닌 라우트에는 요청별 태스크/스트림 래핑 비용이 없다.
+    """
 
     def __init__(
         self,
-        app: FastAPI,
+        app: ASGIApp,
         username: str,
         password: str,
         include_path_prefix: str,
-    ):
-        super().__init__(app)
+    ) -> None:
+        self.app = app
         self.valid_credentials = base64.b64encode(
             f"{username}:{password}".encode(),
-        ).decode()
+        )
         self.include_path_prefix = include_path_prefix
 
-    async def dispatch(self, request: Request, call_next: Any) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Dispatch request.
 
-        :param request: Request instance.
-        :param call_next: Next middleware.
-        :return: Response.
+        :param scope: ASGI scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
         """
-        if request.url.path.startswith(self.include_path_prefix):
-            authorization = request.headers.get("Authorization")
-            if not authorization:
-                return PlainTextResponse(
-                    "Unauthorized",
-                    status_code=401,
-                    headers={"WWW-Authenticate": "Basic"},
-                )
-
-            scheme, _, credentials = authorization.partition(" ")
-            if not (  # noqa: WPS337
-                scheme.lower() == "basic" and credentials == self.valid_credentials
-            ):
-
-                return PlainTextResponse(
-                    "Unauthorized",
-                    status_code=401,
-                    headers={"WWW-Authenticate": "Basic"},
-                )
-
-        return await call_next(request)
+        if scope["type"] != "http" or not scope["path"].startswith(
+            self.include_path_prefix,
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        authorization = b""
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value
+                break
+
+        scheme, _, credentials = authorization.partition(b" ")
+        if scheme.lower() == b"basic" and credentials == self.valid_credentials:
+            await self.app(scope, receive, send)
+            return
+
+        response = PlainTextResponse(
+            "Unauthorized",
+            status_code=401,
+            headers={"WWW-Authenticate": "Basic"},
+        )
+        await response(scope, receive, send)
 
 
 def custom_openapi(app: FastAPI) -> Dict[str, Any]:
@@ -116,7 +138,7 @@ def get_app() -> FastAPI:  # noqa: WPS213
     configure_logging()
     app = FastAPI(
         title="musinsa_sre",
-        version=get_version_from_pyproject(),
+        version=get_version(),
         docs_url=None,
         redoc_url=None,
         openapi_url="/api/openapi.json",
@@ -151,10 +173,19 @@ def get_app() -> FastAPI:  # noqa: WPS213
 
     # if settings.environment != "local":
     app.add_middleware(
-        BasicAuthMiddleware,  # type: ignore
+        BasicAuthMiddleware,
         username=settings.swagger_id,
         password=settings.swagger_password,
         include_path_prefix="/api/docs",
     )
 
+    # 라우트 기준 접근 로그 (uvicorn 접근 로그 대체)
+    app.add_middleware(
+        AccessLogMiddleware,
+        sample_rate=settings.log_access_sample_rate,
+    )
+
+    # 라우트별 요청 처리 시간 (가장 바깥에서 측정)
+    app.add_middleware(MetricsMiddleware)
+
     return app
@@ -2,7 +2,16 @@ from typing import Awaitable, Callable
 
 from fastapi import FastAPI
 
-from backend.services.iam.lifetime import init_iam_service
+from backend.services.iam.lifetime import (
+    init_iam_service,
+    init_job_manager,
+    init_refresh_scheduler,
+    init_result_sets,
+    shutdown_job_manager,
+    shutdown_refresh_scheduler,
+    start_sdk_warm_up,
+    stop_sdk_warm_up,
+)
 
 
 def register_startup_event(
@@ -20,13 +29,20 @@ def register_startup_event(
 
     @app.on_event("startup")
     async def _startup() -> None:  # noqa: WPS430
+        # iam service 초기화
+        await init_iam_service(app)
 
-        # 미들웨어 초기화
-        app.middleware_stack = None
-        app.middleware_stack = app.build_middleware_stack()
+        # AWS SDK 미리 로드 (백그라운드)
+        start_sdk_warm_up(app)
 
-        # iam service 초기화
-        init_iam_service(app)
+        # 인벤토리/Credential Report 백그라운드 갱신 시작
+        init_refresh_scheduler(app)
+
+        # 커서 페이지 응답용 결과 집합 보관소
+        init_result_sets(app)
+
+        # 비동기 조회 작업 worker 시작
+        init_job_manager(app)
 
     return _startup
 
@@ -44,8 +60,12 @@ def register_shutdown_event(
     @app.on_event("shutdown")
     async def _shutdown() -> None:  # noqa: WPS430
         """
-        IAMService 종료
+        작업 worker, 갱신 스케줄러, SDK warm up 및 IAMService 종료
         """
+        await shutdown_job_manager(app)
+        await shutdown_refresh_scheduler(app)
+        await stop_sdk_warm_up(app)
+
         if app.state.iam_service:
             await app.state.iam_service.close()
 
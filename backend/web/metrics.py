@@ -0,0 +1,48 @@
+import time
+
+from prometheus_client import Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.metrics import DEFAULT_BUCKETS
+
+# 라우트별 요청 처리 시간 (스트리밍 응답은 본문 전송 완료까지)
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency in seconds.",
+    ["method", "route", "status"],
+    buckets=DEFAULT_BUCKETS,
+)
+
+
+class MetricsMiddleware:
+    """라우트 템플릿별 요청 처리 시간을 기록하는 ASGI 미들웨어.
+
+    라벨에는 실제 경로 대신 라우트 템플릿을 사용하여 cardinality를 제한한다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=str(status),
+            ).observe(time.perf_counter() - start)
@@ -0,0 +1,6 @@
+"""
+Benchmarks
+~~~~~~~~~~~~~~
+
+Offline performance benchmarks for backend (AWS 계정 없이 실행).
+"""
@@ -0,0 +1,179 @@
+"""aioboto3 IAM 클라이언트를 대신하는 프로세스 내 가짜 IAM 백엔드.
+
+``IAMAccount._client``에 주입하면 실제 AWS 계정 없이 조회 경로 전체를 실행할 수 있다.
+
+- N명의 유저, 유저당 0~2개의 액세스 키 생성 (난수 시드 고정)
+- 호출마다 지연 시간 주입
+- 초당 호출 수가 TPS 한도를 넘으면 ``Throttling`` ClientError 반환
+  (AWS와 같이 초당 ``tps``개씩 채워지는 토큰 버킷으로 판단)
+"""
+
+import asyncio
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+from benchmarks.report_parser import HEADER
+
+_TIME_FMT = "%Y-%m-%dT%H:%M:%SZ"
+_EMPTY_SLOT = "false,N/A,N/A,N/A,N/A"
+
+
+@dataclass(frozen=True)
+class FakeKey:
+    """가짜 액세스 키."""
+
+    access_key_id: str
+    created: datetime
+    active: bool
+
+
+class FakeIAMClient:
+    """ListUsers/ListAccessKeys/Credential Report API를 흉내 내는 가짜 IAM 클라이언트."""
+
+    def __init__(
+        self,
+        users: int,
+        *,
+        latency: float = 0.0,
+        tps: Optional[float] = None,
+        report_delay: float = 0.0,
+        page_size: int = 100,
+        seed: int = 0,
+    ) -> None:
+        """가짜 계정 데이터 생성.
+
+        :param users: 유저 수
+        :param latency: 호출당 지연 시간 (초)
+        :param tps: 초당 허용 호출 수 (None이면 제한 없음)
+        :param report_delay: Credential Report 생성에 걸리는 시간 (초)
+        :param page_size: ListUsers 페이지 크기
+        :param seed: 난수 시드
+        """
+        rng = random.Random(seed)
+        base = datetime(2015, 1, 1, tzinfo=timezone.utc)
+        self.keys: Dict[str, List[FakeKey]] = {}
+        for i in range(users):
+            self.keys[f"user-{i:06d}"] = [
+                FakeKey(
+                    access_key_id=f"AKIA{i:010d}{slot:06d}",
+                    created=base + timedelta(seconds=rng.randrange(10 * 365 * 86400)),
+                    active=rng.random() < 0.9,
+                )
+                for slot in range(rng.choice((0, 1, 1, 2)))
+            ]
+        self.user_names = list(self.keys)
+
+        self.latency = latency
+        self.tps = tps
+        self.report_delay = report_delay
+        self.page_size = page_size
+        # API별 호출 수 / Throttling 응답 수
+        self.calls: Counter[str] = Counter()
+        self.throttled = 0
+        self._tokens = tps or 0.0
+        self._refilled_at = time.monotonic()
+        self._report_ready: Optional[float] = None
+        self._report_generated: Optional[datetime] = None
+
+    # ------------------------------ plumbing ------------------------------
+    async def _request(self, operation: str) -> None:
+        """호출 기록, TPS 한도 검사 및 지연 주입.
+
+        :param operation: API 이름
+        """
+        self.calls[operation] += 1
+        if self.tps is not None:
+            now = time.monotonic()
+            elapsed, self._refilled_at = now - self._refilled_at, now
+            self._tokens = min(self.tps, self._tokens + elapsed * self.tps)
+            if self._tokens < 1:
+                self.throttled += 1
+                raise ClientError(
+                    {"Error": {"Code": "Throttling", "Message": "Rate exceeded"}},
+                    operation,
+                )
+            self._tokens -= 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """aioboto3 클라이언트 종료 인터페이스."""
+
+    # ------------------------------- IAM API -------------------------------
+    async def list_users(self, Marker: Optional[str] = None) -> Dict[str, Any]:
+        """ListUsers (Marker 기반 페이지네이션)."""
+        await self._request("list_users")
+        start = int(Marker or 0)
+        end = start + self.page_size
+        page: Dict[str, Any] = {
+            "Users": [{"UserName": u} for u in self.user_names[start:end]],
+            "IsTruncated": end < len(self.user_names),
+        }
+        if page["IsTruncated"]:
+            page["Marker"] = str(end)
+        return page
+
+    async def list_access_keys(self, UserName: str) -> Dict[str, Any]:
+        """ListAccessKeys."""
+        await self._request("list_access_keys")
+        return {
+            "AccessKeyMetadata": [
+                {
+                    "UserName": UserName,
+                    "AccessKeyId": k.access_key_id,
+                    "Status": "Active" if k.active else "Inactive",
+                    "CreateDate": k.created,
+                }
+                for k in self.keys[UserName]
+            ],
+        }
+
+    async def generate_credential_report(self) -> Dict[str, Any]:
+        """GenerateCredentialReport (``report_delay`` 후 COMPLETE)."""
+        await self._request("generate_credential_report")
+        now = time.monotonic()
+        if self._report_ready is None:
+            self._report_ready = now + self.report_delay
+            if self.report_delay:
+                return {"State": "STARTED"}
+        return {"State": "COMPLETE" if now >= self._report_ready else "INPROGRESS"}
+
+    async def get_credential_report(self) -> Dict[str, Any]:
+        """GetCredentialReport (유저 데이터로 CSV 생성).
+
+        AWS처럼 처음 생성한 보고서의 GeneratedTime을 계속 반환한다.
+        """
+        await self._request("get_credential_report")
+        if self._report_generated is None:
+            self._report_generated = datetime.now(timezone.utc)
+        return {
+            "Content": self.credential_report(),
+            "GeneratedTime": self._report_generated,
+            "ReportFormat": "text/csv",
+        }
+
+    def credential_report(self) -> bytes:
+        """유저 데이터와 일치하는 Credential Report CSV.
+
+        :return: Credential Report CSV 바이트
+        """
+        lines = [HEADER]
+        for user, keys in self.keys.items():
+            slots = [
+                f"{'true' if k.active else 'false'},"
+                f"{k.created.strftime(_TIME_FMT)},N/A,N/A,N/A"
+                for k in keys
+            ]
+            slots += [_EMPTY_SLOT] * (2 - len(slots))
+            lines.append(
+                f"{user},arn:aws:iam::123456789012:user/{user},"
+                f"2015-01-01T00:00:00Z,false,N/A,N/A,N/A,false,"
+                f"{slots[0]},{slots[1]},false,N/A,false,N/A",
+            )
+        return "\n".join(lines).encode()
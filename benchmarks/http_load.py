@@ -0,0 +1,430 @@
+"""FastAPI 앱 전체(미들웨어, 직렬화, Depends) HTTP 부하 테스트.
+
+``get_app()``으로 만든 앱의 IAMService에 가짜 IAM 백엔드를 주입하고,
+요청 구성 파일(JSONL)의 요청을 가중치대로 재생하며 동시성을 단계적으로 높인다.
+동시성별 처리량, p50/p95/p99 지연 시간, 이벤트 루프 지연을 출력한다.
+
+    python -m benchmarks.http_load --mode asgi --concurrency 1 8 32 128
+    python -m benchmarks.http_load --mode uvicorn --duration 10
+
+- asgi: 같은 프로세스에서 ASGI 앱을 직접 호출 (네트워크 제외)
+- uvicorn: 별도 프로세스의 uvicorn 서버에 keep-alive HTTP/1.1 연결로 요청
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, MutableSequence, Optional, Tuple
+from urllib.parse import urlencode
+
+from benchmarks.fake_iam import FakeIAMClient
+
+DEFAULT_MIX = Path(__file__).parent / "request_mix.jsonl"
+
+
+@dataclass(frozen=True)
+class MixRequest:
+    """재생할 요청 하나와 가중치."""
+
+    method: str
+    path: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    headers: Dict[str, str] = field(default_factory=dict)
+    weight: float = 1.0
+
+    @property
+    def target(self) -> str:
+        """쿼리 문자열을 포함한 요청 경로."""
+        return f"{self.path}?{urlencode(self.params)}" if self.params else self.path
+
+
+def load_mix(path: Path) -> List[MixRequest]:
+    """요청 구성 파일 로드 (한 줄에 JSON 요청 하나).
+
+    :param path: JSONL 파일 경로
+    :return: 요청 목록
+    """
+    with open(path, encoding="utf-8") as f:
+        return [MixRequest(**json.loads(line)) for line in f if line.strip()]
+
+
+# ---------------------------------------------------------------------------
+# 대상 앱
+# ---------------------------------------------------------------------------
+
+
+def build_app(users: int, latency: float) -> Any:
+    """가짜 IAM 백엔드를 사용하는 FastAPI 앱 생성.
+
+    :param users: 가짜 IAM 유저 수
+    :param latency: 가짜 IAM 호출당 지연 시간 (초)
+    :return: FastAPI 앱
+    """
+    from backend.settings import settings
+
+    # 공유 저장소/스케줄러 없이, IAM 처리율 제한이 병목이 되지 않도록 설정
+    settings.snapshot_store = False
+    settings.iam_refresh_interval = 0
+    settings.iam_sdk_prewarm = False
+    settings.iam_rate_limit = 1_000_000
+
+    from backend.web.application import get_app
+
+    app = get_app()
+
+    @app.on_event("startup")
+    async def use_fake_iam() -> None:
+        for account in app.state.iam_service.accounts:
+            account._client = FakeIAMClient(users, latency=latency)
+
+    return app
+
+
+class LagMonitor:
+    """이벤트 루프 지연 측정.
+
+    짧은 주기로 sleep한 뒤 예정 시각보다 늦게 깨어난 시간을 누적한다.
+    (``stats``: [지연 합계, 측정 횟수, 최대 지연], 프로세스 간 공유 가능)
+    """
+
+    def __init__(self, stats: MutableSequence[float], interval: float = 0.01) -> None:
+        self.stats = stats
+        self.interval = interval
+
+    async def run(self) -> None:
+        """취소될 때까지 측정."""
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - start - self.interval)
+            self.stats[0] += lag
+            self.stats[1] += 1
+            self.stats[2] = max(self.stats[2], lag)
+
+    def reset(self) -> None:
+        """누적 값 초기화."""
+        self.stats[0] = self.stats[1] = self.stats[2] = 0.0
+
+    def summary(self) -> Tuple[float, float]:
+        """(평균 지연, 최대 지연) 초."""
+        total, count, peak = self.stats[0], self.stats[1], self.stats[2]
+        return (total / count if count else 0.0), peak
+
+
+class ASGIClient:
+    """같은 프로세스의 ASGI 앱을 직접 호출하는 클라이언트."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def request(self, req: MixRequest) -> int:
+        """요청 실행 후 응답 본문을 모두 수신.
+
+        :param req: 요청
+        :return: 응답 상태 코드
+        """
+        path, _, query = req.target.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": req.method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [(k.encode(), v.encode()) for k, v in req.headers.items()],
+            "client": ("127.0.0.1", 0),
+            "server": ("testserver", 80),
+        }
+        status = 0
+        requested = False
+        disconnected = asyncio.Event()
+
+        async def receive() -> Dict[str, Any]:
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        await self.app(scope, receive, send)
+        disconnected.set()
+        return status
+
+    async def close(self) -> None:
+        """자원 해제 (없음)."""
+
+
+class HTTPClient:
+    """keep-alive HTTP/1.1 연결 하나를 사용하는 최소 클라이언트."""
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self._conn: Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = None
+
+    async def request(self, req: MixRequest) -> int:
+        """요청 실행 후 응답 본문을 모두 수신 (Content-Length / chunked).
+
+        :param req: 요청
+        :return: 응답 상태 코드
+        """
+        if self._conn is None:
+            self._conn = await asyncio.open_connection(self.host, self.port)
+        reader, writer = self._conn
+
+        lines = [f"{req.method} {req.target} HTTP/1.1", f"Host: {self.host}"]
+        lines += [f"{k}: {v}" for k, v in req.headers.items()]
+        lines += ["Content-Length: 0", "", ""]
+        writer.write("\r\n".join(lines).encode())
+        await writer.drain()
+
+        status = int((await reader.readline()).split()[1])
+        headers: Dict[str, str] = {}
+        while (line := await reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode().partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding") == "chunked":
+            while size := int((await reader.readline()).strip(), 16):
+                await reader.readexactly(size + 2)
+            await reader.readline()
+        else:
+            await reader.readexactly(int(headers.get("content-length", 0)))
+
+        if headers.get("connection") == "close":
+            await self.close()
+        return status
+
+    async def close(self) -> None:
+        """연결 종료."""
+        if self._conn is not None:
+            self._conn[1].close()
+            self._conn = None
+
+
+def serve(users: int, latency: float, port: int, lag_stats: Any) -> None:
+    """uvicorn 서버 프로세스 (이벤트 루프 지연을 공유 메모리에 기록).
+
+    :param users: 가짜 IAM 유저 수
+    :param latency: 가짜 IAM 호출당 지연 시간 (초)
+    :param port: 서버 포트
+    :param lag_stats: 이벤트 루프 지연 공유 배열
+    """
+    import uvicorn
+
+    app = build_app(users, latency)
+    monitor = LagMonitor(lag_stats)
+    tasks = set()
+
+    @app.on_event("startup")
+    async def start_monitor() -> None:
+        tasks.add(asyncio.create_task(monitor.run()))
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+
+
+# ---------------------------------------------------------------------------
+# 부하 생성
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class LevelResult:
+    """동시성 단계별 결과."""
+
+    concurrency: int
+    requests: int
+    errors: int
+    elapsed: float
+    latencies: List[float]
+    loop_lag: Tuple[float, float]
+
+    def percentile(self, p: int) -> float:
+        """지연 시간 백분위수 (초)."""
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100)[p - 1]
+
+
+async def run_level(
+    clients: List[Any],
+    mix: List[MixRequest],
+    *,
+    duration: float,
+    monitor: LagMonitor,
+) -> LevelResult:
+    """클라이언트마다 요청을 연속으로 보내며 ``duration``초 동안 측정.
+
+    :param clients: 동시 실행할 클라이언트 (동시성 = 개수)
+    :param mix: 요청 구성
+    :param duration: 측정 시간 (초)
+    :param monitor: 이벤트 루프 지연 측정기
+    :return: 단계별 결과
+    """
+    weights = [r.weight for r in mix]
+    latencies: List[float] = []
+    errors = 0
+    monitor.reset()
+    start = time.perf_counter()
+    deadline = start + duration
+
+    async def worker(client: Any, seed: int) -> None:
+        nonlocal errors
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            req = rng.choices(mix, weights)[0]
+            sent = time.perf_counter()
+            status = await client.request(req)
+            latencies.append(time.perf_counter() - sent)
+            if status >= 400:
+                errors += 1
+
+    await asyncio.gather(*(worker(c, i) for i, c in enumerate(clients)))
+    return LevelResult(
+        concurrency=len(clients),
+        requests=len(latencies),
+        errors=errors,
+        elapsed=time.perf_counter() - start,
+        latencies=latencies,
+        loop_lag=monitor.summary(),
+    )
+
+
+def print_result(r: LevelResult) -> None:
+    """단계별 결과 한 줄 출력."""
+    lag_mean, lag_max = r.loop_lag
+    print(
+        f"{r.concurrency:>5} {r.requests:>8} {r.requests / r.elapsed:>9.1f} "
+        f"{r.percentile(50) * 1e3:>8.2f} {r.percentile(95) * 1e3:>8.2f} "
+        f"{r.percentile(99) * 1e3:>8.2f} {r.errors:>6} "
+        f"{lag_mean * 1e3:>9.2f} {lag_max * 1e3:>9.2f}",
+        flush=True,
+    )
+
+
+async def run(args: argparse.Namespace, mix: List[MixRequest]) -> None:
+    """모드별 대상 준비 후 동시성 단계별 부하 실행.
+
+    :param args: 명령행 인자
+    :param mix: 요청 구성
+    """
+    server: Optional[Any] = None
+    if args.mode == "asgi":
+        app = build_app(args.users, args.latency)
+        monitor = LagMonitor([0.0, 0.0, 0.0])
+        lifespan = app.router.lifespan_context(app)
+        await lifespan.__aenter__()
+        lag_task = asyncio.create_task(monitor.run())
+
+        def make_client() -> Any:
+            return ASGIClient(app)
+
+    else:
+        # 공유 배열은 서버 프로세스와 같은 (spawn) 컨텍스트에서 생성해야 공유된다
+        ctx = multiprocessing.get_context("spawn")
+        lag_stats: Any = ctx.Array("d", 3)
+        monitor = LagMonitor(lag_stats)
+        server = ctx.Process(
+            target=serve,
+            args=(args.users, args.latency, args.port, lag_stats),
+            daemon=True,
+        )
+        server.start()
+
+        def make_client() -> Any:
+            return HTTPClient("127.0.0.1", args.port)
+
+        # 서버가 요청을 받을 때까지 대기
+        probe = make_client()
+        for _ in range(600):
+            try:
+                await probe.request(MixRequest("GET", "/api/health"))
+                break
+            except OSError:
+                if not server.is_alive():
+                    raise RuntimeError("uvicorn server exited during startup")
+                await asyncio.sleep(0.1)
+        else:
+            server.terminate()
+            raise RuntimeError("uvicorn server did not start in 60s")
+        await probe.close()
+
+    try:
+        # 인벤토리/Credential Report/키 ID 캐시 준비 (콜드 조회는 측정에서 제외)
+        warmup = make_client()
+        for req in mix:
+            await warmup.request(req)
+        await warmup.close()
+
+        print(
+            f"{'conc':>5} {'requests':>8} {'req/s':>9} {'p50(ms)':>8} "
+            f"{'p95(ms)':>8} {'p99(ms)':>8} {'errors':>6} "
+            f"{'lag(ms)':>9} {'lagmax':>9}",
+        )
+        for concurrency in args.concurrency:
+            clients = [make_client() for _ in range(concurrency)]
+            result = await run_level(
+                clients,
+                mix,
+                duration=args.duration,
+                monitor=monitor,
+            )
+            await asyncio.gather(*(c.close() for c in clients))
+            print_result(result)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+        else:
+            lag_task.cancel()
+            await lifespan.__aexit__(None, None, None)
+
+
+def main() -> None:
+    """부하 테스트 실행."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["asgi", "uvicorn"], default="asgi")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 8, 32, 128],
+        help="동시 요청 수 (단계별로 실행)",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10, help="단계별 측정 시간 (초)"
+    )
+    parser.add_argument(
+        "--mix", type=Path, default=DEFAULT_MIX, help="요청 구성 (JSONL)"
+    )
+    parser.add_argument("--users", type=int, default=10_000, help="가짜 IAM 유저 수")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.005,
+        help="가짜 IAM 호출당 지연 시간 (초)",
+    )
+    parser.add_argument("--port", type=int, default=8765, help="uvicorn 모드 서버 포트")
+    args = parser.parse_args()
+
+    asyncio.run(run(args, load_mix(args.mix)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""IAMService 조회 경로 벤치마크 (가짜 IAM 백엔드 사용).
+
+list-users / credential-report 조회를 유저 수별로 실행하여
+실행 시간, AWS 호출 수, 최대 RSS(및 가짜 백엔드 데이터 생성 이후 증가량),
+Throttling 비율을 출력한다.
+시나리오마다 새 프로세스에서 실행하므로 캐시와 최대 RSS가 섞이지 않는다.
+
+    python -m benchmarks.iam_service --users 1000 10000 100000
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import resource
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from benchmarks.fake_iam import FakeIAMClient
+
+# 조회 방식 → IAMService 메서드
+ENDPOINTS = {
+    "list-users": "get_old_access_keys_from_list_users",
+    "credential-report": "get_old_access_keys_from_credential_report",
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """벤치마크 시나리오."""
+
+    endpoint: str
+    users: int
+    hours: int
+    latency: float
+    tps: float
+    rate: float
+    concurrency: int
+
+
+@dataclass(frozen=True)
+class Result:
+    """시나리오 실행 결과."""
+
+    endpoint: str
+    users: int
+    keys: int
+    wall: float
+    calls: Dict[str, int]
+    throttled: int
+    peak_rss_mb: float
+    # 가짜 IAM 백엔드 데이터 생성 이후 증가한 최대 RSS (IAMService 조회/결과 몫)
+    service_rss_mb: float
+    # 조회 실패 시 예외 메시지 (예: Throttling 재시도 초과)
+    error: Optional[str] = None
+
+    @property
+    def throttle_rate(self) -> float:
+        """Throttling 응답 비율."""
+        total = sum(self.calls.values())
+        return self.throttled / total if total else 0.0
+
+
+def _peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (MB)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 bytes, Linux는 KB 단위
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / (1 << 10)
+
+
+def run_scenario(scenario: Scenario) -> Result:
+    """새 IAMService에 가짜 클라이언트를 주입하여 한 번 조회.
+
+    :param scenario: 벤치마크 시나리오
+    :return: 실행 결과
+    """
+    from backend.settings import settings
+
+    # 공유 저장소 없이 AWS 조회 경로만 측정
+    settings.snapshot_store = False
+    settings.iam_rate_limit = scenario.rate
+    settings.iam_max_concurrency = scenario.concurrency
+    settings.iam_sweep_workers = scenario.concurrency
+
+    from backend.services.iam.service import IAMService
+
+    async def main() -> Result:
+        service = IAMService()
+        client = FakeIAMClient(
+            scenario.users,
+            latency=scenario.latency,
+            tps=scenario.tps,
+        )
+        service.accounts[0]._client = client
+        baseline_rss = _peak_rss_mb()
+
+        keys = 0
+        error = None
+        start = time.perf_counter()
+        try:
+            result = await getattr(service, ENDPOINTS[scenario.endpoint])(
+                hours=scenario.hours,
+            )
+            keys = len(result.old_access_keys)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        wall = time.perf_counter() - start
+        await service.close()
+
+        return Result(
+            endpoint=scenario.endpoint,
+            users=scenario.users,
+            keys=keys,
+            wall=wall,
+            calls=dict(client.calls),
+            throttled=client.throttled,
+            peak_rss_mb=_peak_rss_mb(),
+            service_rss_mb=_peak_rss_mb() - baseline_rss,
+            error=error,
+        )
+
+    return asyncio.run(main())
+
+
+def print_results(results: List[Result]) -> None:
+    """결과 표 출력.
+
+    :param results: 실행 결과 목록
+    """
+    print(
+        f"{'endpoint':<18} {'users':>7} {'keys':>7} {'wall(s)':>9} "
+        f"{'calls':>8} {'throttle':>9} {'rss(MB)':>8} {'svc(MB)':>8}  "
+        "calls by operation",
+    )
+    for r in results:
+        by_op = " ".join(f"{op}={n}" for op, n in sorted(r.calls.items()))
+        print(
+            f"{r.endpoint:<18} {r.users:>7} {r.keys:>7} {r.wall:>9.2f} "
+            f"{sum(r.calls.values()):>8} {r.throttle_rate:>9.2%} "
+            f"{r.peak_rss_mb:>8.1f} {r.service_rss_mb:>8.1f}  {r.error or by_op}",
+        )
+
+
+def main() -> None:
+    """벤치마크 실행."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--users",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="유저 수 (여러 개 지정 가능)",
+    )
+    parser.add_argument(
+        "--endpoint",
+        choices=[*ENDPOINTS, "all"],
+        default="all",
+        help="조회 방식",
+    )
+    parser.add_argument("--hours", type=int, default=24 * 90, help="임계값 (시간)")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.005,
+        help="가짜 IAM 호출당 지연 시간 (초)",
+    )
+    parser.add_argument(
+        "--tps",
+        type=float,
+        default=2_000,
+        help="가짜 IAM의 초당 허용 호출 수 (초과 시 Throttling)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=1_500,
+        help="IAMService 토큰 버킷 처리율 (IAM_RATE_LIMIT)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=20,
+        help="IAM 동시 호출 수 (IAM_MAX_CONCURRENCY, IAM_SWEEP_WORKERS)",
+    )
+    args = parser.parse_args()
+
+    endpoints = list(ENDPOINTS) if args.endpoint == "all" else [args.endpoint]
+    scenarios = [
+        Scenario(
+            endpoint=endpoint,
+            users=users,
+            hours=args.hours,
+            latency=args.latency,
+            tps=args.tps,
+            rate=args.rate,
+            concurrency=args.concurrency,
+        )
+        for users in args.users
+        for endpoint in endpoints
+    ]
+
+    # 시나리오마다 새 프로세스 (캐시/최대 RSS 분리)
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for scenario in scenarios:
+        with ctx.Pool(1) as pool:
+            result = pool.apply(run_scenario, (scenario,))
+        results.append(result)
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""요청당 로그 오버헤드 벤치마크.
+
+같은 앱에 로그 구성만 바꿔 가며 요청을 보내고, 로그 없는 앱 대비
+요청당 추가 시간(us)을 출력한다. 로그 출력은 /dev/null로 보낸다.
+
+- legacy: uvicorn 접근 로그 → InterceptHandler(프레임 탐색) → 메시지 문자열 필터
+- text / json: AccessLogMiddleware (라우트 기준 헬스 체크 제외)
+- enqueue: 로그 출력(JSON 변환 포함)을 별도 스레드에서 처리 (QueueSink)
+- sample: 정상 응답 접근 로그 샘플링
+- filtered: 로그 레벨 필터에 걸러지는 경우 (LOG_LEVEL=WARNING)
+
+    python -m benchmarks.logging_overhead --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from typing import Any, Dict, List, Tuple, Union
+
+from fastapi import FastAPI
+from loguru import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.logging import configure_logging
+from backend.settings import LogFormat, LogLevel, settings
+from backend.web.access_log import AccessLogMiddleware
+from benchmarks.middleware import throughput
+
+# 모드 이름 → (로그 형식, enqueue, 샘플링 비율, 로그 레벨)
+MODES: Dict[str, Tuple[LogFormat, bool, float, LogLevel]] = {
+    "text": (LogFormat.TEXT, False, 1.0, LogLevel.INFO),
+    "json": (LogFormat.JSON, False, 1.0, LogLevel.INFO),
+    "json+enqueue": (LogFormat.JSON, True, 1.0, LogLevel.INFO),
+    "json+enqueue+sample": (LogFormat.JSON, True, 0.1, LogLevel.INFO),
+    "filtered": (LogFormat.JSON, True, 1.0, LogLevel.WARNING),
+}
+
+
+class LegacyInterceptHandler(logging.Handler):
+    """비교용: 스택 프레임을 거슬러 호출 위치를 찾던 기존 InterceptHandler."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """loguru로 전달."""
+        try:
+            level: Union[str, int] = logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+
+        frame, depth = logging.currentframe(), 2
+        while frame.f_code.co_filename == logging.__file__:  # type: ignore
+            frame = frame.f_back  # type: ignore
+            depth += 1
+
+        logger.opt(depth=depth, exception=record.exc_info).log(
+            level,
+            record.getMessage(),
+        )
+
+
+class LegacyAccessLogMiddleware:
+    """비교용: uvicorn 접근 로그와 같은 형식으로 표준 logging에 기록."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.logger = logging.getLogger("uvicorn.access")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+        self.logger.info(
+            '%s - "%s %s HTTP/%s" %d',
+            "127.0.0.1:0",
+            scope["method"],
+            scope["path"],
+            scope["http_version"],
+            status,
+        )
+
+
+def build_app(mode: str) -> FastAPI:
+    """로그 구성별 앱.
+
+    :param mode: off / legacy / ``MODES``의 키
+    :return: FastAPI 앱
+    """
+    logger.remove()
+    app = FastAPI()
+
+    @app.get("/api/items")
+    async def items() -> List[int]:
+        return [1, 2, 3]
+
+    if mode == "legacy":
+        logging.root.handlers = [LegacyInterceptHandler()]
+        logging.root.setLevel(logging.NOTSET)
+        logger.add(
+            sys.stdout,
+            level="INFO",
+            filter=lambda r: "GET /api/health" not in r["message"],
+        )
+        app.add_middleware(LegacyAccessLogMiddleware)
+    elif mode != "off":
+        fmt, enqueue, sample_rate, level = MODES[mode]
+        settings.log_format = fmt
+        settings.log_enqueue = enqueue
+        settings.log_level = level
+        logging.root.handlers = []
+        configure_logging()
+        app.add_middleware(AccessLogMiddleware, sample_rate=sample_rate)
+    return app
+
+
+async def run(args: argparse.Namespace) -> List[Tuple[str, float]]:
+    """모드별 초당 요청 수 측정."""
+    results: List[Tuple[str, float]] = []
+    for mode in ("off", "legacy", *MODES):
+        app = build_app(mode)
+        await throughput(app, 1_000, args.concurrency, "/api/items")  # 워밍업
+        rps = await throughput(app, args.requests, args.concurrency, "/api/items")
+        logger.remove()  # 큐에 남은 로그 출력
+        results.append((mode, rps))
+    return results
+
+
+def main() -> None:
+    """벤치마크 실행."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=64, help="동시 요청 수")
+    args = parser.parse_args()
+
+    out: Any = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        results = asyncio.run(run(args))
+    finally:
+        sys.stdout.close()
+        sys.stdout = out
+
+    baseline = results[0][1]
+    print(f"{'mode':<20} {'req/s':>9} {'us/req':>8} {'log(us/req)':>12}")
+    for mode, rps in results:
+        overhead = (1 / rps - 1 / baseline) * 1e6
+        print(f"{mode:<20} {rps:>9.0f} {1e6 / rps:>8.1f} {overhead:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""인벤토리/Credential Report 메모리 벤치마크.
+
+키 N개 분량의 입력(공유 저장소의 인벤토리 스냅샷 JSON / Credential Report CSV)을
+메모리 표현으로 변환할 때의 최대 RSS 증가량과, 변환 후 남는 메모리(tracemalloc)를
+표현 방식별로 비교한다. 측정마다 새 프로세스에서 실행한다.
+
+- inventory/records: 레코드별 배열 JSON → 키마다 dataclass + datetime + 상태 문자열,
+  float 생성일 목록 (기존)
+- inventory/compact: 컬럼 JSON → ``InventorySnapshot`` (``KeyTable`` 컬럼)
+- report/dictreader: CSV 전체 디코딩 + 행마다 dict, (유저, datetime) 튜플 (기존)
+- report/compact: ``parse_credential_report`` (``ReportKeys`` 컬럼)
+
+    python -m benchmarks.memory --keys 100000
+"""
+
+import argparse
+import gc
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import tempfile
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Tuple
+
+import ujson
+
+from benchmarks.report_parser import build_report, legacy_parse
+
+# Credential Report 유저(행)당 평균 활성 키 수 (build_report 기준)
+KEYS_PER_REPORT_ROW = 1.17
+
+
+@dataclass(frozen=True)
+class LegacyKeyRecord:
+    """비교용: 기존 인벤토리 레코드."""
+
+    user_name: str
+    access_key_id: str
+    created_date: datetime
+    status: str
+
+
+def legacy_inventory(payload: bytes) -> Any:
+    """기존 ``InventorySnapshot``과 같은 표현 (정렬된 레코드 + float 생성일 목록)."""
+    records = sorted(
+        (
+            LegacyKeyRecord(u, k, datetime.fromtimestamp(c, timezone.utc), s)
+            for u, k, c, s in ujson.loads(payload)
+        ),
+        key=lambda r: r.created_date,
+    )
+    return records, [r.created_date.timestamp() for r in records]
+
+
+def compact_inventory(payload: bytes) -> Any:
+    """``InventorySnapshot.loads``."""
+    from backend.services.iam.inventory import InventorySnapshot
+
+    return InventorySnapshot.loads(0, payload)
+
+
+def compact_report(content: bytes) -> Any:
+    """``parse_credential_report``."""
+    from backend.services.iam.report_parser import parse_credential_report
+
+    return parse_credential_report(content)
+
+
+# 모드 → (입력 종류, 변환 함수)
+MODES: Dict[str, Tuple[str, Callable[[bytes], Any]]] = {
+    "inventory/records": ("inventory-rows", legacy_inventory),
+    "inventory/compact": ("inventory-columns", compact_inventory),
+    "report/dictreader": ("report", legacy_parse),
+    "report/compact": ("report", compact_report),
+}
+
+
+def build_inventory(keys: int, *, seed: int = 0) -> bytes:
+    """유저당 1~2개 키를 가진 인벤토리 스냅샷 JSON 생성.
+
+    :param keys: 키 수
+    :param seed: 난수 시드
+    :return: 레코드별 [유저, 키 ID, 생성일 epoch, 상태] 배열 JSON 바이트
+    """
+    rng = random.Random(seed)
+    start = int(datetime(2015, 1, 1, tzinfo=timezone.utc).timestamp())
+    return ujson.dumps(
+        [
+            [
+                f"user-{i * 2 // 3:06d}",
+                f"AKIA{i:016d}",
+                start + rng.randrange(10 * 365 * 86400),
+                "Active" if rng.random() < 0.9 else "Inactive",
+            ]
+            for i in range(keys)
+        ]
+    ).encode()
+
+
+def _max_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (MB)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 bytes, Linux는 KB 단위
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / (1 << 10)
+
+
+def measure(mode: str, path: str, traced: bool) -> float:
+    """입력 파일을 읽어 변환한 뒤 메모리 측정 (새 프로세스에서 실행).
+
+    :param mode: ``MODES``의 키
+    :param path: 입력 파일 경로
+    :param traced: True면 변환 후 남은 메모리, False면 최대 RSS 증가량
+    :return: 메모리 (MB)
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    convert = MODES[mode][1]
+    convert(data[:0] if mode.startswith("report") else b"[]")  # import 비용 제외
+    gc.collect()
+
+    if traced:
+        tracemalloc.start()
+        result = convert(data)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del result
+        return retained / (1 << 20)
+
+    before = _max_rss_mb()
+    result = convert(data)
+    del result
+    return _max_rss_mb() - before
+
+
+def write_inputs(keys: int) -> Dict[str, Tuple[str, int]]:
+    """입력 파일 생성 (새 프로세스에서 실행).
+
+    Linux의 ``ru_maxrss``는 fork/exec 후에도 부모 값을 물려받으므로,
+    측정 프로세스를 띄우는 부모의 최대 RSS가 커지지 않도록 별도 프로세스에서 만든다.
+
+    :param keys: 키 수
+    :return: 입력 종류 → (파일 경로, 크기)
+    """
+    rows = build_inventory(keys)
+    inputs = {
+        "inventory-rows": rows,
+        "inventory-columns": compact_inventory(rows).dumps(),
+        "report": build_report(int(keys / KEYS_PER_REPORT_ROW)),
+    }
+    paths: Dict[str, Tuple[str, int]] = {}
+    for kind, data in inputs.items():
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(data)
+        paths[kind] = (f.name, len(data))
+    return paths
+
+
+def main() -> None:
+    """벤치마크 실행."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=100_000, help="키 수")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        paths = pool.apply(write_inputs, (args.keys,))
+
+    print(f"{'mode':<20} {'input(MB)':>10} {'peak rss(MB)':>13} {'retained(MB)':>13}")
+    try:
+        for mode, (kind, _) in MODES.items():
+            path, size = paths[kind]
+            with ctx.Pool(1) as pool:
+                peak = pool.apply(measure, (mode, path, False))
+            with ctx.Pool(1) as pool:
+                retained = pool.apply(measure, (mode, path, True))
+            print(
+                f"{mode:<20} {size / (1 << 20):>10.1f} {peak:>13.1f} {retained:>13.1f}"
+            )
+    finally:
+        for path, _ in paths.values():
+            os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
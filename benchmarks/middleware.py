@@ -0,0 +1,198 @@
+"""인증 미들웨어 요청별 오버헤드 벤치마크.
+
+기존 ``BaseHTTPMiddleware`` 기반 Basic Auth와 순수 ASGI ``BasicAuthMiddleware``를
+같은 앱에 씌워 보호 대상이 아닌 경로의 처리량과
+스트리밍 응답의 첫 청크 도착 시간(버퍼링 여부)을 비교한다.
+
+    python -m benchmarks.middleware --requests 20000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import base64
+import time
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import Message
+
+from backend.web.application import BasicAuthMiddleware
+from benchmarks.http_load import ASGIClient, MixRequest
+
+CHUNKS = 5
+CHUNK_INTERVAL = 0.05
+
+
+class LegacyBasicAuthMiddleware(BaseHTTPMiddleware):
+    """비교용: 순수 ASGI로 바꾸기 전의 Basic Auth 미들웨어."""
+
+    def __init__(
+        self,
+        app: Any,
+        username: str,
+        password: str,
+        include_path_prefix: str,
+    ) -> None:
+        super().__init__(app)
+        self.valid_credentials = base64.b64encode(
+            f"{username}:{password}".encode(),
+        ).decode()
+        self.include_path_prefix = include_path_prefix
+
+    async def dispatch(self, request: Request, call_next: Any) -> Response:
+        """보호 경로만 인증 검사."""
+        if request.url.path.startswith(self.include_path_prefix):
+            authorization = request.headers.get("Authorization", "")
+            scheme, _, credentials = authorization.partition(" ")
+            if not (
+                scheme.lower() == "basic" and credentials == self.valid_credentials
+            ):
+                return PlainTextResponse(
+                    "Unauthorized",
+                    status_code=401,
+                    headers={"WWW-Authenticate": "Basic"},
+                )
+        return await call_next(request)
+
+
+def build_app(middleware: str) -> FastAPI:
+    """헬스 체크와 스트리밍 라우트만 있는 앱.
+
+    :param middleware: none / legacy / asgi
+    :return: FastAPI 앱
+    """
+    app = FastAPI()
+
+    @app.get("/api/health")
+    async def health() -> Dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/api/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            for i in range(CHUNKS):
+                if i:
+                    await asyncio.sleep(CHUNK_INTERVAL)
+                yield b"{}\n"
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    auth = {"none": None, "legacy": LegacyBasicAuthMiddleware}.get(
+        middleware,
+        BasicAuthMiddleware,
+    )
+    if auth is not None:
+        app.add_middleware(
+            auth,  # type: ignore[arg-type]
+            username="admin",
+            password="admin",
+            include_path_prefix="/api/docs",
+        )
+    return app
+
+
+async def throughput(
+    app: FastAPI,
+    requests: int,
+    concurrency: int,
+    path: str = "/api/health",
+) -> float:
+    """보호 대상이 아닌 경로의 초당 요청 수.
+
+    :param app: 대상 앱
+    :param requests: 총 요청 수
+    :param concurrency: 동시 요청 수
+    :param path: 요청 경로
+    :return: 초당 요청 수
+    """
+    client = ASGIClient(app)
+    req = MixRequest("GET", path)
+    per_worker = requests // concurrency
+
+    async def worker() -> None:
+        for _ in range(per_worker):
+            await client.request(req)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return per_worker * concurrency / (time.perf_counter() - start)
+
+
+async def chunk_arrivals(app: FastAPI) -> List[float]:
+    """스트리밍 응답의 청크별 도착 시각 (요청 시작 기준, 초).
+
+    :param app: 대상 앱
+    :return: 청크 도착 시각 목록
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/stream",
+        "raw_path": b"/api/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "client": ("127.0.0.1", 0),
+        "server": ("testserver", 80),
+    }
+    arrivals: List[float] = []
+    requested = False
+    done = asyncio.Event()
+    start = time.perf_counter()
+
+    async def receive() -> Message:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.body" and message.get("body"):
+            arrivals.append(time.perf_counter() - start)
+
+    await app(scope, receive, send)
+    done.set()
+    return arrivals
+
+
+async def run(args: argparse.Namespace) -> List[Tuple[str, float, List[float]]]:
+    """미들웨어별 측정."""
+    results = []
+    for middleware in ("none", "legacy", "asgi"):
+        app = build_app(middleware)
+        await throughput(app, 1_000, args.concurrency)  # 워밍업
+        rps = await throughput(app, args.requests, args.concurrency)
+        results.append((middleware, rps, await chunk_arrivals(app)))
+    return results
+
+
+def main() -> None:
+    """벤치마크 실행."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=64, help="동시 요청 수")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    baseline = results[0][1]
+    print(
+        f"{'middleware':<10} {'req/s':>9} {'us/req':>8} {'overhead(us)':>13}  "
+        f"chunk arrivals (ms)",
+    )
+    for middleware, rps, arrivals in results:
+        overhead = (1 / rps - 1 / baseline) * 1e6
+        print(
+            f"{middleware:<10} {rps:>9.0f} {1e6 / rps:>8.1f} {overhead:>13.1f}  "
+            + " ".join(f"{t * 1e3:.0f}" for t in arrivals),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Credential Report 파서 마이크로 벤치마크.
+
+기존 루프(csv.DictReader + strptime)와 컬럼 기반 파서를
+합성 Credential Report로 비교한다.
+
+    python -m benchmarks.report_parser --rows 100000
+"""
+
+import argparse
+import csv
+import io
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Optional, Tuple
+
+from backend.services.iam.report_parser import parse_credential_report
+
+# 실제 Credential Report 헤더
+HEADER = (
+    "user,arn,user_creation_time,password_enabled,password_last_used,"
+    "password_last_changed,password_next_rotation,mfa_active,"
+    "access_key_1_active,access_key_1_last_rotated,access_key_1_last_used_date,"
+    "access_key_1_last_used_region,access_key_1_last_used_service,"
+    "access_key_2_active,access_key_2_last_rotated,access_key_2_last_used_date,"
+    "access_key_2_last_used_region,access_key_2_last_used_service,"
+    "cert_1_active,cert_1_last_rotated,cert_2_active,cert_2_last_rotated"
+)
+
+_TIME_FMT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def build_report(rows: int, *, seed: int = 0) -> bytes:
+    """유저 ``rows``명, 유저당 0~2개 키를 가진 합성 Credential Report 생성.
+
+    :param rows: 유저 수
+    :param seed: 난수 시드
+    :return: Credential Report CSV 바이트
+    """
+    rng = random.Random(seed)
+    base = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    lines = [
+        HEADER,
+        "<root_account>,arn:aws:iam::123456789012:root,2015-01-01T00:00:00Z,"
+        "not_supported,N/A,not_supported,not_supported,true,false,N/A,N/A,N/A,N/A,"
+        "false,N/A,N/A,N/A,N/A,false,N/A,false,N/A",
+    ]
+    for i in range(rows):
+        user = f"user-{i:06d}"
+        slots = []
+        for _ in range(2):
+            if rng.random() < 0.35:
+                slots.append("false,N/A,N/A,N/A,N/A")
+                continue
+            rotated = base + timedelta(seconds=rng.randrange(10 * 365 * 86400))
+            active = "true" if rng.random() < 0.9 else "false"
+            slots.append(
+                f"{active},{rotated.strftime(_TIME_FMT)},N/A,us-east-1,iam",
+            )
+        lines.append(
+            f"{user},arn:aws:iam::123456789012:user/{user},2015-01-01T00:00:00Z,"
+            f"false,N/A,N/A,N/A,false,{slots[0]},{slots[1]},false,N/A,false,N/A",
+        )
+    return "\n".join(lines).encode()
+
+
+def legacy_parse(content: bytes) -> List[Tuple[str, datetime]]:
+    """기존 IAMService의 Credential Report 파싱 루프 (비교 기준).
+
+    :param content: Credential Report CSV 바이트
+    :return: (유저 이름, last_rotated) 목록
+    """
+
+    def parse_dt(s: str) -> Optional[datetime]:
+        if not s or s == "N/A":
+            return None
+        return datetime.strptime(s, _TIME_FMT).replace(tzinfo=timezone.utc)
+
+    keys: List[Tuple[str, datetime]] = []
+    for row in csv.DictReader(io.StringIO(content.decode())):
+        user = row["user"]
+        if user == "<root_account>":
+            continue
+        for idx in (1, 2):
+            if row[f"access_key_{idx}_active"] != "true":
+                continue
+            rotated = parse_dt(row[f"access_key_{idx}_last_rotated"])
+            if rotated:
+                keys.append((user, rotated))
+    return keys
+
+
+def best_of(
+    fn: Callable[[bytes], Any],
+    content: bytes,
+    repeat: int,
+) -> float:
+    """``repeat``회 실행 중 최단 시간 (초).
+
+    :param fn: 파서 함수
+    :param content: Credential Report CSV 바이트
+    :param repeat: 반복 횟수
+    :return: 최단 실행 시간 (초)
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(content)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """벤치마크 실행."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="유저 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    content = build_report(args.rows)
+    assert [(u, int(t.timestamp())) for u, t in legacy_parse(content)] == list(
+        parse_credential_report(content)
+    )
+
+    legacy = best_of(legacy_parse, content, args.repeat)
+    columnar = best_of(parse_credential_report, content, args.repeat)
+    print(f"rows={args.rows} size={len(content) / 1e6:.1f}MB")
+    print(f"legacy   (DictReader + strptime): {legacy * 1e3:8.1f} ms")
+    print(f"columnar (report_parser)        : {columnar * 1e3:8.1f} ms")
+    print(f"speedup: x{legacy / columnar:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""오래된 액세스 키 JSON 응답 직렬화 벤치마크.
+
+같은 조회 결과를 두 경로로 JSON 바이트까지 변환하며 CPU 시간과 메모리를 비교한다.
+
+- legacy: 키마다 ``OldAccessKey`` 모델 생성(서비스) → ``OldAccessKeyPageResponse``(뷰)
+  → FastAPI 응답 모델 검증/직렬화 → ``UJSONResponse`` 인코딩
+- fast: ``OldKey`` 튜플(서비스) → ``encode_old_access_keys`` 한 번에 인코딩
+
+결과 보관 메모리는 서비스가 반환하는 키 목록의 크기, 최대 메모리는 인코딩까지의
+tracemalloc 최대 할당량이다. 두 경로의 출력이 같은지도 확인한다.
+
+    python -m benchmarks.serialization --keys 100000
+"""
+
+import argparse
+import gc
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Tuple
+
+import ujson
+from pydantic import TypeAdapter
+
+from backend.services.iam.inventory import KeyRecord, OldKey
+from backend.web.api.iam.encoder import encode_old_access_keys
+from backend.web.api.iam.schema import OldAccessKey, OldAccessKeyPageResponse
+
+GENERATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+SNAPSHOT_AGE = 12.5
+
+# FastAPI가 response_model 검증/직렬화에 사용하는 것과 같은 TypeAdapter
+RESPONSE_ADAPTER: TypeAdapter[OldAccessKeyPageResponse] = TypeAdapter(
+    OldAccessKeyPageResponse
+)
+
+
+def make_records(count: int) -> List[KeyRecord]:
+    """인벤토리 레코드 생성.
+
+    :param count: 키 수
+    :return: 생성일 순 레코드
+    """
+    start = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    return [
+        KeyRecord(
+            user_name=f"user-{i:06d}",
+            access_key_id=f"AKIA{i:016d}",
+            created_date=start + timedelta(seconds=i * 997),
+            status="Active",
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_keys(records: List[KeyRecord]) -> List[OldAccessKey]:
+    """기존 서비스 결과: 키마다 Pydantic 모델."""
+    return [
+        OldAccessKey(
+            account_id="123456789012",
+            user_name=r.user_name,
+            access_key_id=r.access_key_id,
+            created_date=r.created_date,
+        )
+        for r in records
+    ]
+
+
+def legacy_encode(keys: List[OldAccessKey]) -> bytes:
+    """기존 뷰 → FastAPI → UJSONResponse 경로."""
+    response = OldAccessKeyPageResponse(
+        old_access_keys=keys,
+        generated_at=GENERATED_AT,
+        snapshot_age=SNAPSHOT_AGE,
+    )
+    value = RESPONSE_ADAPTER.validate_python(response)
+    content = RESPONSE_ADAPTER.dump_python(value, mode="json")
+    return ujson.dumps(content, ensure_ascii=False).encode("utf-8")
+
+
+def fast_keys(records: List[KeyRecord]) -> List[OldKey]:
+    """서비스 결과: ``OldKey`` 튜플."""
+    return [r.to_old_key("123456789012") for r in records]
+
+
+def fast_encode(keys: List[OldKey]) -> bytes:
+    """``encode_old_access_keys`` 경로."""
+    return encode_old_access_keys(
+        keys,
+        generated_at=GENERATED_AT,
+        snapshot_age=SNAPSHOT_AGE,
+    )
+
+
+PATHS: List[Tuple[str, Callable[[List[KeyRecord]], Any], Callable[[Any], bytes]]] = [
+    ("legacy", legacy_keys, legacy_encode),
+    ("fast", fast_keys, fast_encode),
+]
+
+
+def cpu_ms(
+    records: List[KeyRecord],
+    build: Callable[[List[KeyRecord]], Any],
+    encode: Callable[[Any], bytes],
+    runs: int,
+) -> Tuple[float, float]:
+    """서비스 결과 생성 / 인코딩 CPU 시간 (ms, 중앙값)."""
+    build_ms: List[float] = []
+    encode_ms: List[float] = []
+    for _ in range(runs):
+        gc.collect()
+        start = time.process_time()
+        keys = build(records)
+        middle = time.process_time()
+        encode(keys)
+        end = time.process_time()
+        build_ms.append((middle - start) * 1000)
+        encode_ms.append((end - middle) * 1000)
+    return statistics.median(build_ms), statistics.median(encode_ms)
+
+
+def memory_mib(
+    records: List[KeyRecord],
+    build: Callable[[List[KeyRecord]], Any],
+    encode: Callable[[Any], bytes],
+) -> Tuple[float, float]:
+    """서비스 결과 보관 메모리 / 인코딩까지의 최대 메모리 (MiB)."""
+    gc.collect()
+    tracemalloc.start()
+    keys = build(records)
+    retained = tracemalloc.get_traced_memory()[0]
+    encode(keys)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return retained / 2**20, peak / 2**20
+
+
+def main() -> None:
+    """벤치마크 실행."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=100_000, help="응답 키 수")
+    parser.add_argument("--runs", type=int, default=5, help="반복 횟수 (중앙값 출력)")
+    args = parser.parse_args()
+
+    records = make_records(args.keys)
+    outputs = [encode(build(records)) for _, build, encode in PATHS]
+    if outputs[0] != outputs[1]:
+        raise SystemExit("legacy and fast outputs differ")
+    print(f"{args.keys} keys, {len(outputs[0]) / 2**20:.1f} MiB JSON (identical)")
+
+    print(
+        f"{'path':<8} {'build(ms)':>10} {'encode(ms)':>11} {'total(ms)':>10} "
+        f"{'retained(MiB)':>14} {'peak(MiB)':>10}"
+    )
+    for name, build, encode in PATHS:
+        build_ms, encode_ms = cpu_ms(records, build, encode, args.runs)
+        retained, peak = memory_mib(records, build, encode)
+        print(
+            f"{name:<8} {build_ms:>10.0f} {encode_ms:>11.0f} "
+            f"{build_ms + encode_ms:>10.0f} {retained:>14.1f} {peak:>10.1f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
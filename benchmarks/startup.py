@@ -0,0 +1,132 @@
+"""앱 기동 시간 벤치마크.
+
+1. ``python -X importtime``으로 ``get_app()``까지의 import 시간을 측정하고
+   최상위 패키지별 import 시간과 AWS SDK 로드 여부를 출력한다.
+2. ``python -m backend`` 서버를 띄워 ``/api/health``가 처음 응답할 때까지의 시간을
+   ``IAM_SDK_PREWARM`` 설정별로 측정한다. (HPA 스케일 아웃 시 파드 준비 시간)
+
+    python -m benchmarks.startup --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Dict, List, Tuple
+
+# 앱 생성까지 실행 (IAM 서비스 ↔ 웹 스키마 순환 import 회피를 위해 라우터 먼저 로드)
+APP_CODE = (
+    "import backend.web.api.router; "
+    "from backend.web.application import get_app; "
+    "get_app()"
+)
+SDK_MODULES = ("aioboto3", "aiobotocore", "botocore.client")
+
+
+def import_profile(runs: int) -> Tuple[float, List[Tuple[str, int]], List[str]]:
+    """``-X importtime`` 결과를 최상위 패키지별로 집계.
+
+    :param runs: 반복 횟수 (중앙값 사용)
+    :return: (전체 import 시간 ms, [(최상위 패키지, self 시간 합계 us)], 로드된 SDK 모듈)
+    """
+    totals: List[float] = []
+    by_package: Dict[str, List[int]] = {}
+    loaded: List[str] = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", APP_CODE],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        packages: Dict[str, int] = {}
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            self_us, _, name = line[len("import time:") :].split("|")
+            module = name.strip()
+            package = module.split(".")[0]
+            packages[package] = packages.get(package, 0) + int(self_us)
+            if module in SDK_MODULES and module not in loaded:
+                loaded.append(module)
+        totals.append(sum(packages.values()) / 1000)
+        for package, us in packages.items():
+            by_package.setdefault(package, []).append(us)
+
+    top = sorted(
+        ((name, int(statistics.median(v))) for name, v in by_package.items()),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    return statistics.median(totals), top, loaded
+
+
+def time_to_ready(port: int, env: Dict[str, str], timeout: float = 60) -> float:
+    """서버 프로세스 시작부터 ``/api/health`` 첫 응답까지의 시간 (ms).
+
+    :param port: 서버 포트
+    :param env: 추가 환경 변수
+    :param timeout: 최대 대기 시간 (초)
+    :return: 준비 시간 (ms)
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "backend"],
+        env={**os.environ, **env, "PORT": str(port)},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                url = f"http://127.0.0.1:{port}/api/health"
+                with urllib.request.urlopen(url, timeout=1):
+                    return (time.perf_counter() - start) * 1000
+            except OSError:
+                if proc.poll() is not None:
+                    raise RuntimeError("server exited during startup")
+                time.sleep(0.005)
+        raise RuntimeError(f"server did not start in {timeout}s")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main() -> None:
+    """벤치마크 실행."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="반복 횟수 (중앙값 출력)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 최상위 패키지 수")
+    parser.add_argument("--port", type=int, default=8766, help="서버 포트")
+    args = parser.parse_args()
+
+    total, top, loaded = import_profile(args.runs)
+    print(f"import time until get_app(): {total:.0f} ms")
+    print(f"AWS SDK modules imported: {', '.join(loaded) or 'none'}")
+    for name, self_us in top[: args.top]:
+        print(f"  {self_us / 1000:>8.1f} ms  {name}")
+
+    # AWS 조회 없이 기동만 측정
+    base_env = {
+        "SNAPSHOT_STORE": "False",
+        "IAM_REFRESH_INTERVAL": "0",
+        "WORKERS_COUNT": "1",
+        "RELOAD": "False",
+    }
+    print(f"\n{'IAM_SDK_PREWARM':<16} {'ready(ms)':>10} {'min':>8} {'max':>8}")
+    for prewarm in ("False", "True"):
+        samples = [
+            time_to_ready(args.port, {**base_env, "IAM_SDK_PREWARM": prewarm})
+            for _ in range(args.runs)
+        ]
+        print(
+            f"{prewarm:<16} {statistics.median(samples):>10.0f} "
+            f"{min(samples):>8.0f} {max(samples):>8.0f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
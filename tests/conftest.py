@@ -0,0 +1,113 @@
+from pathlib import Path
+from typing import AsyncIterator, Callable, Iterator, List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.services.iam.service import IAMService
+from backend.settings import settings
+from benchmarks.fake_iam import FakeIAMClient
+
+# 라우트 테스트용 가짜 IAM 유저 수
+FAKE_USERS = 300
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """
+    Backend for anyio pytest plugin.
+
+    :return: backend name.
+    """
+    return "asyncio"
+
+
+@pytest.fixture
+def fake_iam() -> FakeIAMClient:
+    """
+    Fake IAM client with deterministic users and access keys.
+
+    :return: fake IAM client.
+    """
+    return FakeIAMClient(FAKE_USERS)
+
+
+@pytest.fixture
+async def make_worker(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    fake_iam: FakeIAMClient,
+) -> AsyncIterator[Callable[[], IAMService]]:
+    """
+    Factory for IAMService instances that share one snapshot store.
+
+    인스턴스 하나가 워커 프로세스 하나를 흉내 내며, 모두 ``tmp_path``의 공유
+    저장소와 ``fake_iam``을 사용한다. 테스트가 끝나면 모두 종료한다.
+
+    :param monkeypatch: pytest monkeypatch.
+    :param tmp_path: shared snapshot store directory.
+    :param fake_iam: fake IAM client.
+    :yield: IAMService factory.
+    """
+    monkeypatch.setattr(settings, "snapshot_store", True)
+    monkeypatch.setattr(settings, "snapshot_dir", tmp_path)
+    monkeypatch.setattr(settings, "iam_rate_limit", 1_000_000)
+    monkeypatch.setattr(settings, "iam_rate_burst", 1_000_000)
+    services: List[IAMService] = []
+
+    def make() -> IAMService:
+        service = IAMService()
+        for account in service.accounts:
+            account._client = fake_iam
+        services.append(service)
+        return service
+
+    yield make
+
+    for service in services:
+        await service.close()
+
+
+@pytest.fixture
+def fastapi_app(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_iam: FakeIAMClient,
+) -> FastAPI:
+    """
+    Fixture for creating FastAPI app backed by the fake IAM client.
+
+    공유 저장소/스케줄러/SDK warm up 없이 모든 계정이 ``fake_iam``을 사용한다.
+
+    :param monkeypatch: pytest monkeypatch.
+    :param fake_iam: fake IAM client.
+    :return: fastapi app with mocked dependencies.
+    """
+    monkeypatch.setattr(settings, "snapshot_store", False)
+    monkeypatch.setattr(settings, "iam_refresh_interval", 0)
+    monkeypatch.setattr(settings, "iam_sdk_prewarm", False)
+    monkeypatch.setattr(settings, "iam_rate_limit", 1_000_000)
+    monkeypatch.setattr(settings, "iam_rate_burst", 1_000_000)
+
+    from backend.web.application import get_app
+
+    application = get_app()
+
+    @application.on_event("startup")
+    async def use_fake_iam() -> None:  # noqa: WPS430
+        for account in application.state.iam_service.accounts:
+            account._client = fake_iam
+
+    return application
+
+
+@pytest.fixture
+def client(fastapi_app: FastAPI) -> Iterator[TestClient]:
+    """
+    Fixture that creates client for requesting server.
+
+    :param fastapi_app: the application.
+    :yield: client for the app.
+    """
+    with TestClient(fastapi_app) as test_client:
+        yield test_client
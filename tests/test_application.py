@@ -0,0 +1,32 @@
+from importlib import metadata
+from pathlib import Path
+
+import pytest
+
+from backend.web import application
+from backend.web.application import get_version
+
+
+def not_installed(name: str) -> str:
+    """패키지가 설치되지 않은 소스 체크아웃."""
+    raise metadata.PackageNotFoundError(name)
+
+
+def test_version_from_source_checkout(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """설치 메타데이터가 없으면 pyproject.toml의 [project] version을 사용."""
+    app_root = tmp_path / "backend"
+    app_root.mkdir()
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "backend"\nversion = "1.2.3"\n\n'
+        '[tool.mypy]\npython_version = "3.10"\n',
+    )
+    monkeypatch.setattr(metadata, "version", not_installed)
+    monkeypatch.setattr(application, "APP_ROOT", app_root)
+
+    assert get_version() == "1.2.3"
+
+    (tmp_path / "pyproject.toml").unlink()
+    assert get_version() == "0.0.0"
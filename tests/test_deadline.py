@@ -0,0 +1,74 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import AsyncIterator
+
+import pytest
+
+from backend.services.iam.deadline import Deadline
+from backend.services.iam.inventory import OldAccessKeyResult
+
+
+async def slow_numbers(delay: float) -> AsyncIterator[int]:
+    """앞의 세 항목은 바로, 이후는 ``delay``초마다 내보내는 입력."""
+    for item in range(10):
+        if item >= 3:
+            await asyncio.sleep(delay)
+        yield item
+
+
+@pytest.mark.anyio
+async def test_collect_returns_partial_result_after_deadline() -> None:
+    """기한을 넘기면 순회를 취소하고 그때까지 모은 항목을 반환."""
+    items, complete = await Deadline(0.05).collect(slow_numbers(1))
+
+    assert items == [0, 1, 2]
+    assert not complete
+
+
+@pytest.mark.anyio
+async def test_collect_without_deadline_is_complete() -> None:
+    """기한이 없으면 끝까지 모음."""
+    deadline = Deadline()
+    items, complete = await deadline.collect(slow_numbers(0))
+
+    assert deadline.remaining() is None
+    assert items == list(range(10))
+    assert complete
+
+
+@pytest.mark.anyio
+async def test_wait_cancels_after_deadline() -> None:
+    """기한을 넘긴 대기는 취소하고 TimeoutError."""
+    cancelled = asyncio.Event()
+
+    async def forever() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    deadline = Deadline(0.01)
+    with pytest.raises(asyncio.TimeoutError):
+        await deadline.wait(forever())
+
+    assert cancelled.is_set()
+    assert deadline.remaining() == 0
+
+
+def test_partial_result_without_timestamp() -> None:
+    """기준 시각 없는 부분 결과는 병합/직렬화 후에도 기준 시각이 없음."""
+    partial = OldAccessKeyResult(old_access_keys=[], generated_at=None, complete=False)
+    done = OldAccessKeyResult(
+        old_access_keys=[],
+        generated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+    merged = OldAccessKeyResult.merge([done, partial])
+
+    assert merged.generated_at is None
+    assert merged.age is None
+    assert not merged.complete
+    restored = OldAccessKeyResult.loads(merged.dumps())
+    assert restored.generated_at is None
+    assert not restored.complete
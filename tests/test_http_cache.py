@@ -0,0 +1,40 @@
+from backend.web.api.iam.views import cache_headers, etag_matches, not_modified
+
+ETAG = 'W/"abc-10"'
+
+
+def test_cache_headers() -> None:
+    """ETag는 weak, max-age는 갱신 대상이 되기까지 남은 시간 (부분 결과는 no-store)."""
+    headers = cache_headers("abc-10", age=100, ttl=300)
+
+    assert headers["ETag"] == ETAG
+    assert headers["Cache-Control"] == "private, max-age=200"
+    assert cache_headers("abc-10", age=400, ttl=300)["Cache-Control"] == (
+        "private, max-age=0"
+    )
+    assert cache_headers(None, age=0, ttl=300) == {"Cache-Control": "no-store"}
+
+
+def test_etag_matches_weak_comparison() -> None:
+    """If-None-Match는 weak 비교 (W/ 유무 무시, 목록/와일드카드 지원)."""
+    assert etag_matches(ETAG, ETAG)
+    assert etag_matches('"abc-10"', ETAG)
+    assert etag_matches('"other", W/"abc-10"', ETAG)
+    assert etag_matches("*", ETAG)
+    assert not etag_matches('"abc-11"', ETAG)
+    assert not etag_matches(None, ETAG)
+
+
+def test_not_modified() -> None:
+    """ETag가 일치하면 캐시 헤더를 담은 본문 없는 304, 아니면 None."""
+    headers = cache_headers("abc-10", age=0, ttl=300)
+
+    response = not_modified(ETAG, headers, endpoint="list_users")
+
+    assert response is not None
+    assert response.status_code == 304
+    assert response.headers["ETag"] == ETAG
+    assert not response.body
+    assert not_modified('"abc-11"', headers, endpoint="list_users") is None
+    no_store = cache_headers(None, age=0, ttl=300)
+    assert not_modified("*", no_store, endpoint="list_users") is None
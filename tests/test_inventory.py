@@ -0,0 +1,149 @@
+import random
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import ujson
+
+from backend.services.iam.inventory import InventorySnapshot, KeyRecord, KeyTable
+
+GENERATED_AT = datetime(2024, 6, 1, tzinfo=timezone.utc)
+EPOCH = datetime.fromtimestamp(0, timezone.utc)
+
+
+def make_records(count: int, seed: int = 7) -> List[KeyRecord]:
+    """생성일이 겹치고 정렬되지 않은 액세스 키 레코드."""
+    rng = random.Random(seed)
+    return [
+        KeyRecord(
+            user_name=f"user-{rng.randrange(count // 3 + 1)}",
+            access_key_id=f"AKIA{i:016d}",
+            created_date=GENERATED_AT - timedelta(days=rng.randrange(30)),
+            status=rng.choice(["Active", "Inactive"]),
+        )
+        for i in range(count)
+    ]
+
+
+def make_snapshot(records: List[KeyRecord]) -> InventorySnapshot:
+    """레코드로 스냅샷 생성."""
+    table = KeyTable()
+    table.extend(records)
+    return InventorySnapshot(table, generated_at=GENERATED_AT)
+
+
+def naive_old_keys(records: List[KeyRecord], threshold: datetime) -> List[str]:
+    """전체 레코드를 훑어 임계값 이전에 생성된 키 ID를 생성일 순으로 반환."""
+    old = [r for r in records if r.created_date < threshold]
+    return [r.access_key_id for r in sorted(old, key=lambda r: r.created_date)]
+
+
+def test_old_keys_match_naive_filter() -> None:
+    """이진 탐색 결과는 모든 생성일 경계(같음/±1초/전체 앞뒤)에서 단순 필터와 같음."""
+    records = make_records(200)
+    snapshot = make_snapshot(records)
+    dates = sorted({r.created_date for r in records})
+    thresholds = [EPOCH, GENERATED_AT + timedelta(days=1)]
+    for date in dates:
+        thresholds += [date - timedelta(seconds=1), date, date + timedelta(seconds=1)]
+
+    for threshold in thresholds:
+        keys = snapshot.old_keys(threshold, "123456789012")
+        assert [k.access_key_id for k in keys] == naive_old_keys(records, threshold)
+        assert all(k.created_date < threshold for k in keys)
+        assert {k.account_id for k in keys} <= {"123456789012"}
+        assert snapshot.version(threshold).endswith(f"-{len(keys)}")
+
+
+def test_cutoff_equal_to_created_date_is_excluded() -> None:
+    """생성일이 임계 시각과 같은 키는 아직 오래된 키가 아님."""
+    records = make_records(3)
+    records = [
+        KeyRecord(r.user_name, r.access_key_id, EPOCH + timedelta(seconds=i), r.status)
+        for i, r in enumerate(records)
+    ]
+    snapshot = make_snapshot(records)
+
+    cutoff = EPOCH + timedelta(seconds=1)
+    assert [k.access_key_id for k in snapshot.old_keys(cutoff, None)] == [
+        records[0].access_key_id,
+    ]
+    # epoch 0에 생성된 키도 임계값보다 이전이면 포함
+    assert snapshot.old_keys(EPOCH, None) == []
+    assert len(snapshot.old_keys(EPOCH + timedelta(microseconds=1), None)) == 1
+
+
+def test_empty_table() -> None:
+    """빈 인벤토리는 어떤 임계값에도 빈 결과와 같은 버전."""
+    snapshot = make_snapshot([])
+
+    assert snapshot.old_keys(GENERATED_AT, None) == []
+    assert snapshot.version(EPOCH) == snapshot.version(GENERATED_AT)
+    assert snapshot.version(GENERATED_AT) == make_snapshot([]).version(GENERATED_AT)
+    assert InventorySnapshot.loads(0.0, snapshot.dumps()).snapshot_id == (
+        snapshot.snapshot_id
+    )
+
+
+def test_version_follows_result() -> None:
+    """버전은 키 목록이 같으면 같고, 키 수나 스냅샷 내용이 바뀌면 달라짐."""
+    records = make_records(50)
+    snapshot = make_snapshot(records)
+    shuffled = make_snapshot(list(reversed(records)))
+    dates = sorted({r.created_date for r in records})
+    early, later = dates[1], dates[-1]
+
+    # 같은 구간 안의 임계값은 같은 결과 → 같은 버전
+    assert snapshot.version(early + timedelta(milliseconds=100)) == (
+        snapshot.version(early + timedelta(milliseconds=900))
+    )
+    assert snapshot.version(early) != snapshot.version(later)
+    # 입력 순서와 관계없이 생성일 순으로 정렬된 같은 레코드를 보관
+    assert sorted(snapshot.table.rows()) == sorted(shuffled.table.rows())
+    assert list(shuffled.table.created) == list(snapshot.table.created)
+
+    rotated = records[:-1] + [
+        KeyRecord("user-new", "AKIANEW", records[-1].created_date, "Active"),
+    ]
+    assert make_snapshot(rotated).snapshot_id != snapshot.snapshot_id
+    assert make_snapshot(list(records)).version(later) == snapshot.version(later)
+
+
+def test_columns_round_trip() -> None:
+    """컬럼 직렬화/복원 후 레코드와 스냅샷 ID가 같고 유저 이름 문자열을 공유."""
+    records = make_records(100)
+    snapshot = make_snapshot(records)
+
+    restored = InventorySnapshot.loads(
+        GENERATED_AT.timestamp(), ujson.dumps(snapshot.table.columns()).encode()
+    )
+
+    assert restored.snapshot_id == snapshot.snapshot_id
+    assert restored.generated_at == GENERATED_AT
+    assert list(restored.table.rows()) == list(snapshot.table.rows())
+    table = restored.table
+    assert [table.record(i) for i in range(len(table))] == sorted(
+        records, key=lambda r: r.created_date
+    )
+    assert [table.key_id(i) for i in range(len(table))] == [
+        row[1] for row in table.rows()
+    ]
+    same_user = [i for i, u in enumerate(table.users) if u == table.users[0]]
+    assert all(table.users[i] is table.users[0] for i in same_user)
+
+
+def test_loads_legacy_rows() -> None:
+    """이전 버전 형식([유저, 키 ID, 생성일, 상태] 배열)도 복원."""
+    records = make_records(20)
+    snapshot = make_snapshot(records)
+    legacy = [
+        [user, key_id, float(created), status]
+        for user, key_id, created, status in snapshot.table.rows()
+    ]
+
+    restored = InventorySnapshot.loads(
+        GENERATED_AT.timestamp(), ujson.dumps(legacy).encode()
+    )
+
+    assert restored.snapshot_id == snapshot.snapshot_id
+    threshold = GENERATED_AT - timedelta(days=10)
+    assert restored.old_keys(threshold, None) == snapshot.old_keys(threshold, None)
@@ -0,0 +1,125 @@
+import asyncio
+from typing import Callable
+
+import pytest
+
+from backend.services.iam.jobs import (
+    JOB,
+    JOB_RESULT,
+    JobManager,
+    JobMethod,
+    JobSpec,
+    JobStatus,
+)
+from backend.services.iam.service import IAMService
+from backend.settings import settings
+from benchmarks.fake_iam import FakeIAMClient
+
+LIST_USERS = JobSpec(method=JobMethod.LIST_USERS, hours=1)
+
+# 이 임계값보다 오래된 가짜 키는 없음 (Credential Report 조회가 ListAccessKeys를 호출하지 않음)
+NO_OLD_KEYS = 24 * 365 * 100
+
+
+async def drained(manager: JobManager) -> None:
+    """접수된 작업이 모두 끝나고 저장될 때까지 대기."""
+    await asyncio.wait_for(manager._queue.join(), timeout=10)
+
+
+@pytest.mark.anyio
+async def test_submit_merges_same_spec(
+    make_worker: Callable[[], IAMService],
+) -> None:
+    """같은 조건의 대기 중 작업은 하나로 합치고, 조건이 다르면 새 작업."""
+    manager = JobManager(make_worker())
+
+    job = await manager.submit(LIST_USERS)
+
+    assert await manager.submit(JobSpec(method=JobMethod.LIST_USERS, hours=1)) is job
+    other = await manager.submit(JobSpec(method=JobMethod.LIST_USERS, hours=2))
+    assert other is not job
+    assert job.status is JobStatus.PENDING
+
+
+@pytest.mark.anyio
+async def test_aws_calls_counts_only_this_job(
+    make_worker: Callable[[], IAMService],
+    fake_iam: FakeIAMClient,
+) -> None:
+    """작업의 aws_calls는 같은 계정을 동시에 조회한 요청의 호출을 포함하지 않음."""
+    service = make_worker()
+    manager = JobManager(service)
+    manager.start()
+    try:
+        job = await manager.submit(LIST_USERS)
+        await asyncio.gather(
+            drained(manager),
+            service.get_old_access_keys_from_credential_report(hours=NO_OLD_KEYS),
+        )
+    finally:
+        await manager.stop()
+
+    assert job.status is JobStatus.SUCCEEDED
+    assert fake_iam.calls["get_credential_report"] == 1
+    assert job.aws_calls == fake_iam.calls["list_users"] + len(fake_iam.keys)
+
+
+@pytest.mark.anyio
+async def test_other_worker_reads_job_from_store(
+    make_worker: Callable[[], IAMService],
+) -> None:
+    """다른 워커가 접수한 작업의 상태/결과를 공유 저장소에서 조회."""
+    manager = JobManager(make_worker())
+    other = JobManager(make_worker())
+
+    job = await manager.submit(LIST_USERS)
+    pending = await other.get(job.id)
+    assert pending is not None
+    assert pending.status is JobStatus.PENDING
+
+    manager.start()
+    try:
+        await drained(manager)
+    finally:
+        await manager.stop()
+
+    stored = await other.get(job.id)
+    assert stored is not None
+    assert stored is not job
+    assert stored.status is JobStatus.SUCCEEDED
+    assert stored.aws_calls == job.aws_calls
+    assert stored.result_count == job.result_count
+    assert stored.progress.users_processed == job.progress.users_processed
+
+    result = await other.result(stored)
+    assert job.result is not None
+    assert result is not None
+    assert result.old_access_keys == job.result.old_access_keys
+    assert await other.get("unknown") is None
+
+
+@pytest.mark.anyio
+async def test_expired_jobs_are_purged(
+    monkeypatch: pytest.MonkeyPatch,
+    make_worker: Callable[[], IAMService],
+) -> None:
+    """IAM_JOB_TTL이 지난 작업은 조회되지 않고 다음 접수 때 저장소에서도 삭제."""
+    service = make_worker()
+    manager = JobManager(service)
+    manager.start()
+    try:
+        job = await manager.submit(LIST_USERS)
+        await drained(manager)
+    finally:
+        await manager.stop()
+    store = service.store
+    assert store is not None
+    assert store.load(JOB_RESULT, job.id) is not None
+
+    monkeypatch.setattr(settings, "iam_job_ttl", 0)
+    await asyncio.sleep(0.01)
+
+    assert await manager.get(job.id) is None
+    await manager.submit(JobSpec(method=JobMethod.LIST_USERS, hours=2))
+    assert store.load(JOB, job.id) is None
+    assert store.load(JOB_RESULT, job.id) is None
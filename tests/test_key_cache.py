@@ -0,0 +1,80 @@
+from datetime import datetime, timezone
+
+from backend.services.iam.key_cache import KeyIdCache
+
+CREATED = datetime(2021, 1, 1, tzinfo=timezone.utc)
+ROTATED = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+
+def epoch(value: datetime) -> int:
+    """datetime → epoch 초."""
+    return int(value.timestamp())
+
+
+def test_update_user_replaces_keys() -> None:
+    """유저의 키 목록을 교체하면 이전 키 항목은 사라짐."""
+    cache = KeyIdCache()
+    cache.update_user("alice", [(CREATED, "AKIA1")])
+
+    assert cache.get("alice", epoch(CREATED)) == "AKIA1"
+    assert cache.dirty
+
+    cache.update_user("alice", [(ROTATED, "AKIA2")])
+
+    assert cache.get("alice", epoch(CREATED)) is None
+    assert cache.get("alice", epoch(ROTATED)) == "AKIA2"
+    assert cache.get("bob", epoch(CREATED)) is None
+    assert len(cache) == 1
+
+
+def test_retain_drops_keys_missing_from_report() -> None:
+    """Credential Report에 없는 (유저, 생성일) 항목만 제거하고 변경 여부 표시."""
+    cache = KeyIdCache()
+    cache.update_user("alice", [(CREATED, "AKIA1"), (ROTATED, "AKIA2")])
+    cache.update_user("bob", [(CREATED, "AKIA3")])
+    cache.dirty = False
+
+    cache.retain(
+        [
+            ("alice", epoch(CREATED)),
+            ("alice", epoch(ROTATED)),
+            ("bob", epoch(CREATED)),
+            ("carol", epoch(CREATED)),
+        ],
+    )
+    assert not cache.dirty
+    assert len(cache) == 3
+
+    cache.retain([("alice", epoch(ROTATED))])
+    assert cache.dirty
+    assert len(cache) == 1
+    assert cache.get("alice", epoch(ROTATED)) == "AKIA2"
+    assert cache.get("bob", epoch(CREATED)) is None
+
+
+def test_merge_keeps_own_entries() -> None:
+    """다른 캐시에서는 이 캐시에 없는 유저만 가져옴."""
+    cache = KeyIdCache()
+    cache.update_user("alice", [(ROTATED, "AKIA2")])
+    other = KeyIdCache()
+    other.update_user("alice", [(CREATED, "AKIA1")])
+    other.update_user("bob", [(CREATED, "AKIA3")])
+
+    cache.merge(other)
+
+    assert cache.get("alice", epoch(ROTATED)) == "AKIA2"
+    assert cache.get("alice", epoch(CREATED)) is None
+    assert cache.get("bob", epoch(CREATED)) == "AKIA3"
+
+
+def test_dumps_loads_round_trip() -> None:
+    """직렬화 후 복원해도 같은 항목."""
+    cache = KeyIdCache()
+    cache.update_user("alice", [(CREATED, "AKIA1"), (ROTATED, "AKIA2")])
+
+    restored = KeyIdCache.loads(cache.dumps())
+
+    assert len(restored) == 2
+    assert restored.get("alice", epoch(CREATED)) == "AKIA1"
+    assert restored.get("alice", epoch(ROTATED)) == "AKIA2"
+    assert not restored.dirty
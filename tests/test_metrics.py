@@ -0,0 +1,83 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.metrics import MULTIPROC_DIR_ENV, enable_multiprocess, render
+
+ROOT = Path(__file__).resolve().parents[1]
+LIST_USERS = "/api/v1/iam/old-access-keys/list-users"
+
+# 워커 프로세스 하나에서 기록하는 메트릭
+WORKER = """
+from backend.services.iam.metrics import AWS_CALL_SECONDS, THROTTLES
+
+THROTTLES.labels(operation="list_users").inc(2)
+AWS_CALL_SECONDS.labels(operation="list_users").observe(0.2)
+"""
+
+
+def run_worker(directory: Path) -> None:
+    """multiprocess 모드 워커 프로세스 실행.
+
+    :param directory: 워커별 메트릭 파일 디렉토리
+    """
+    subprocess.run(
+        [sys.executable, "-c", WORKER],
+        check=True,
+        cwd=ROOT,
+        env={MULTIPROC_DIR_ENV: str(directory), "PATH": ""},
+    )
+
+
+def test_metrics_endpoint(client: TestClient) -> None:
+    """/metrics는 Prometheus text 형식으로 IAM/HTTP 메트릭을 응답."""
+    response = client.get(LIST_USERS, params={"hours": 1})
+    assert response.status_code == 200
+
+    response = client.get("/api/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert "# TYPE iam_aws_call_duration_seconds histogram" in body
+    assert "# TYPE iam_throttles_total counter" in body
+    assert 'iam_aws_call_duration_seconds_count{operation="list_users"}' in body
+    assert (
+        'http_request_duration_seconds_count{method="GET",'
+        'route="/v1/iam/old-access-keys/list-users",status="200"}'
+    ) in body
+
+
+def test_enable_multiprocess_clears_directory(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """이전 실행의 메트릭 파일을 지우고 환경 변수로 디렉토리를 넘김."""
+    monkeypatch.setenv(MULTIPROC_DIR_ENV, "")
+    directory = tmp_path / "metrics"
+    directory.mkdir()
+    (directory / "counter_1.db").write_bytes(b"stale")
+
+    enable_multiprocess(directory)
+
+    assert not list(directory.iterdir())
+    assert Path(os.environ[MULTIPROC_DIR_ENV]) == directory
+
+
+def test_render_sums_workers(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """multiprocess 모드에서는 모든 워커의 값을 합산."""
+    for _ in range(2):
+        run_worker(tmp_path)
+    monkeypatch.setenv(MULTIPROC_DIR_ENV, str(tmp_path))
+
+    body = render().decode()
+
+    assert 'iam_throttles_total{operation="list_users"} 4.0' in body
+    assert 'iam_aws_call_duration_seconds_count{operation="list_users"} 2.0' in body
+    assert (
+        'iam_aws_call_duration_seconds_bucket{le="0.25",operation="list_users"} 2.0'
+    ) in body
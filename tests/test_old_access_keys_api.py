@@ -0,0 +1,239 @@
+import asyncio
+from functools import partial
+from typing import Any, Callable, Dict, List
+
+import ujson
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.types import Message
+
+from benchmarks.fake_iam import FakeIAMClient
+
+LIST_USERS = "/api/v1/iam/old-access-keys/list-users"
+CREDENTIAL_REPORT = "/api/v1/iam/old-access-keys/credential-report"
+
+
+NDJSON = {"Accept": "application/x-ndjson"}
+
+
+def key_ids(body: Dict[str, Any]) -> List[str]:
+    """응답의 액세스 키 ID 목록."""
+    return [key["access_key_id"] for key in body["old_access_keys"]]
+
+
+def ndjson_keys(text: str) -> List[Dict[str, Any]]:
+    """NDJSON 응답의 액세스 키 목록 (한 줄에 하나)."""
+    return [ujson.loads(line) for line in text.splitlines()]
+
+
+async def request_then_disconnect(
+    app: FastAPI,
+    path: str,
+    query: str,
+    *,
+    until: Callable[[], bool],
+    method: str = "GET",
+) -> List[Message]:
+    """요청을 보내고 ``until``이 참이 되면 응답을 받기 전에 연결을 끊음.
+
+    TestClient는 응답이 끝난 뒤에만 ``http.disconnect``를 보내므로 ASGI 앱을 직접 호출한다.
+
+    :param app: ASGI 앱
+    :param path: 요청 경로
+    :param query: 쿼리 문자열
+    :param until: 연결을 끊을 조건
+    :param method: HTTP 메서드
+    :return: 앱이 보낸 ASGI 메시지
+    """
+    sent: List[Message] = []
+    requested = False
+
+    async def receive() -> Message:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        while not until():
+            await asyncio.sleep(0.001)
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [(b"host", b"testserver")],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    await app(scope, receive, send)
+    return sent
+
+
+def test_list_users(client: TestClient, fake_iam: FakeIAMClient) -> None:
+    """전체 인벤토리에서 오래된 키를 응답 (유저마다 ListAccessKeys 한 번)."""
+    response = client.get(LIST_USERS, params={"hours": 1})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["complete"]
+    assert key_ids(body)
+    assert fake_iam.calls["list_access_keys"] == len(fake_iam.keys)
+
+
+def test_list_users_pages(client: TestClient, fake_iam: FakeIAMClient) -> None:
+    """next_cursor를 따라가면 전체 응답과 같은 키를 AWS 재조회 없이 응답."""
+    expected = key_ids(client.get(LIST_USERS, params={"hours": 1}).json())
+    calls = sum(fake_iam.calls.values())
+
+    pages: List[List[str]] = []
+    params: Dict[str, Any] = {"hours": 1, "limit": 100}
+    while True:
+        response = client.get(LIST_USERS, params=params)
+        assert response.status_code == 200
+        body = response.json()
+        pages.append(key_ids(body))
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    assert len(pages) == -(-len(expected) // 100)
+    assert all(len(page) == 100 for page in pages[:-1])
+    assert [key for page in pages for key in page] == expected
+    assert sum(fake_iam.calls.values()) == calls
+
+
+def test_list_users_not_modified(client: TestClient) -> None:
+    """If-None-Match가 현재 ETag와 같으면 본문 없는 304."""
+    response = client.get(LIST_USERS, params={"hours": 1})
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    cached = client.get(
+        LIST_USERS,
+        params={"hours": 1},
+        headers={"If-None-Match": etag},
+    )
+
+    assert cached.status_code == 304
+    assert not cached.content
+    assert cached.headers["ETag"] == etag
+
+    # 임계값이 다르면 다른 버전
+    other = client.get(
+        LIST_USERS,
+        params={"hours": 24 * 365 * 20},
+        headers={"If-None-Match": etag},
+    )
+    assert other.status_code == 200
+    assert other.headers["ETag"] != etag
+
+
+def test_invalid_cursor(client: TestClient) -> None:
+    """해석할 수 없거나 다른 조회 조건의 커서는 400."""
+    response = client.get(LIST_USERS, params={"hours": 1, "cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+    first = client.get(LIST_USERS, params={"hours": 1, "limit": 10}).json()
+    response = client.get(
+        LIST_USERS,
+        params={"hours": 2, "limit": 10, "cursor": first["next_cursor"]},
+    )
+    assert response.status_code == 400
+
+
+def test_credential_report(client: TestClient, fake_iam: FakeIAMClient) -> None:
+    """Credential Report의 활성 키를 응답 (ListUsers 호출 없음)."""
+    expected = {
+        key.access_key_id
+        for keys in fake_iam.keys.values()
+        for key in keys
+        if key.active
+    }
+
+    response = client.post(CREDENTIAL_REPORT, params={"hours": 1})
+
+    assert response.status_code == 200
+    assert set(key_ids(response.json())) == expected
+    assert fake_iam.calls["list_users"] == 0
+    assert fake_iam.calls["get_credential_report"] == 1
+
+
+def test_credential_report_timeout(client: TestClient, fake_iam: FakeIAMClient) -> None:
+    """기한 안에 보고서를 받지 못하면 기준 시각 없는 빈 부분 결과."""
+    fake_iam.report_delay = 60
+
+    response = client.post(CREDENTIAL_REPORT, params={"hours": 1, "timeout": 0.2})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert not body["complete"]
+    assert not body["old_access_keys"]
+    assert body["generated_at"] is None
+    assert body["snapshot_age"] is None
+
+
+def test_list_users_ndjson(client: TestClient) -> None:
+    """Accept: application/x-ndjson이면 JSON 응답과 같은 키를 한 줄에 하나씩 스트리밍."""
+    expected = client.get(LIST_USERS, params={"hours": 1}).json()["old_access_keys"]
+
+    response = client.get(LIST_USERS, params={"hours": 1}, headers=NDJSON)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    keys = ndjson_keys(response.text)
+    key_id = "access_key_id"
+    assert sorted(keys, key=lambda k: k[key_id]) == sorted(
+        expected, key=lambda k: k[key_id]
+    )
+
+
+def test_credential_report_ndjson(client: TestClient, fake_iam: FakeIAMClient) -> None:
+    """Credential Report 경로도 NDJSON으로 스트리밍."""
+    expected = key_ids(client.post(CREDENTIAL_REPORT, params={"hours": 1}).json())
+
+    response = client.post(CREDENTIAL_REPORT, params={"hours": 1}, headers=NDJSON)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert sorted(k["access_key_id"] for k in ndjson_keys(response.text)) == sorted(
+        expected
+    )
+    assert fake_iam.calls["get_credential_report"] == 1
+
+
+def test_disconnect_cancels_request(
+    client: TestClient,
+    fastapi_app: FastAPI,
+    fake_iam: FakeIAMClient,
+) -> None:
+    """응답 전에 연결이 끊기면 조회를 취소하고 499 (접근 로그용)."""
+    fake_iam.latency = 0.01
+
+    portal = client.portal
+    assert portal is not None
+    sent = portal.call(
+        partial(
+            request_then_disconnect,
+            fastapi_app,
+            LIST_USERS,
+            "hours=1",
+            until=lambda: fake_iam.calls["list_access_keys"] > 0,
+        ),
+    )
+    calls = fake_iam.calls["list_access_keys"]
+    portal.call(asyncio.sleep, 0.1)
+
+    assert sent[0]["type"] == "http.response.start"
+    assert sent[0]["status"] == 499
+    assert 0 < calls < len(fake_iam.keys)
+    # 취소된 전체 조회는 더 이상 AWS를 호출하지 않음
+    assert fake_iam.calls["list_access_keys"] == calls
@@ -0,0 +1,128 @@
+import asyncio
+from contextlib import aclosing
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Set,
+    cast,
+)
+
+import pytest
+
+from backend.services.iam.pipeline import bounded_map, from_iterable, merge
+
+
+async def double(item: int) -> int:
+    """테스트용 ``fn`` (다른 태스크에 양보한 뒤 두 배 반환)."""
+    await asyncio.sleep(0)
+    return item * 2
+
+
+async def numbers() -> AsyncIterator[int]:
+    """끝나지 않는 입력."""
+    item = 0
+    while True:
+        yield item
+        item += 1
+
+
+def map_numbers(fn: Callable[[int], Awaitable[int]]) -> AsyncGenerator[int, None]:
+    """끝나지 않는 입력을 ``fn``으로 처리하는 파이프라인 (``aclosing``으로 닫음)."""
+    mapped = bounded_map(numbers(), fn, workers=4, queue_size=2)
+    return cast(AsyncGenerator[int, None], mapped)
+
+
+async def collect(items: AsyncIterator[int]) -> List[int]:
+    """async iterator의 항목을 모두 모음."""
+    return [item async for item in items]
+
+
+def new_tasks(before: "Set[asyncio.Task[Any]]") -> "Set[asyncio.Task[Any]]":
+    """``before`` 이후 생성되어 아직 끝나지 않은 태스크."""
+    return asyncio.all_tasks() - before
+
+
+@pytest.mark.anyio
+async def test_bounded_map_returns_every_result() -> None:
+    """모든 입력의 결과를 반환 (처리 완료 순서)."""
+    results = await collect(
+        bounded_map(from_iterable(range(100)), double, workers=4, queue_size=2),
+    )
+
+    assert sorted(results) == [i * 2 for i in range(100)]
+
+
+@pytest.mark.anyio
+async def test_bounded_map_raises_worker_error() -> None:
+    """worker의 예외는 호출자에게 다시 발생하고 남은 태스크는 정리."""
+
+    async def fail_on_three(item: int) -> int:
+        if item == 3:
+            raise ValueError("three")
+        return item
+
+    before = asyncio.all_tasks()
+    with pytest.raises(ValueError, match="three"):
+        await collect(
+            bounded_map(numbers(), fail_on_three, workers=2, queue_size=2),
+        )
+
+    assert not new_tasks(before)
+
+
+@pytest.mark.anyio
+async def test_bounded_map_cancels_workers_when_consumer_stops() -> None:
+    """호출자가 순회를 중단하면 producer/worker 태스크가 모두 취소."""
+    received: List[int] = []
+    before = asyncio.all_tasks()
+    async with aclosing(map_numbers(double)) as results:
+        async for result in results:
+            received.append(result)
+            if len(received) == 3:
+                break
+
+    assert len(received) == 3
+    assert not new_tasks(before)
+
+
+@pytest.mark.anyio
+async def test_bounded_map_cancels_workers_when_consumer_is_cancelled() -> None:
+    """호출자 태스크가 취소되어도 producer/worker 태스크가 모두 취소."""
+    started = asyncio.Event()
+
+    async def slow(item: int) -> int:
+        started.set()
+        await asyncio.sleep(10)
+        return item
+
+    async def consume() -> None:
+        async with aclosing(map_numbers(slow)) as results:
+            async for _ in results:
+                pass  # noqa: WPS420
+
+    before = asyncio.all_tasks()
+    consumer = asyncio.create_task(consume())
+    await started.wait()
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+
+    assert not new_tasks(before)
+
+
+@pytest.mark.anyio
+async def test_merge_reads_every_source() -> None:
+    """여러 입력의 항목을 모두 합침."""
+    results = await collect(
+        merge(
+            [from_iterable(range(10)), from_iterable(range(10, 20))],
+            concurrency=1,
+            queue_size=2,
+        ),
+    )
+
+    assert sorted(results) == list(range(20))
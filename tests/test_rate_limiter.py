@@ -0,0 +1,95 @@
+import pytest
+from botocore.exceptions import ClientError
+
+from backend.services.iam.rate_limiter import (
+    TokenBucket,
+    is_throttling_error,
+    max_concurrency,
+    worker_share,
+)
+from backend.settings import settings
+
+
+def bucket(rate: float = 10, burst: int = 1, **kwargs: float) -> TokenBucket:
+    """테스트용 토큰 버킷 (기본값: 초당 10개, 감소 비율 0.5)."""
+    options = {"min_rate": 1.0, "increase": 1.0, "decrease": 0.5, **kwargs}
+    return TokenBucket(rate, burst, **options)
+
+
+@pytest.mark.anyio
+async def test_acquire_waits_for_refill() -> None:
+    """누적 토큰을 다 쓰면 다음 토큰이 채워질 때까지 대기."""
+    limiter = bucket(rate=20, burst=2)
+
+    assert await limiter.acquire() < 0.01
+    assert await limiter.acquire() < 0.01
+    assert await limiter.acquire() >= 0.04
+
+
+def test_on_success_increases_rate_up_to_max_rate() -> None:
+    """성공하면 처리율이 가산 증가하고 ``max_rate``를 넘지 않음."""
+    limiter = bucket(rate=10, increase=10, max_rate=12)
+
+    limiter.on_success()
+    assert limiter.rate == pytest.approx(11)
+
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.rate == 12
+
+
+@pytest.mark.anyio
+async def test_on_throttle_halves_rate_once_per_cooldown() -> None:
+    """Throttling이면 처리율이 곱셈 감소하고, 연속된 Throttling은 한 번만 반영."""
+    limiter = bucket(rate=10, burst=5)
+
+    limiter.on_throttle()
+    limiter.on_throttle()
+
+    assert limiter.rate == 5
+    # 누적 토큰도 소진되어 바로 대기
+    assert await limiter.acquire() > 0.1
+
+
+def test_on_throttle_keeps_min_rate() -> None:
+    """감속해도 ``min_rate`` 아래로 내려가지 않음."""
+    limiter = bucket(rate=10, min_rate=8)
+
+    limiter.on_throttle()
+
+    assert limiter.rate == 8
+
+
+def test_observe_retry_counts_throttling_responses() -> None:
+    """botocore 내부 재시도의 Throttling 응답도 감속에 반영."""
+    limiter = bucket(rate=10)
+
+    limiter.observe_retry(response=(None, {"Error": {"Code": "AccessDenied"}}))
+    assert limiter.rate == 10
+
+    limiter.observe_retry(response=(None, {"Error": {"Code": "Throttling"}}))
+    assert limiter.rate == 5
+
+
+def test_is_throttling_error() -> None:
+    """Throttling 에러 코드의 ClientError만 Throttling으로 판단."""
+
+    def error(code: str) -> ClientError:
+        return ClientError({"Error": {"Code": code}}, "ListUsers")
+
+    assert is_throttling_error(error("Throttling"))
+    assert is_throttling_error(error("ThrottlingException"))
+    assert not is_throttling_error(error("AccessDenied"))
+    assert not is_throttling_error(RuntimeError("Throttling"))
+
+
+def test_budget_is_split_across_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """계정 단위 예산을 워커 수로 나누고, 동시성은 최소 1."""
+    monkeypatch.setattr(settings, "workers_count", 4)
+    monkeypatch.setattr(settings, "iam_max_concurrency", 10)
+
+    assert worker_share(100) == 25
+    assert max_concurrency() == 2
+
+    monkeypatch.setattr(settings, "iam_max_concurrency", 2)
+    assert max_concurrency() == 1
@@ -0,0 +1,105 @@
+from datetime import datetime, timezone
+
+from backend.services.iam.report_parser import parse_credential_report, parse_epoch
+
+HEADER = (
+    b"user,arn,user_creation_time,password_enabled,password_last_used,"
+    b"password_last_changed,password_next_rotation,mfa_active,"
+    b"access_key_1_active,access_key_1_last_rotated,access_key_1_last_used_date,"
+    b"access_key_1_last_used_region,access_key_1_last_used_service,"
+    b"access_key_2_active,access_key_2_last_rotated,access_key_2_last_used_date,"
+    b"access_key_2_last_used_region,access_key_2_last_used_service,"
+    b"cert_1_active,cert_1_last_rotated,cert_2_active,cert_2_last_rotated"
+)
+
+CREATED = b"2020-01-01T00:00:00+00:00"
+PASSWORD = b"not_supported,N/A,N/A,N/A,false"
+CERTS = b"false,N/A,false,N/A"
+
+
+def row(user: bytes, key_1: bytes, key_2: bytes, arn: bytes = b"") -> bytes:
+    """Credential Report 한 행 (키 슬롯은 ``active,last_rotated``)."""
+    arn = arn or b"arn:aws:iam::123456789012:user/" + user
+    return b",".join(
+        [
+            user,
+            arn,
+            CREATED,
+            PASSWORD,
+            key_1 + b",N/A,N/A,N/A",
+            key_2 + b",N/A,N/A,N/A",
+            CERTS,
+        ],
+    )
+
+
+def epoch(value: str) -> int:
+    """ISO 시각 → epoch 초."""
+    return int(datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp())
+
+
+def test_parse_epoch() -> None:
+    """``Z``/``+00:00`` 접미사를 UTC로 해석하고 N/A는 None."""
+    expected = epoch("2024-03-01T12:34:56")
+
+    assert parse_epoch(b"2024-03-01T12:34:56+00:00") == expected
+    assert parse_epoch(b"2024-03-01T12:34:56Z") == expected
+    assert parse_epoch(b"N/A") is None
+    assert parse_epoch(b"") is None
+
+
+def test_parse_active_keys_only() -> None:
+    """활성화되고 last_rotated가 있는 키만 추출 (루트 계정 제외)."""
+    content = b"\n".join(
+        [
+            HEADER,
+            row(
+                b"<root_account>",
+                b"true,2019-01-01T00:00:00+00:00",
+                b"false,N/A",
+            ),
+            row(
+                b"alice",
+                b"true,2021-01-01T00:00:00+00:00",
+                b"true,2022-06-01T08:00:00+00:00",
+            ),
+            row(b"bob", b"false,2021-01-01T00:00:00+00:00", b"true,N/A"),
+            row(b"carol", b"false,N/A", b"true,2023-02-03T04:05:06+00:00"),
+            b"",
+        ],
+    )
+
+    keys = parse_credential_report(content)
+
+    assert list(keys) == [
+        ("alice", epoch("2021-01-01T00:00:00")),
+        ("alice", epoch("2022-06-01T08:00:00")),
+        ("carol", epoch("2023-02-03T04:05:06")),
+    ]
+    # 같은 유저의 키는 같은 문자열 객체를 공유
+    assert keys.users[0] is keys.users[1]
+
+
+def test_parse_quoted_line() -> None:
+    """따옴표가 포함된 행은 csv 모듈로 분리."""
+    content = b"\n".join(
+        [
+            HEADER,
+            row(
+                b"dave",
+                b"true,2021-01-01T00:00:00+00:00",
+                b"false,N/A",
+                arn=b'"arn:aws:iam::123456789012:user/a,b/dave"',
+            ),
+        ],
+    )
+
+    assert list(parse_credential_report(content)) == [
+        ("dave", epoch("2021-01-01T00:00:00")),
+    ]
+
+
+def test_parse_empty_report() -> None:
+    """빈 보고서/헤더만 있는 보고서는 빈 결과."""
+    assert not len(parse_credential_report(b""))
+    assert not len(parse_credential_report(HEADER + b"\n"))
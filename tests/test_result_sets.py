@@ -0,0 +1,75 @@
+import base64
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.services.iam.inventory import OldAccessKeyResult, OldKey
+from backend.services.iam.result_sets import Cursor, InvalidCursorError, ResultSetCache
+from backend.settings import settings
+
+
+def result(count: int = 3) -> OldAccessKeyResult:
+    """테스트용 조회 결과."""
+    created = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    return OldAccessKeyResult(
+        old_access_keys=[
+            OldKey(None, f"user-{i}", f"AKIA{i}", created) for i in range(count)
+        ],
+        generated_at=datetime.now(timezone.utc),
+    )
+
+
+def test_cursor_round_trip() -> None:
+    """커서 토큰을 해석하면 같은 커서 (패딩 없는 base64url)."""
+    cursor = Cursor("0123abcd", 1000)
+    token = cursor.encode()
+
+    assert "=" not in token
+    assert Cursor.decode(token) == cursor
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "",
+        "not base64!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        base64.urlsafe_b64encode(b'["set"]').decode(),
+        base64.urlsafe_b64encode(b"[1, 2]").decode(),
+        base64.urlsafe_b64encode(b'["set", -1]').decode(),
+        base64.urlsafe_b64encode(b'["set", "10"]').decode(),
+    ],
+)
+def test_cursor_decode_rejects_invalid_token(token: str) -> None:
+    """해석할 수 없는 토큰은 InvalidCursorError."""
+    with pytest.raises(InvalidCursorError):
+        Cursor.decode(token)
+
+
+@pytest.mark.anyio
+async def test_result_set_cache_returns_stored_result() -> None:
+    """보관한 결과는 같은 조회 조건으로만 조회."""
+    cache = ResultSetCache()
+    stored = result()
+    set_id = await cache.put("list_users|1|", stored)
+
+    assert await cache.get(set_id, "list_users|1|") is stored
+    assert await cache.get("unknown", "list_users|1|") is None
+    with pytest.raises(InvalidCursorError):
+        await cache.get(set_id, "list_users|2|")
+
+
+@pytest.mark.anyio
+async def test_result_set_cache_expires_and_evicts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """최대 개수를 넘으면 오래된 것부터 제거하고, TTL이 지나면 만료."""
+    monkeypatch.setattr(settings, "iam_result_set_max", 2)
+    cache = ResultSetCache()
+    set_ids = [await cache.put("q", result()) for _ in range(3)]
+
+    assert await cache.get(set_ids[0], "q") is None
+    assert await cache.get(set_ids[2], "q") is not None
+
+    monkeypatch.setattr(settings, "iam_result_set_ttl", -1)
+    assert await cache.get(set_ids[2], "q") is None
@@ -0,0 +1,80 @@
+import asyncio
+from typing import Callable, List, cast
+
+import pytest
+
+from backend.services.iam.scheduler import RefreshScheduler
+from backend.services.iam.service import IAMService
+from backend.settings import settings
+from benchmarks.fake_iam import FakeIAMClient
+
+# 이 임계값보다 오래된 가짜 키는 없음 (Credential Report 조회가 ListAccessKeys를 호출하지 않음)
+NO_OLD_KEYS = 24 * 365 * 100
+
+
+class StubService:
+    """``revalidate`` 호출만 기록하는 서비스 (첫 호출은 실패)."""
+
+    def __init__(self) -> None:
+        self.aheads: List[float] = []
+
+    async def revalidate(self, *, ahead: float = 0) -> None:
+        """호출 기록."""
+        self.aheads.append(ahead)
+        if len(self.aheads) == 1:
+            raise RuntimeError("refresh failed")
+
+
+@pytest.mark.anyio
+async def test_scheduler_repeats_after_failure() -> None:
+    """즉시 한 번 갱신하고 실패해도 주기마다 다음 실행 전 만료분까지 미리 갱신."""
+    service = StubService()
+    scheduler = RefreshScheduler(
+        cast(IAMService, service),
+        interval=0.01,
+        jitter=0.5,
+    )
+
+    scheduler.start()
+    scheduler.start()
+    await asyncio.sleep(0.1)
+    await scheduler.stop()
+    runs = len(service.aheads)
+    await asyncio.sleep(0.05)
+
+    assert runs >= 3
+    assert len(service.aheads) == runs
+    assert all(ahead == pytest.approx(0.015) for ahead in service.aheads)
+    delays = [scheduler._delay() for _ in range(100)]
+    assert all(0.005 <= delay <= 0.015 for delay in delays)
+
+
+@pytest.mark.anyio
+async def test_revalidate_refreshes_ahead_of_expiry(
+    monkeypatch: pytest.MonkeyPatch,
+    make_worker: Callable[[], IAMService],
+    fake_iam: FakeIAMClient,
+) -> None:
+    """TTL이 ``ahead``초 안에 지나는 스냅샷만 미리 갱신."""
+    service = make_worker()
+    await service.get_old_access_keys_from_list_users(hours=1)
+    await service.get_old_access_keys_from_credential_report(hours=NO_OLD_KEYS)
+    account = service.accounts[0]
+    inventory, report = account._inventory, account._report
+    calls = fake_iam.calls.copy()
+
+    # 다음 실행 전에 만료되지 않음 → 조회 없음
+    await service.revalidate(ahead=60)
+    assert fake_iam.calls == calls
+    assert account._inventory is inventory
+    assert account._report is report
+
+    # TTL까지 남은 시간이 ahead보다 짧음 → 만료 전에 갱신
+    monkeypatch.setattr(settings, "inventory_ttl", 30)
+    monkeypatch.setattr(settings, "credential_report_ttl", 30)
+    await service.revalidate(ahead=60)
+
+    assert fake_iam.calls["list_users"] == 2 * calls["list_users"]
+    assert fake_iam.calls["get_credential_report"] == 2
+    assert account._inventory is not inventory
+    assert account._report is not report
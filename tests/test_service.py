@@ -0,0 +1,175 @@
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Set, cast
+
+import pytest
+
+from backend.services.iam.inventory import OldKey
+from backend.services.iam.sdk import LazySession
+from backend.services.iam.service import IAMService, assume_role_session
+from backend.settings import settings
+from benchmarks.fake_iam import FakeIAMClient
+
+ACCOUNTS = ("111111111111", "222222222222")
+
+
+class TrackedIAMClient(FakeIAMClient):
+    """호출 중인 계정 수의 최댓값을 기록하는 가짜 IAM 클라이언트."""
+
+    def __init__(self, account_id: str, busy: "Counter[str]", peak: List[int]) -> None:
+        super().__init__(50, latency=0.001, seed=int(account_id[0]))
+        self.account_id = account_id
+        self.busy = busy
+        self.peak = peak
+
+    async def _request(self, operation: str) -> None:
+        self.busy[self.account_id] += 1
+        self.peak[0] = max(self.peak[0], sum(1 for n in self.busy.values() if n))
+        try:
+            await super()._request(operation)
+        finally:
+            self.busy[self.account_id] -= 1
+
+
+@pytest.fixture
+def accounts(monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    """두 계정 role을 설정하고 동시에 호출 중이던 계정 수의 최댓값을 반환할 리스트.
+
+    :param monkeypatch: pytest monkeypatch
+    :return: [동시에 호출 중이던 계정 수의 최댓값]
+    """
+    monkeypatch.setattr(
+        settings,
+        "iam_role_arns",
+        ",".join(f"arn:aws:iam::{a}:role/audit" for a in ACCOUNTS),
+    )
+    monkeypatch.setattr(settings, "snapshot_store", False)
+    monkeypatch.setattr(settings, "iam_rate_limit", 1_000_000)
+    monkeypatch.setattr(settings, "iam_rate_burst", 1_000_000)
+    return [0]
+
+
+def use_tracked_clients(service: IAMService, peak: List[int]) -> Dict[str, Any]:
+    """계정마다 다른 가짜 클라이언트 연결.
+
+    :param service: IAMService
+    :param peak: 동시에 호출 중이던 계정 수의 최댓값을 기록할 리스트
+    :return: 계정 ID → 가짜 클라이언트
+    """
+    busy: "Counter[str]" = Counter()
+    clients = {}
+    for account in service.accounts:
+        assert account.account_id is not None
+        client = TrackedIAMClient(account.account_id, busy, peak)
+        account._client = clients[account.account_id] = client
+    return clients
+
+
+def all_key_ids(client: FakeIAMClient) -> Set[str]:
+    """가짜 계정의 모든 키 ID (ListUsers 경로는 상태와 무관하게 반환)."""
+    return {key.access_key_id for keys in client.keys.values() for key in keys}
+
+
+async def collect(service: IAMService, accounts: Any = None) -> List[OldKey]:
+    """ListUsers 경로 스트리밍 결과."""
+    keys = service.iter_old_access_keys_from_list_users(hours=1, accounts=accounts)
+    return [key async for key in keys]
+
+
+@pytest.mark.anyio
+async def test_stream_merges_every_account(accounts: List[int]) -> None:
+    """여러 계정의 스트림을 계정 ID와 함께 모두 합침."""
+    service = IAMService()
+    clients = use_tracked_clients(service, accounts)
+    try:
+        keys = await collect(service)
+    finally:
+        await service.close()
+
+    for account_id, client in clients.items():
+        found = {k.access_key_id for k in keys if k.account_id == account_id}
+        assert found == all_key_ids(client)
+    assert len(keys) == sum(len(all_key_ids(c)) for c in clients.values())
+
+
+@pytest.mark.anyio
+async def test_streams_share_account_limit(
+    monkeypatch: pytest.MonkeyPatch,
+    accounts: List[int],
+) -> None:
+    """다른 요청의 스트림도 IAM_ACCOUNT_CONCURRENCY개 계정까지만 동시에 조회."""
+    monkeypatch.setattr(settings, "iam_account_concurrency", 1)
+    service = IAMService()
+    use_tracked_clients(service, accounts)
+    try:
+        results = await asyncio.gather(
+            *(collect(service, [account_id]) for account_id in ACCOUNTS),
+        )
+    finally:
+        await service.close()
+
+    assert all(results)
+    assert accounts[0] == 1
+
+
+class StubSTS:
+    """AssumeRole만 흉내 내는 STS 클라이언트."""
+
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    async def __aenter__(self) -> "StubSTS":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """클라이언트 종료."""
+
+    async def assume_role(self, **kwargs: Any) -> Dict[str, Any]:
+        """임시 자격 증명 발급."""
+        self.calls.append(kwargs)
+        return {
+            "Credentials": {
+                "AccessKeyId": "ASIAEXAMPLE",
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": datetime.now(timezone.utc) + timedelta(hours=1),
+            },
+        }
+
+
+class StubBaseSession:
+    """STS 클라이언트만 바꾼 기본 세션."""
+
+    def __init__(self) -> None:
+        self.sts = StubSTS()
+        self._session = LazySession()
+
+    def client(self, service_name: str, **kwargs: Any) -> StubSTS:
+        """STS 클라이언트."""
+        return self.sts
+
+    def data_loader(self) -> Any:
+        """실제 botocore 데이터 로더."""
+        return self._session.data_loader()
+
+
+@pytest.mark.anyio
+async def test_assume_role_session_credentials() -> None:
+    """role 세션은 처음 사용할 때 AssumeRole로 자격 증명을 발급."""
+    base = StubBaseSession()
+    session = assume_role_session(
+        cast(LazySession, base),
+        "arn:aws:iam::111111111111:role/audit",
+    ).get()
+
+    credentials = await session.get_credentials()
+    assert not base.sts.calls
+    frozen = await credentials.get_frozen_credentials()
+
+    assert credentials.method == "sts-assume-role"
+    assert frozen.access_key == "ASIAEXAMPLE"
+    assert frozen.token == "token"
+    assert [call["RoleArn"] for call in base.sts.calls] == [
+        "arn:aws:iam::111111111111:role/audit",
+    ]
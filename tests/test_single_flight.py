@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from backend.services.iam.single_flight import SingleFlight
+
+
+@pytest.mark.anyio
+async def test_concurrent_calls_share_one_execution() -> None:
+    """같은 키의 동시 호출은 한 번만 실행하고 결과를 공유."""
+    flight: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(10)))
+
+    assert results == [1] * 10
+    assert not flight.running("key")
+
+    # 완료된 뒤의 호출은 새로 실행
+    assert await flight.do("key", fetch) == 2
+
+
+@pytest.mark.anyio
+async def test_different_keys_run_separately() -> None:
+    """키가 다르면 따로 실행."""
+    flight: SingleFlight[str] = SingleFlight()
+
+    async def echo(value: str) -> str:
+        await asyncio.sleep(0)
+        return value
+
+    results = await asyncio.gather(
+        flight.do("a", lambda: echo("a")),
+        flight.do("b", lambda: echo("b")),
+    )
+
+    assert list(results) == ["a", "b"]
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_does_not_cancel_execution() -> None:
+    """대기자가 취소되어도 실행은 계속되고 다른 대기자는 결과를 받음."""
+    flight: SingleFlight[str] = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(flight.do("key", fetch))
+    second = asyncio.create_task(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+
+    assert flight.running("key")
+    release.set()
+    assert await second == "done"
+    assert first.cancelled()
+
+
+@pytest.mark.anyio
+async def test_error_is_raised_to_every_waiter() -> None:
+    """실행이 실패하면 모든 대기자에게 같은 예외가 발생하고 다음 호출은 다시 실행."""
+    flight: SingleFlight[int] = SingleFlight()
+
+    async def fail() -> int:
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        flight.do("key", fail),
+        flight.do("key", fail),
+        return_exceptions=True,
+    )
+
+    assert [str(r) for r in results] == ["boom", "boom"]
+    assert not flight.running("key")
@@ -0,0 +1,122 @@
+import asyncio
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from backend.services.iam.account import CREDENTIAL_REPORT, INVENTORY
+from backend.services.iam.service import IAMService
+from backend.services.iam.snapshot_store import SnapshotStore
+from backend.settings import settings
+from benchmarks.fake_iam import FakeIAMClient
+
+# 이 임계값보다 오래된 가짜 키는 없음 (Credential Report 조회가 ListAccessKeys를 호출하지 않음)
+NO_OLD_KEYS = 24 * 365 * 100
+
+
+def test_store_keeps_newest_snapshot(tmp_path: Path) -> None:
+    """(종류, 계정)별 최신 스냅샷만 보관하고 더 오래된 스냅샷으로 덮어쓰지 않음."""
+    store = SnapshotStore(tmp_path)
+    assert store.load(INVENTORY, "a") is None
+
+    store.save(INVENTORY, "a", 200.0, b"new")
+    store.save(INVENTORY, "a", 100.0, b"old")
+    store.save(INVENTORY, "b", 50.0, b"other")
+
+    assert store.load(INVENTORY, "a") == (200.0, b"new")
+    assert store.load(INVENTORY, "a", newer_than=199.0) == (200.0, b"new")
+    assert store.load(INVENTORY, "a", newer_than=200.0) is None
+    assert store.load(CREDENTIAL_REPORT, "a") is None
+    # 다른 프로세스가 연 저장소에서도 같은 스냅샷 조회
+    assert SnapshotStore(tmp_path).load(INVENTORY, "b") == (50.0, b"other")
+
+    assert store.purge(INVENTORY, older_than=100.0) == 1
+    assert store.load(INVENTORY, "b") is None
+    assert store.load(INVENTORY, "a") == (200.0, b"new")
+
+
+def test_refresh_lock_is_exclusive(tmp_path: Path) -> None:
+    """갱신 락은 (종류, 계정)별로 한 번에 하나만 획득."""
+    store = SnapshotStore(tmp_path)
+
+    lock = store.try_lock(INVENTORY, "a")
+    assert lock is not None
+    assert SnapshotStore(tmp_path).try_lock(INVENTORY, "a") is None
+    other = store.try_lock(CREDENTIAL_REPORT, "a")
+    assert other is not None
+
+    lock.release()
+    lock.release()
+    again = store.try_lock(INVENTORY, "a")
+    assert again is not None
+    again.release()
+    other.release()
+
+
+@pytest.mark.anyio
+async def test_one_worker_refreshes(
+    monkeypatch: pytest.MonkeyPatch,
+    make_worker: Callable[[], IAMService],
+    fake_iam: FakeIAMClient,
+) -> None:
+    """동시에 요청받은 두 워커 중 하나만 AWS를 조회하고 나머지는 저장된 스냅샷 사용."""
+    monkeypatch.setattr(settings, "snapshot_poll_interval", 0.01)
+    fake_iam.latency = 0.001
+    fake_iam.report_delay = 0.05
+    workers = [make_worker(), make_worker()]
+
+    inventories = await asyncio.gather(
+        *(w.get_old_access_keys_from_list_users(hours=1) for w in workers),
+    )
+    list_users_calls = fake_iam.calls["list_users"]
+    reports = await asyncio.gather(
+        *(
+            w.get_old_access_keys_from_credential_report(hours=NO_OLD_KEYS)
+            for w in workers
+        ),
+    )
+
+    assert inventories[0].old_access_keys == inventories[1].old_access_keys
+    assert inventories[0].generated_at == inventories[1].generated_at
+    assert list_users_calls == fake_iam.calls["list_users"] > 0
+    assert fake_iam.calls["list_access_keys"] == len(fake_iam.keys)
+    assert reports[0].generated_at == reports[1].generated_at
+    assert fake_iam.calls["get_credential_report"] == 1
+
+
+@pytest.mark.anyio
+async def test_restarted_worker_restores_snapshots(
+    monkeypatch: pytest.MonkeyPatch,
+    make_worker: Callable[[], IAMService],
+    fake_iam: FakeIAMClient,
+) -> None:
+    """재시작한 워커는 저장된 스냅샷으로 바로 응답하고, 만료된 보고서는 백그라운드에서 갱신."""
+    first = make_worker()
+    inventory = await first.get_old_access_keys_from_list_users(hours=1)
+    report = await first.get_old_access_keys_from_credential_report(hours=NO_OLD_KEYS)
+    await first.close()
+    calls = fake_iam.calls.copy()
+
+    restarted = make_worker()
+    await restarted.restore()
+    account = restarted.accounts[0]
+    assert account._inventory is not None
+    assert account._report is not None
+
+    restored = await restarted.get_old_access_keys_from_list_users(hours=1)
+    assert restored.old_access_keys == inventory.old_access_keys
+    assert restored.generated_at == inventory.generated_at
+    assert fake_iam.calls == calls
+
+    # 만료된 복원 보고서도 기다리지 않고 응답한 뒤 백그라운드에서 다시 받아옴
+    monkeypatch.setattr(settings, "credential_report_ttl", 0)
+    stale = await restarted.get_old_access_keys_from_credential_report(
+        hours=NO_OLD_KEYS,
+    )
+    assert stale.generated_at == report.generated_at
+    assert fake_iam.calls == calls
+
+    assert account._tasks
+    await asyncio.wait_for(asyncio.gather(*account._tasks), timeout=5)
+    assert not account._report_restored
+    assert fake_iam.calls["get_credential_report"] == calls["get_credential_report"] + 1